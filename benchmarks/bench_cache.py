@@ -0,0 +1,111 @@
+"""Mixed get/put throughput of LRUCache and LFUCache against OrderedDict based caches.
+
+Run with `python benchmarks/bench_cache.py`.
+"""
+from collections import OrderedDict
+import random
+import time
+
+from data_structures.linked_list import LRUCache, LFUCache
+
+OPERATIONS = 200000
+KEY_SPACE = 4096
+GET_RATIO = 0.8
+
+
+class OrderedDictLRU:
+    """The usual recipe: an OrderedDict kept in recency order with move_to_end."""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+
+    def get(self, key, default=None):
+        try:
+            self._data.move_to_end(key)
+        except KeyError:
+            return default
+        return self._data[key]
+
+    def put(self, key, value):
+        self._data[key] = value
+        self._data.move_to_end(key)
+        if len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+
+class OrderedDictLFU:
+    """An LFU cache with one OrderedDict of keys per use count and a tracked minimum count."""
+    def __init__(self, maxsize):
+        self.maxsize = maxsize
+        self._values = {}
+        self._counts = {}
+        self._buckets = {}
+        self._min_count = 0
+
+    def _touch(self, key):
+        count = self._counts[key]
+        bucket = self._buckets[count]
+        del bucket[key]
+        if not bucket:
+            del self._buckets[count]
+            if self._min_count == count:
+                self._min_count += 1
+        self._counts[key] = count + 1
+        self._buckets.setdefault(count + 1, OrderedDict())[key] = None
+
+    def get(self, key, default=None):
+        if key not in self._values:
+            return default
+        self._touch(key)
+        return self._values[key]
+
+    def put(self, key, value):
+        if key in self._values:
+            self._values[key] = value
+            self._touch(key)
+            return
+        if len(self._values) >= self.maxsize:
+            bucket = self._buckets[self._min_count]
+            victim, _ = bucket.popitem(last=False)
+            if not bucket:
+                del self._buckets[self._min_count]
+            del self._values[victim]
+            del self._counts[victim]
+        self._values[key] = value
+        self._counts[key] = 1
+        self._buckets.setdefault(1, OrderedDict())[key] = None
+        self._min_count = 1
+
+
+def workload(seed=0):
+    rng = random.Random(seed)
+    # A skewed key distribution, so that some keys are hot and the eviction policy matters.
+    keys = [int(rng.paretovariate(1.2)) % KEY_SPACE for _ in range(OPERATIONS)]
+    gets = [rng.random() < GET_RATIO for _ in range(OPERATIONS)]
+    return list(zip(keys, gets))
+
+
+def run(cache, operations):
+    get, put = cache.get, cache.put
+    start = time.perf_counter()
+    for key, is_get in operations:
+        if is_get:
+            if get(key) is None:
+                put(key, key)
+        else:
+            put(key, key)
+    return len(operations) / (time.perf_counter() - start)
+
+
+def main():
+    operations = workload()
+    print("{:>8} {:>18} {:>18} {:>18} {:>18}".format(
+        'maxsize', 'OrderedDict LRU', 'LRUCache', 'OrderedDict LFU', 'LFUCache'))
+    for maxsize in [64, 512, 4096]:
+        rates = [run(cache_type(maxsize), operations)
+                 for cache_type in (OrderedDictLRU, LRUCache, OrderedDictLFU, LFUCache)]
+        print("{:>8} {:>18,.0f} {:>18,.0f} {:>18,.0f} {:>18,.0f}".format(maxsize, *rates))
+
+
+if __name__ == '__main__':
+    main()
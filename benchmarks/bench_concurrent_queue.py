@@ -0,0 +1,69 @@
+"""Producer/consumer throughput of ConcurrentLinkedQueue against queue.Queue.
+
+Run with `python benchmarks/bench_concurrent_queue.py`.
+"""
+import queue
+import threading
+import time
+
+from data_structures.linked_list import ConcurrentLinkedQueue
+
+ITEMS_PER_PRODUCER = 20000
+BATCH = 100
+_DONE = object()
+
+
+def run(make_queue, producers, consumers, batched):
+    q = make_queue()
+    barrier = threading.Barrier(producers + consumers + 1)
+
+    def produce():
+        barrier.wait()
+        if batched:
+            for start in range(0, ITEMS_PER_PRODUCER, BATCH):
+                q.put_many(range(start, start + BATCH))
+        else:
+            for i in range(ITEMS_PER_PRODUCER):
+                q.put(i)
+
+    def consume():
+        barrier.wait()
+        while True:
+            if batched:
+                finished = q.get_many(BATCH).count(_DONE)
+                if finished:
+                    # Hand back any sentinels meant for the other consumers.
+                    q.put_many([_DONE] * (finished - 1))
+                    return
+            elif q.get() is _DONE:
+                return
+
+    threads = [threading.Thread(target=produce) for _ in range(producers)]
+    threads += [threading.Thread(target=consume) for _ in range(consumers)]
+    for thread in threads:
+        thread.start()
+    barrier.wait()
+    start = time.perf_counter()
+    for thread in threads[:producers]:
+        thread.join()
+    for _ in range(consumers):
+        q.put(_DONE)
+    for thread in threads[producers:]:
+        thread.join()
+    elapsed = time.perf_counter() - start
+    return producers * ITEMS_PER_PRODUCER / elapsed
+
+
+def main():
+    print("{:>10} {:>10} {:>22} {:>22} {:>22}".format(
+        'producers', 'consumers', 'queue.Queue items/s', 'ConcurrentLinkedQueue', 'batched put/get_many'))
+    for producers, consumers in [(1, 1), (2, 2), (4, 4), (4, 1), (1, 4)]:
+        baseline = run(queue.Queue, producers, consumers, batched=False)
+        linked = run(ConcurrentLinkedQueue, producers, consumers, batched=False)
+        batched = run(ConcurrentLinkedQueue, producers, consumers, batched=True)
+        print("{:>10} {:>10} {:>22,.0f} {:>22,.0f} {:>22,.0f}".format(
+            producers, consumers, baseline, linked, batched))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,81 @@
+"""Timings of the LinkedList sort strategies by list size, to locate the crossovers used by sorted('auto').
+
+Run with `python benchmarks/bench_sort.py`.
+"""
+import random
+import time
+
+from data_structures.linked_list import LinkedList
+from data_structures.linked_list.linked_list import _counting_sorted
+
+
+def builtin_sort(ll):
+    values = list(ll)
+    values.sort()
+    ll._rewrite_values(values)
+
+
+def counting_sort(ll):
+    counted = _counting_sorted(list(ll))
+    if counted is None:
+        raise NotApplicable
+    ll._rewrite_values(counted)
+
+
+class NotApplicable(Exception):
+    pass
+
+
+STRATEGIES = [
+    ('insertion', lambda ll: ll.sorted('insertion_sort')),
+    ('merge', lambda ll: ll.sorted('merge_sort')),
+    ('natural', lambda ll: ll.sorted('natural')),
+    ('builtin', builtin_sort),
+    ('counting', counting_sort),
+    ('auto', lambda ll: ll.sorted('auto')),
+]
+
+
+def time_strategy(sort, values):
+    """Returns the best time, in microseconds, of several sorts of fresh copies of the values."""
+    best = float('inf')
+    for _ in range(max(5, 20000 // len(values))):
+        ll = LinkedList(values)
+        start = time.perf_counter()
+        sort(ll)
+        best = min(best, time.perf_counter() - start)
+    return best * 1e6
+
+
+def report(title, make_values, sizes, strategies):
+    print(title)
+    print("{:>8}".format('size') + ''.join("{:>12}".format(name) for name, _ in strategies) + '   (us per sort)')
+    for size in sizes:
+        values = make_values(size)
+        row = "{:>8}".format(size)
+        for name, sort in strategies:
+            try:
+                if name == 'insertion' and size > 2048:
+                    raise NotApplicable
+                row += "{:>12.1f}".format(time_strategy(sort, values))
+            except NotApplicable:
+                row += "{:>12}".format('-')
+        print(row)
+    print()
+
+
+def main():
+    random.seed(0)
+    general = [strategy for strategy in STRATEGIES if strategy[0] != 'counting']
+    report("Random floats", lambda n: [random.random() for _ in range(n)],
+           [2, 4, 8, 16, 32, 64, 256, 2048, 20000], general)
+    report("Ints drawn from 0-99", lambda n: [random.randrange(100) for _ in range(n)],
+           [512, 2048, 4096, 20000, 200000], STRATEGIES)
+    report("Ints with about 8 repeats of each value", lambda n: [random.randrange(n // 8 + 1) for _ in range(n)],
+           [2048, 20000, 200000], STRATEGIES)
+    report("Ints with about 32 repeats of each value", lambda n: [random.randrange(n // 32 + 1) for _ in range(n)],
+           [2048, 20000, 200000], STRATEGIES)
+
+
+if __name__ == '__main__':
+    main()
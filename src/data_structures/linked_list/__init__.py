@@ -0,0 +1,9 @@
+from .linked_list import (BaseNode, LinkedListNode, LinkedList, DoublyLinkedListNode, DoublyLinkedList, LazyLinkedList,
+                          MapView, FilterView, NodePool, merge_sorted)
+from .unrolled import UnrolledLinkedListNode, UnrolledLinkedList
+from .skip_list import SkipListNode, SkipList
+from .concurrent import ConcurrentLinkedQueue
+from .async_queue import AsyncLinkedQueue, QueueClosed
+from .persistent import PersistentLinkedListNode, PersistentLinkedList
+from .cache import LRUCache, LFUCache
+from .typed import TypedLinkedList
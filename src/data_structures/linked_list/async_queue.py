@@ -0,0 +1,223 @@
+"""An asyncio FIFO queue built from linked list nodes."""
+from collections import deque
+import asyncio
+
+from .linked_list import LinkedListNode, LinkedList
+
+
+class QueueClosed(Exception):
+    """Raised when putting into a closed queue, or getting from one which is closed and empty."""
+
+
+class AsyncLinkedQueue:
+    """An asyncio FIFO queue, optionally bounded, which stores its values in a chain of linked list nodes.
+
+    Values are held in a singly linked chain, so `drain` can hand a whole batch to a consumer by cutting the chain
+    rather than copying values.  Producers never allocate futures: a put links its node and wakes the first waiting
+    consumer, if there is one.  Closing the queue acts as an end of stream marker, which consumers see once they
+    have taken everything put before the close.
+    """
+    def __init__(self, maxsize=0):
+        """The constructor for this AsyncLinkedQueue
+
+        Parameters
+        ----------
+        maxsize : int
+            The most values the queue will hold before `put` waits.  Zero or less means the queue is unbounded.
+        """
+        self._maxsize = maxsize
+        self._head = None
+        self._tail = None
+        self._length = 0
+        self._closed = False
+        self._getters = deque()
+        self._putters = deque()
+
+    @property
+    def maxsize(self):
+        """The most values the queue will hold, or zero or less if it is unbounded."""
+        return self._maxsize
+
+    @property
+    def closed(self):
+        """Whether `close` has been called."""
+        return self._closed
+
+    def qsize(self):
+        """Returns the number of values in the queue."""
+        return self._length
+
+    def empty(self):
+        """Returns True if the queue holds no values."""
+        return self._head is None
+
+    def full(self):
+        """Returns True if the queue is bounded and holds `maxsize` values."""
+        return 0 < self._maxsize <= self._length
+
+    @staticmethod
+    def _wakeup_next(waiters):
+        while waiters:
+            waiter = waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                break
+
+    async def _wait(self, waiters):
+        waiter = asyncio.get_running_loop().create_future()
+        waiters.append(waiter)
+        try:
+            await waiter
+        except BaseException:
+            waiter.cancel()
+            try:
+                waiters.remove(waiter)
+            except ValueError:
+                # We were woken before being cancelled, so pass the wake up along.
+                self._wakeup_next(waiters)
+            raise
+
+    def put_nowait(self, value):
+        """Adds a value to the back of the queue without waiting.
+
+        Raises
+        ------
+        QueueClosed :
+            If the queue has been closed.
+        asyncio.QueueFull :
+            If the queue is bounded and full.
+        """
+        if self._closed:
+            raise QueueClosed("Cannot put into a closed queue.")
+        if self.full():
+            raise asyncio.QueueFull
+        node = LinkedListNode(value)
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail._next_node = node
+        self._tail = node
+        self._length += 1
+        self._wakeup_next(self._getters)
+
+    async def put(self, value):
+        """Adds a value to the back of the queue, waiting for room if the queue is bounded and full.
+
+        Raises
+        ------
+        QueueClosed :
+            If the queue is, or becomes, closed.
+        """
+        while self.full() and not self._closed:
+            await self._wait(self._putters)
+        self.put_nowait(value)
+
+    def _detach(self, count):
+        """Cuts the first `count` nodes off the front of the queue and returns them as a LinkedList."""
+        head = tail = self._head
+        for _ in range(count - 1):
+            tail = tail._next_node
+        self._head = tail._next_node
+        tail._next_node = None
+        if self._head is None:
+            self._tail = None
+        self._length -= count
+        for _ in range(min(count, len(self._putters))):
+            self._wakeup_next(self._putters)
+        return LinkedList._from_chain(head, tail, count)
+
+    def get_nowait(self):
+        """Removes and returns the value at the front of the queue without waiting.
+
+        Raises
+        ------
+        QueueClosed :
+            If the queue is closed and empty.
+        asyncio.QueueEmpty :
+            If the queue is empty but still open.
+        """
+        if self._head is None:
+            if self._closed:
+                raise QueueClosed("The queue is closed and empty.")
+            raise asyncio.QueueEmpty
+        # Unlink the single node directly rather than wrapping it in a list as `_detach` does for bulk gets.
+        node = self._head
+        self._head = node._next_node
+        if self._head is None:
+            self._tail = None
+        self._length -= 1
+        self._wakeup_next(self._putters)
+        return node.value
+
+    async def _wait_for_value(self):
+        while self._head is None:
+            if self._closed:
+                raise QueueClosed("The queue is closed and empty.")
+            await self._wait(self._getters)
+
+    async def get(self):
+        """Removes and returns the value at the front of the queue, waiting for one if the queue is empty.
+
+        Raises
+        ------
+        QueueClosed :
+            If the queue is closed and empty.
+        """
+        await self._wait_for_value()
+        return self.get_nowait()
+
+    async def drain(self, max_items=None):
+        """Removes a batch of values from the front of the queue, waiting until there is at least one.
+
+        The batch is handed over as the queue's own chain of nodes, with no values copied.
+
+        Parameters
+        ----------
+        max_items : Optional[int]
+            The most values to take, or None to take everything in the queue.
+
+        Returns
+        -------
+        LinkedList :
+            The removed values, oldest first.
+
+        Raises
+        ------
+        QueueClosed :
+            If the queue is closed and empty.
+        """
+        if max_items is not None and max_items < 1:
+            raise ValueError("max_items must be a positive integer, not {}".format(max_items))
+        await self._wait_for_value()
+        count = self._length if max_items is None else min(max_items, self._length)
+        batch = self._detach(count)
+        if self._head is not None:
+            # Someone else may be waiting for what we left behind.
+            self._wakeup_next(self._getters)
+        return batch
+
+    def close(self):
+        """Closes the queue to further puts.
+
+        Values already in the queue can still be taken.  Consumers waiting on an empty queue, and producers waiting
+        on a full one, are woken and raise QueueClosed.
+        """
+        self._closed = True
+        for waiters in (self._getters, self._putters):
+            while waiters:
+                self._wakeup_next(waiters)
+
+    def __len__(self):
+        return self._length
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return await self.get()
+        except QueueClosed:
+            raise StopAsyncIteration
+
+    def __repr__(self):
+        return "AsyncLinkedQueue(maxsize={}, size={}, closed={})".format(self._maxsize, self._length, self._closed)
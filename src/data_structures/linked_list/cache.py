@@ -0,0 +1,318 @@
+"""Fixed size LRU and LFU caches which order their entries with doubly linked nodes."""
+import functools
+
+from .linked_list import DoublyLinkedListNode
+
+_MISSING = object()
+_KWARGS_MARK = object()
+
+
+class _CacheNode(DoublyLinkedListNode):
+    """A node holding a single cache entry, and in an LFU cache the frequency bucket it belongs to."""
+    __slots__ = ('key', 'bucket')
+
+    def __init__(self, key, value):
+        super().__init__(value)
+        self.key = key
+        self.bucket = None
+
+
+class _FrequencyNode(DoublyLinkedListNode):
+    """A node of an LFU cache's frequency list, whose value is a use count and which holds a ring of entries."""
+    __slots__ = ('entries',)
+
+    def __init__(self, count):
+        super().__init__(count)
+        self.entries = _ring(_CacheNode(None, None))
+
+
+def _ring(root):
+    """Turns a node into the sentinel of an empty circular list."""
+    root._next_node = root._prev_node = root
+    return root
+
+
+def _link_after(anchor, node):
+    """Links a node into a circular list directly after the anchor."""
+    following = anchor._next_node
+    node._prev_node = anchor
+    node._next_node = following
+    following._prev_node = node
+    anchor._next_node = node
+
+
+def _unlink(node):
+    """Removes a node from the circular list it belongs to."""
+    previous, following = node._prev_node, node._next_node
+    previous._next_node = following
+    following._prev_node = previous
+
+
+class _LinkedCache:
+    """The parts shared by the linked caches: the key index, the counters, `pop`, `peek` and `memoize`.
+
+    Subclasses decide which entry is evicted by implementing `get`, `put`, `_remove` and `__iter__`.
+    """
+    def __init__(self, maxsize=128):
+        """The constructor for this cache
+
+        Parameters
+        ----------
+        maxsize : int
+            The largest number of entries the cache will hold.
+
+        Raises
+        ------
+        ValueError :
+            If the maximum size is not a non-negative integer.
+        """
+        if not isinstance(maxsize, int) or maxsize < 0:
+            raise ValueError("The maximum cache size must be a non-negative integer, not {}".format(maxsize))
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._map = {}
+
+    def peek(self, key, default=None):
+        """Returns the value cached for the key without counting it as a use, or the default if there is none."""
+        node = self._map.get(key)
+        return default if node is None else node.value
+
+    def pop(self, key, default=_MISSING):
+        """Removes the key from the cache and returns its value.
+
+        Raises
+        ------
+        KeyError :
+            If the key is not cached and no default was given.
+        """
+        node = self._map.pop(key, None)
+        if node is None:
+            if default is _MISSING:
+                raise KeyError(key)
+            return default
+        self._remove(node)
+        return node.value
+
+    def memoize(self, func):
+        """A decorator which caches the results of a function in this cache, keyed on its arguments.
+
+        All arguments must be hashable.  The cache is available as the `cache` attribute of the wrapped function.
+        """
+        sentinel = _MISSING
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = args
+            if kwargs:
+                key += (_KWARGS_MARK,) + tuple(sorted(kwargs.items()))
+            value = self.get(key, sentinel)
+            if value is sentinel:
+                value = func(*args, **kwargs)
+                self.put(key, value)
+            return value
+
+        wrapper.cache = self
+        return wrapper
+
+    def __len__(self):
+        return len(self._map)
+
+    def __contains__(self, key):
+        return key in self._map
+
+    def __repr__(self):
+        return "{}(maxsize={}, size={}, hits={}, misses={}, evictions={})".format(
+            self.__class__.__name__, self.maxsize, len(self), self.hits, self.misses, self.evictions)
+
+
+class LRUCache(_LinkedCache):
+    """A cache which evicts its least recently used entry when it is full.
+
+    Entries sit in a circular doubly linked list from most to least recently used, behind a dict indexing them by
+    key, so lookups, moving an entry to the front and evicting from the back are all O(1).  The node of an evicted
+    entry is reused for the entry that replaces it.
+
+    Attributes
+    ----------
+    maxsize : int
+        The largest number of entries the cache will hold.
+    hits : int
+        The number of `get` calls which found their key.
+    misses : int
+        The number of `get` calls which didn't.
+    evictions : int
+        The number of entries dropped to make room for new ones.
+    """
+    def __init__(self, maxsize=128):
+        super().__init__(maxsize)
+        self._root = _ring(_CacheNode(None, None))
+
+    def get(self, key, default=None):
+        """Returns the value cached for the key and marks it as most recently used, or the default if there is none."""
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        root = self._root
+        first = root._next_node
+        if first is not node:
+            # The move to the front is written out in full, since this is the hottest path in the cache.
+            previous, following = node._prev_node, node._next_node
+            previous._next_node = following
+            following._prev_node = previous
+            node._prev_node = root
+            node._next_node = first
+            first._prev_node = node
+            root._next_node = node
+        return node.value
+
+    def put(self, key, value):
+        """Caches the value under the key as the most recently used entry, evicting the least recently used one
+        if the cache is full."""
+        root = self._root
+        node = self._map.get(key)
+        if node is not None:
+            node.value = value
+            if root._next_node is not node:
+                _unlink(node)
+                _link_after(root, node)
+            return
+        if not self.maxsize:
+            return
+
+        if len(self._map) >= self.maxsize:
+            node = root._prev_node
+            _unlink(node)
+            del self._map[node.key]
+            self.evictions += 1
+            node.key = key
+            node.value = value
+        else:
+            node = _CacheNode(key, value)
+        _link_after(root, node)
+        self._map[key] = node
+
+    def _remove(self, node):
+        _unlink(node)
+
+    def clear(self):
+        """Removes every entry, leaving the counters untouched."""
+        self._map.clear()
+        _ring(self._root)
+
+    def __iter__(self):
+        """Iterates over the cached keys from most to least recently used."""
+        root = self._root
+        node = root._next_node
+        while node is not root:
+            yield node.key
+            node = node._next_node
+
+
+class LFUCache(_LinkedCache):
+    """A cache which evicts its least frequently used entry when it is full, breaking ties by recency.
+
+    Entries with the same use count share a frequency node, and the frequency nodes sit in a circular doubly linked
+    list in increasing order of count.  A use moves an entry to the front of the next frequency node, creating it
+    if needed, so lookups, updates and evictions are all O(1).
+
+    Attributes
+    ----------
+    maxsize : int
+        The largest number of entries the cache will hold.
+    hits : int
+        The number of `get` calls which found their key.
+    misses : int
+        The number of `get` calls which didn't.
+    evictions : int
+        The number of entries dropped to make room for new ones.
+    """
+    def __init__(self, maxsize=128):
+        super().__init__(maxsize)
+        self._frequencies = _ring(_FrequencyNode(0))
+
+    def _touch(self, node):
+        """Moves an entry to the frequency node one count above its current one."""
+        bucket = node.bucket
+        following = bucket._next_node
+        if following is self._frequencies or following.value != bucket.value + 1:
+            if node._next_node is node._prev_node:
+                # The entry is alone in its frequency node, so the node can simply move up a count.
+                bucket.value += 1
+                return
+            following = _FrequencyNode(bucket.value + 1)
+            _link_after(bucket, following)
+        _unlink(node)
+        _link_after(following.entries, node)
+        node.bucket = following
+        if bucket.entries._next_node is bucket.entries:
+            _unlink(bucket)
+
+    def frequency(self, key):
+        """Returns the number of times the key has been used since it was cached, or 0 if it isn't cached."""
+        node = self._map.get(key)
+        return 0 if node is None else node.bucket.value
+
+    def get(self, key, default=None):
+        """Returns the value cached for the key and counts a use of it, or the default if there is none."""
+        node = self._map.get(key)
+        if node is None:
+            self.misses += 1
+            return default
+        self.hits += 1
+        self._touch(node)
+        return node.value
+
+    def put(self, key, value):
+        """Caches the value under the key, evicting the least frequently used entry if the cache is full.
+
+        Updating a key already in the cache counts as a use of it.
+        """
+        node = self._map.get(key)
+        if node is not None:
+            node.value = value
+            self._touch(node)
+            return
+        if not self.maxsize:
+            return
+
+        if len(self._map) >= self.maxsize:
+            victim = self._frequencies._next_node.entries._prev_node
+            del self._map[victim.key]
+            self._remove(victim)
+            self.evictions += 1
+
+        first = self._frequencies._next_node
+        if first is self._frequencies or first.value != 1:
+            first = _FrequencyNode(1)
+            _link_after(self._frequencies, first)
+        node = _CacheNode(key, value)
+        node.bucket = first
+        _link_after(first.entries, node)
+        self._map[key] = node
+
+    def _remove(self, node):
+        bucket = node.bucket
+        _unlink(node)
+        if bucket.entries._next_node is bucket.entries:
+            _unlink(bucket)
+
+    def clear(self):
+        """Removes every entry, leaving the counters untouched."""
+        self._map.clear()
+        _ring(self._frequencies)
+
+    def __iter__(self):
+        """Iterates over the cached keys from most to least frequently used, most recently used first among ties."""
+        root = self._frequencies
+        bucket = root._prev_node
+        while bucket is not root:
+            entries = bucket.entries
+            node = entries._next_node
+            while node is not entries:
+                yield node.key
+                node = node._next_node
+            bucket = bucket._prev_node
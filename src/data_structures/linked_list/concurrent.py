@@ -0,0 +1,193 @@
+"""A thread safe FIFO queue built from linked list nodes."""
+from queue import Empty
+from typing import Iterable
+import threading
+import time
+
+from .linked_list import LinkedListNode
+
+
+class ConcurrentLinkedQueue:
+    """An unbounded, thread safe FIFO queue using the two lock design of Michael and Scott.
+
+    The queue always holds a dummy node at its head.  Producers only ever touch the tail, under the tail lock, and
+    consumers only ever touch the head, under the head lock, so enqueuers and dequeuers don't contend with each
+    other.  Consumers that block on an empty queue wait on a condition tied to the head lock, and producers only
+    take that lock to wake them when someone is actually waiting.
+    """
+    def __init__(self, values=()):
+        """The constructor for this ConcurrentLinkedQueue
+
+        Parameters
+        ----------
+        values : Optional[Sequence]
+            Values to enqueue, in order, when the queue is created.
+        """
+        self._head = self._tail = LinkedListNode(None)
+        self._head_lock = threading.Lock()
+        self._tail_lock = threading.Lock()
+        self._not_empty = threading.Condition(self._head_lock)
+        self._waiting = 0
+        # Each counter is only written under its own lock, so their difference is a cheap size estimate.
+        self._enqueued = 0
+        self._dequeued = 0
+
+        if isinstance(values, Iterable):
+            self.put_many(values)
+        else:
+            raise TypeError("{} object is not iterable".format(values))
+
+    def put(self, value):
+        """Adds a value to the back of the queue."""
+        node = LinkedListNode(value)
+        with self._tail_lock:
+            self._tail._next_node = node
+            self._tail = node
+            self._enqueued += 1
+        if self._waiting:
+            with self._not_empty:
+                self._not_empty.notify()
+
+    def put_many(self, values):
+        """Adds several values to the back of the queue in one step.
+
+        The new nodes are chained together before the tail lock is taken, so the lock is held for O(1) time
+        regardless of the number of values.
+        """
+        head = tail = None
+        count = 0
+        for value in values:
+            node = LinkedListNode(value)
+            if tail is None:
+                head = node
+            else:
+                tail._next_node = node
+            tail = node
+            count += 1
+        if not count:
+            return
+
+        with self._tail_lock:
+            self._tail._next_node = head
+            self._tail = tail
+            self._enqueued += count
+        if self._waiting:
+            with self._not_empty:
+                self._not_empty.notify(count)
+
+    def _wait_for_value(self, block, timeout):
+        """Blocks, with the head lock held, until the queue has a value.
+
+        Raises
+        ------
+        queue.Empty :
+            If the queue is empty and either blocking is off or the timeout runs out.
+        """
+        if self._head._next_node is not None:
+            return
+        if not block:
+            raise Empty
+        if timeout is not None and timeout < 0:
+            raise ValueError("'timeout' must be a non-negative number")
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+        # Register as a waiter before re-checking, so a producer that links a node after our check is guaranteed
+        # to see the registration and wake us.
+        self._waiting += 1
+        try:
+            while self._head._next_node is None:
+                if deadline is None:
+                    self._not_empty.wait()
+                else:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        raise Empty
+                    self._not_empty.wait(remaining)
+        finally:
+            self._waiting -= 1
+
+    def get(self, block=True, timeout=None):
+        """Removes and returns the value at the front of the queue.
+
+        Parameters
+        ----------
+        block : bool
+            Whether to wait for a value if the queue is empty.
+        timeout : Optional[float]
+            The longest time in seconds to wait, or None to wait indefinitely.
+
+        Raises
+        ------
+        queue.Empty :
+            If no value became available.
+        """
+        with self._not_empty:
+            self._wait_for_value(block, timeout)
+            # The first real node becomes the new dummy.
+            node = self._head._next_node
+            value = node.value
+            node.value = None
+            self._head = node
+            self._dequeued += 1
+            return value
+
+    def get_nowait(self):
+        """Removes and returns the value at the front of the queue without blocking.
+
+        Raises
+        ------
+        queue.Empty :
+            If the queue is empty.
+        """
+        return self.get(block=False)
+
+    def get_many(self, max_items=None, block=True, timeout=None):
+        """Removes and returns up to `max_items` values from the front of the queue.
+
+        If blocking, waits until at least one value is available and then drains whatever is there, without waiting
+        for the batch to fill.
+
+        Parameters
+        ----------
+        max_items : Optional[int]
+            The most values to remove, or None to drain the queue.
+        block : bool
+            Whether to wait for a value if the queue is empty.
+        timeout : Optional[float]
+            The longest time in seconds to wait, or None to wait indefinitely.
+
+        Returns
+        -------
+        list :
+            The removed values, oldest first.
+
+        Raises
+        ------
+        queue.Empty :
+            If no value became available.
+        """
+        values = []
+        with self._not_empty:
+            self._wait_for_value(block, timeout)
+            node = self._head
+            while node._next_node is not None and (max_items is None or len(values) < max_items):
+                node = node._next_node
+                values.append(node.value)
+                node.value = None
+            self._head = node
+            self._dequeued += len(values)
+        return values
+
+    def empty(self):
+        """Returns True if the queue looked empty at the moment of the call."""
+        return self._head._next_node is None
+
+    def qsize(self):
+        """Returns the approximate number of values in the queue."""
+        return max(0, self._enqueued - self._dequeued)
+
+    def __len__(self):
+        return self.qsize()
+
+    def __repr__(self):
+        return "ConcurrentLinkedQueue(size={})".format(self.qsize())
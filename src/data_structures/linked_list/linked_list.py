@@ -1,6 +1,13 @@
 """A python linked list implementation."""
 from typing import Iterable
+from array import array
+from collections import Counter
+from itertools import chain, islice, repeat
 from math import log2
+import heapq
+import pickle
+import struct
+import sys
 
 from data_structures.node import BaseNode
 
@@ -15,7 +22,14 @@ class LinkedListNode(BaseNode):
     ----------
     value : Any
         The data this node holds.
+
+    Notes
+    -----
+    The `next_node` property validates every assignment.  Algorithms inside this package that already guarantee
+    the types involved (sorts, reversals, splices) assign `_next_node` directly to skip that check.
     """
+    __slots__ = ('_next_node',)
+
     def __init__(self, value):
         """The constructor for the LinkedListNode.
 
@@ -56,6 +70,11 @@ class LinkedListNode(BaseNode):
         else:
             raise TypeError("The {0}.next_node must also be an instance of {0}".format(LinkedListNode))
 
+    def _reset(self):
+        """Clears this node's value and links so that it can be reused."""
+        self.value = None
+        self._next_node = None
+
     def __str__(self):
         """The informal representation of this node.
 
@@ -77,35 +96,351 @@ class LinkedListNode(BaseNode):
             return "LinkedListNode(value={}, next_node=None)".format(self.value)
 
 
+_MISSING = object()
+
+# Crossover points for sorted(method='auto'), from benchmarks/bench_sort.py.
+_AUTO_INSERTION_SORT_MAX = 3
+_AUTO_COUNTING_SORT_MIN = 4096
+# Counting only beats the builtin sort when each distinct value appears this many times on average.
+_AUTO_COUNTING_SORT_RATIO = 16
+
+# Snapshot header: magic bytes, format version, payload kind and number of values.
+_SNAPSHOT_HEADER = struct.Struct('<4sBcQ')
+_SNAPSHOT_MAGIC = b'LLST'
+_SNAPSHOT_VERSION = 1
+# Payload kinds: raw little endian int64s, raw little endian float64s, or a length prefixed pickle of the values.
+_SNAPSHOT_INT = b'q'
+_SNAPSHOT_FLOAT = b'd'
+_SNAPSHOT_OBJECT = b'o'
+_SNAPSHOT_LENGTH = struct.Struct('<Q')
+
+
+class NodePool:
+    """A capped free list of spare nodes, for recycling nodes between removals and insertions.
+
+    Lists which churn through many insertions and removals can share a pool so that a popped node is reset and
+    handed out again by a later insertion instead of being freed and reallocated.  Nodes released to a pool must
+    not be referenced from anywhere else, since they will be reused.
+
+    Attributes
+    ----------
+    max_size : int
+        The largest number of spare nodes the pool will hold on to.
+    node_class : type
+        The type of node this pool holds.
+    hits : int
+        The number of nodes handed out from the pool.
+    misses : int
+        The number of nodes freshly allocated because the pool was empty.
+    discards : int
+        The number of released nodes dropped because the pool was full.
+    """
+    def __init__(self, max_size=1024, node_class=LinkedListNode):
+        """The constructor for this NodePool
+
+        Parameters
+        ----------
+        max_size : int
+            The largest number of spare nodes the pool will hold on to.
+        node_class : type
+            The type of node this pool holds.
+
+        Raises
+        ------
+        ValueError :
+            If the maximum size is not a non-negative integer.
+        """
+        if not isinstance(max_size, int) or max_size < 0:
+            raise ValueError("The maximum pool size must be a non-negative integer, not {}".format(max_size))
+        self.max_size = max_size
+        self.node_class = node_class
+        self.hits = 0
+        self.misses = 0
+        self.discards = 0
+        self._free = []
+
+    def acquire(self, value):
+        """Returns a node holding the given value, reusing a spare node if one is available."""
+        if self._free:
+            self.hits += 1
+            node = self._free.pop()
+            node.value = value
+            return node
+        self.misses += 1
+        return self.node_class(value)
+
+    def release(self, node):
+        """Resets a node that is no longer in use and keeps it for reuse, unless the pool is full."""
+        if len(self._free) < self.max_size:
+            node._reset()
+            self._free.append(node)
+        else:
+            self.discards += 1
+
+    def clear(self):
+        """Drops all spare nodes."""
+        self._free.clear()
+
+    def __len__(self):
+        return len(self._free)
+
+    def __repr__(self):
+        return "NodePool(max_size={}, node_class={}, size={}, hits={}, misses={}, discards={})".format(
+            self.max_size, self.node_class.__name__, len(self), self.hits, self.misses, self.discards)
+
+
 class LinkedList:
     """A singly linked list."""
-    def __init__(self, values=()):
+    _node_class = LinkedListNode
+
+    def __init__(self, values=(), pool=None, pool_size=None, indexed=False):
         """The constructor for this LinkedList
 
         Parameters
         ----------
         values : Optional[Sequence]
             A list, tuple, or set of values to initialize this LinkedList with.
+        pool : Optional[NodePool]
+            A pool of spare nodes, possibly shared with other lists, to take new nodes from and return popped
+            nodes to.
+        pool_size : Optional[int]
+            If given, a private NodePool holding at most this many spare nodes is created for this list.
+        indexed : bool
+            If True, the list keeps a dictionary from each value to its number of occurrences and its first node,
+            making `in` and `count` O(1) and letting `index` skip value comparisons.  Every value must then be
+            hashable.
+
+        Raises
+        ------
+        ValueError :
+            If both a pool and a pool size are given.
+        TypeError :
+            If the pool holds a different kind of node than this list uses.
         """
         self._head = None
-
-        if isinstance(values, Iterable) and values:
-            # Coerce to a list, in case of a weird container type (this makes sure it's iterable).
-            values = list(values)
-            # Since we have some values, fencepost.
-            # Set the head node to a new list and create a generic node pointer that we can advance.
-            self.head = LinkedListNode(values[0])
-            current_node = self.head
-            # Loop through the remaining values.
-            for v in values[1:]:
-                # Construct a new node for each value.
-                current_node.next_node = LinkedListNode(v)
-                # And advance our generic node pointer.
-                current_node = current_node.next_node
-        elif isinstance(values, Iterable):
-            pass  # We didn't get passed anything, construct an empty LinkedList
+        self._tail = None
+        self._length = 0
+        self._index = None
+        # The last node reached by position, so nearby positional accesses needn't start over from the head.
+        self._finger_index = 0
+        self._finger_node = None
+
+        if pool is not None and pool_size is not None:
+            raise ValueError("Pass either a shared pool or a pool size, not both.")
+        if pool_size is not None:
+            pool = NodePool(pool_size, self._node_class)
+        if pool is not None and pool.node_class is not self._node_class:
+            raise TypeError("A {} can only draw nodes from a pool of {}".format(
+                self.__class__.__name__, self._node_class.__name__))
+        self._pool = pool
+        self._make_node = self._node_class if pool is None else pool.acquire
+
+        if isinstance(values, Iterable):
+            self._head, self._tail, self._length = _build_chain(values, self._make_node)
         else:
             raise TypeError("{} object is not iterable".format(values))
+        if indexed:
+            self._rebuild_index()
+
+    @classmethod
+    def _from_chain(cls, head, tail, length):
+        """Wraps an existing, detached chain of nodes in a new list without copying it.
+
+        The caller vouches that the chain runs from head to tail, is `length` nodes long and is no longer part of
+        any other list.
+        """
+        new_list = cls()
+        new_list._head = head
+        new_list._tail = tail
+        new_list._length = length
+        return new_list
+
+    @classmethod
+    def from_iter(cls, values, lazy=False):
+        """Builds a linked list from an arbitrary iterable.
+
+        Parameters
+        ----------
+        values : Iterable
+            The values to fill the list with.  This may be a generator or other one-shot iterator.
+        lazy : bool
+            If True, return a LazyLinkedList which only pulls values from the iterable as iteration or indexing
+            reaches them, so that large or unbounded sources can be consumed in constant memory.
+
+        Returns
+        -------
+        LinkedList :
+            A list of this class, or a LazyLinkedList if `lazy` is set.
+        """
+        if lazy:
+            return LazyLinkedList(values)
+        return cls(values)
+
+    @classmethod
+    def from_array(cls, buffer):
+        """Builds a linked list from any object supporting the buffer protocol.
+
+        This accepts `array.array`, `bytes`, `memoryview` and NumPy arrays among others.  The buffer is read through
+        a memoryview, so no intermediate python list is built.  Multidimensional buffers must be C-contiguous and
+        are read in row-major order.
+
+        Parameters
+        ----------
+        buffer : Buffer
+            The typed buffer to copy values out of.
+
+        Returns
+        -------
+        LinkedList :
+            A list of this class holding one node per element of the buffer.
+
+        Raises
+        ------
+        TypeError :
+            If the object does not support the buffer protocol.
+        ValueError :
+            If a multidimensional buffer is not C-contiguous.
+        """
+        view = memoryview(buffer)
+        if view.ndim != 1:
+            if not view.c_contiguous:
+                raise ValueError("Only C-contiguous buffers can be flattened into a {}".format(cls.__name__))
+            view = view.cast('B').cast(view.format)
+        return cls(view)
+
+    def to_array(self, typecode='d'):
+        """Copies the values of this list into a new `array.array`.
+
+        The array is allocated at its final size up front and filled in a single traversal.
+
+        Parameters
+        ----------
+        typecode : str
+            The `array` module typecode of the result.
+
+        Returns
+        -------
+        array.array :
+            A typed array holding the values of this list in order.
+        """
+        out = array(typecode, bytes(self._length * array(typecode).itemsize))
+        node = self._head
+        for i in range(self._length):
+            out[i] = node.value
+            node = node._next_node
+        return out
+
+    def to_numpy(self, dtype=float):
+        """Copies the values of this list into a new NumPy array.
+
+        The array is allocated at its final size up front and filled in a single traversal.
+
+        Parameters
+        ----------
+        dtype : numpy.dtype
+            The data type of the result.
+
+        Returns
+        -------
+        numpy.ndarray :
+            A one dimensional array holding the values of this list in order.
+
+        Raises
+        ------
+        ImportError :
+            If NumPy is not installed.
+        """
+        try:
+            import numpy
+        except ImportError:
+            raise ImportError("LinkedList.to_numpy requires numpy to be installed.")
+        return numpy.fromiter(self, dtype=dtype, count=len(self))
+
+    def dump(self, fp):
+        """Writes a compact binary snapshot of the values in this list to a file.
+
+        Lists holding only ints that fit in 64 bits, or only floats, are written as a raw typed array.  Anything else
+        falls back to a single pickle of the values.
+
+        Parameters
+        ----------
+        fp : BinaryIO
+            A file object opened for binary writing.
+        """
+        kinds = {type(value) for value in self}
+        payload = None
+        if kinds <= {int}:
+            try:
+                payload = array(_SNAPSHOT_INT.decode(), self)
+                kind = _SNAPSHOT_INT
+            except OverflowError:
+                pass
+        elif kinds == {float}:
+            payload = array(_SNAPSHOT_FLOAT.decode(), self)
+            kind = _SNAPSHOT_FLOAT
+
+        if payload is None:
+            kind = _SNAPSHOT_OBJECT
+            data = pickle.dumps(list(self), protocol=pickle.HIGHEST_PROTOCOL)
+            fp.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, kind, len(self)))
+            fp.write(_SNAPSHOT_LENGTH.pack(len(data)))
+            fp.write(data)
+        else:
+            if sys.byteorder == 'big':
+                payload.byteswap()
+            fp.write(_SNAPSHOT_HEADER.pack(_SNAPSHOT_MAGIC, _SNAPSHOT_VERSION, kind, len(payload)))
+            payload.tofile(fp)
+
+    @classmethod
+    def load(cls, fp):
+        """Reads a list back from a snapshot written by `dump`.
+
+        Snapshots of arbitrary values are stored as pickles, so only load snapshots from trusted sources.
+
+        Parameters
+        ----------
+        fp : BinaryIO
+            A file object opened for binary reading.
+
+        Returns
+        -------
+        LinkedList :
+            A new list of this class holding the snapshot's values.
+
+        Raises
+        ------
+        ValueError :
+            If the file does not hold a valid snapshot.
+        """
+        header = fp.read(_SNAPSHOT_HEADER.size)
+        if len(header) != _SNAPSHOT_HEADER.size:
+            raise ValueError("Truncated {} snapshot".format(cls.__name__))
+        magic, version, kind, length = _SNAPSHOT_HEADER.unpack(header)
+        if magic != _SNAPSHOT_MAGIC or version != _SNAPSHOT_VERSION:
+            raise ValueError("Not a {} snapshot".format(cls.__name__))
+
+        if kind in (_SNAPSHOT_INT, _SNAPSHOT_FLOAT):
+            values = array(kind.decode())
+            try:
+                values.fromfile(fp, length)
+            except EOFError:
+                raise ValueError("Truncated {} snapshot".format(cls.__name__))
+            if sys.byteorder == 'big':
+                values.byteswap()
+        elif kind == _SNAPSHOT_OBJECT:
+            prefix = fp.read(_SNAPSHOT_LENGTH.size)
+            if len(prefix) != _SNAPSHOT_LENGTH.size:
+                raise ValueError("Truncated {} snapshot".format(cls.__name__))
+            size, = _SNAPSHOT_LENGTH.unpack(prefix)
+            data = fp.read(size)
+            if len(data) != size:
+                raise ValueError("Truncated {} snapshot".format(cls.__name__))
+            values = pickle.loads(data)
+            if len(values) != length:
+                raise ValueError("Corrupt {} snapshot".format(cls.__name__))
+        else:
+            raise ValueError("Unknown {} snapshot payload {!r}".format(cls.__name__, kind))
+        return cls(values)
 
     @property
     def head(self):
@@ -114,25 +449,161 @@ class LinkedList:
 
     @head.setter
     def head(self, new_node):
-        if isinstance(new_node, LinkedListNode) or new_node is None:
+        if isinstance(new_node, self._node_class) or new_node is None:
             self._head = new_node
+            # We've been handed an arbitrary chain, so walk it once to resync the cached length and tail.
+            self._reset_tail()
+            if self._index is not None:
+                self._rebuild_index()
         else:
-            raise TypeError("The head value of a LinkedList may only be a LinkedListNode or None")
+            raise TypeError("The head value of a {} may only be a {} or None".format(
+                self.__class__.__name__, self._node_class.__name__))
+
+    @property
+    def tail(self):
+        """A reference to the last node in this linked list, if one exists."""
+        return self._tail
+
+    @property
+    def pool(self):
+        """The NodePool this list recycles its nodes through, if it has one."""
+        return self._pool
+
+    @property
+    def indexed(self):
+        """Whether this list keeps a value index for O(1) membership tests and counts."""
+        return self._index is not None
+
+    def _rebuild_index(self):
+        """Recomputes the value index from scratch."""
+        self._index = {}
+        self._index_chain(self._head)
+
+    def _index_chain(self, head):
+        """Adds every node of a chain which follows all of the list's other nodes to the value index.
+
+        The chain is tallied separately first, so an unhashable value leaves the index untouched.
+        """
+        tally = {}
+        node = head
+        while node:
+            entry = tally.get(node.value)
+            if entry is None:
+                tally[node.value] = [1, node]
+            else:
+                entry[0] += 1
+            node = node._next_node
+        for value, (count, first) in tally.items():
+            entry = self._index.get(value)
+            if entry is None:
+                self._index[value] = [count, first]
+            else:
+                entry[0] += count
+
+    def _index_add(self, node, first=False, last=False):
+        """Records a node about to be linked into the list in the value index.
+
+        Parameters
+        ----------
+        node : LinkedListNode
+            The new node.
+        first : bool
+            Whether the node will be the head of the list.
+        last : bool
+            Whether the node will be the tail of the list.
+        """
+        entry = self._index.get(node.value)
+        if entry is None:
+            self._index[node.value] = [1, node]
+            return
+        entry[0] += 1
+        if first:
+            entry[1] = node
+        elif not last:
+            # Somewhere in the middle, so it may or may not now be the first occurrence.
+            entry[1] = None
+
+    def _index_discard(self, node):
+        """Removes a node which has been unlinked from the list from the value index."""
+        entry = self._index[node.value]
+        if entry[0] == 1:
+            del self._index[node.value]
+        else:
+            entry[0] -= 1
+            if entry[1] is node:
+                entry[1] = None
+
+    def _index_reordered(self):
+        """Forgets the first node of every value once the nodes have been reordered."""
+        if self._index is not None:
+            for entry in self._index.values():
+                entry[1] = None
+
+    def _release(self, node):
+        """Drops a node which has been removed from the list from the value index and hands it back to the pool."""
+        if self._index is not None:
+            self._index_discard(node)
+        if self._pool is not None:
+            self._pool.release(node)
+
+    def _reset_tail(self):
+        """Walks the list from the head, recomputing the cached length and tail reference."""
+        length = 0
+        tail = None
+        node = self._head
+        while node:
+            length += 1
+            tail = node
+            node = node._next_node
+        self._tail = tail
+        self._length = length
+        self._finger_node = None
 
     def _get(self, index):
         """This is a 'private' method for getting the LinkedListNode at a particular index."""
         if not isinstance(index, int):
             raise IndexError("{} is not a valid index".format(index))
-        if index >= len(self) or index < 0:
+        if index >= self._length or index < 0:
             raise IndexError("Valid indices are in the range 0:{}, inclusive. "
-                             "You requested {}".format(len(self) - 1, index))
-
-        node = self.head
-        for i in range(index):
-            node = node.next_node
+                             "You requested {}".format(self._length - 1, index))
+        if index == self._length - 1:
+            return self._tail
+
+        # Walk on from the finger if it's at or before the index, so sequential access is amortized O(1).
+        if self._finger_node is not None and self._finger_index <= index:
+            node = self._finger_node
+            steps = index - self._finger_index
+        else:
+            node = self._head
+            steps = index
+        for i in range(steps):
+            node = node._next_node
 
+        self._finger_index = index
+        self._finger_node = node
         return node
 
+    def _normalize_index(self, index):
+        """Converts a possibly negative index into the equivalent non-negative one, checking that it is in range."""
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+        normalized = index + self._length if index < 0 else index
+        if normalized >= self._length or normalized < 0:
+            raise IndexError("Valid indices are in the range {}:{}, inclusive. "
+                             "You requested {}".format(-self._length, self._length - 1, index))
+        return normalized
+
+    def _unlink(self, previous, node):
+        """Removes node, which follows previous or is the head if previous is None, from the chain."""
+        if previous is None:
+            self._head = node._next_node
+        else:
+            previous._next_node = node._next_node
+        if node is self._tail:
+            self._tail = previous
+        self._length -= 1
+        self._finger_node = None
+
     def insert(self, index, value):
         """Inserts a value at the given index into the linked list.
 
@@ -151,18 +622,28 @@ class LinkedList:
         if not isinstance(index, int):
             raise IndexError("{} is not a valid index".format(index))
 
-        if index:
-            # Grab the immediately preceding node.
+        if index and index != self._length:
+            # Grab the immediately preceding node, which also checks the index is in range.
             previous = self._get(index - 1)
-            # Construct a new node and set its next node pointer to what the preceding node was pointing at.
-            new_node = LinkedListNode(value)
-            new_node.next_node = previous.next_node
+        new_node = self._make_node(value)
+        if self._index is not None:
+            self._index_add(new_node, first=not index, last=index == self._length)
+
+        if not index:  # We want to insert at the head
+            new_node._next_node = self._head
+            self._head = new_node
+            if self._tail is None:
+                self._tail = new_node
+            self._finger_index += 1
+        elif index == self._length:  # We want to insert at the tail, which we can reach directly.
+            self._tail._next_node = new_node
+            self._tail = new_node
+        else:
+            # Set the new node's next node pointer to what the preceding node was pointing at.
+            new_node._next_node = previous._next_node
             # Finally, set the preceding node's next pointer to point at the newly constructed node.
-            previous.next_node = new_node
-        else:  # We want to insert at the head
-            new_node = LinkedListNode(value)
-            new_node.next_node = self.head
-            self.head = new_node
+            previous._next_node = new_node
+        self._length += 1
 
     def append(self, value):
         """Appends a value to the end of the list
@@ -172,7 +653,7 @@ class LinkedList:
         value : Any
             Value to append
         """
-        self.insert(len(self), value)
+        self.insert(self._length, value)
 
     def pop(self, index=None):
         """Removes a node at the given index and returns its value.
@@ -195,21 +676,34 @@ class LinkedList:
 
         if not index:  # We want to pop the first value.
             node = self._get(0)
-            self.head = node.next_node
-            return node.value
+            self._head = node._next_node
+            if node is self._tail:
+                self._tail = None
+            self._length -= 1
+            # The finger is on the popped head, so move it to the new one.
+            self._finger_node = self._head
+            self._finger_index = 0
+            value = node.value
+            self._release(node)
+            return value
 
         # Otherwise normal operations.
         # Grab the immediately preceding node.
         previous = self._get(index - 1)
 
         # Two cases: Either the immediately preceding node has a next_node value
-        if previous.next_node:
+        if previous._next_node:
             # In which case, grab it
-            node = previous.next_node
+            node = previous._next_node
             # Set the previous node's next pointer to point at the grabbed nodes next node (even if it is None)
-            previous.next_node = node.next_node
+            previous._next_node = node._next_node
+            if node is self._tail:
+                self._tail = previous
+            self._length -= 1
             # Then return the grabbed node's value
-            return node.value
+            value = node.value
+            self._release(node)
+            return value
         else:
             # Otherwise we're off by exactly one
             raise IndexError("You requested an index value one larger than the length of the LinkedList.")
@@ -226,7 +720,7 @@ class LinkedList:
         # But check to make sure if it's valid
         if previous_node:
             # If so, grab a reference to the next node and call it the current one.
-            current_node = previous_node.next_node
+            current_node = previous_node._next_node
         else:
             # Otherwise our list is empty and we're done.
             return
@@ -235,18 +729,21 @@ class LinkedList:
         # While we have a reference to the current node,
         while current_node:
             # Grab a reference to the next one in line so we don't lose it.
-            temp = current_node.next_node
+            temp = current_node._next_node
             # Reset the current node's pointer to point back at the previous node.
-            current_node.next_node = previous_node
+            current_node._next_node = previous_node
             # We're now done with the previous node, so advance its pointer up one.
             previous_node = current_node
             # Then move our current node pointer up one as well.
             current_node = temp
 
         # Finally, deal with the head node, which is now our tail, so point it at nothing.
-        self.head.next_node = None
+        self._head._next_node = None
+        self._tail = self._head
         # previous_node is holding on to our new head node, so set it.
-        self.head = previous_node
+        self._head = previous_node
+        self._finger_node = None
+        self._index_reordered()
 
     def count(self, value):
         """Counts the number of nodes in the list whose value is equal to the given value.
@@ -261,6 +758,13 @@ class LinkedList:
         int :
             The number of nodes whose value is equal to the given value.
         """
+        if self._index is not None:
+            try:
+                entry = self._index.get(value)
+            except TypeError:
+                pass
+            else:
+                return 0 if entry is None else entry[0]
         count = 0
         for val in self:
             if val == value:
@@ -285,28 +789,493 @@ class LinkedList:
         ValueError :
             If the given value is not present in the LinkedList
         """
+        if self._index is not None:
+            try:
+                entry = self._index.get(value)
+            except TypeError:
+                pass
+            else:
+                if entry is None:
+                    raise ValueError('{} is not present in the LinkedList'.format(value))
+                return self._index_position(value, entry)
         for idx, val in enumerate(self):
             if val == value:
                 return idx
         raise ValueError('{} is not present in the LinkedList'.format(value))
 
+    def _index_position(self, value, entry):
+        """Finds the position of a value's first node, finding and remembering the node itself if it is unknown."""
+        node = self._head
+        position = 0
+        first = entry[1]
+        if first is None:
+            # Matching identity first, as dicts and lists do, finds values like NaN which aren't equal to
+            # themselves.
+            while node.value is not value and node.value != value:
+                node = node._next_node
+                position += 1
+            entry[1] = node
+        else:
+            # Comparing identities is much cheaper than comparing values.
+            while node is not first:
+                node = node._next_node
+                position += 1
+        return position
+
     def extend(self, other):
-        """Appends the given iterable to the current LinkedList in place."""
-        tail = self._get(len(self) - 1)
-        tail.next_node = LinkedList(other).head
+        """Appends the given iterable to the current LinkedList in place.
+
+        The new nodes are chained together before being attached at the tail, so this is O(k) in the
+        number of new values and is safe to call with the list itself as the argument.
+        """
+        head, tail, length = _build_chain(other, self._make_node)
+        if not length:
+            return
+        if self._index is not None:
+            self._index_chain(head)
+        if self._tail is None:
+            self._head = head
+        else:
+            self._tail._next_node = head
+        self._tail = tail
+        self._length += length
+
+    def _detach(self):
+        """Empties the list without touching its nodes, returning the chain it held as (head, tail, length)."""
+        detached = self._head, self._tail, self._length
+        self._head = self._tail = None
+        self._length = 0
+        self._finger_node = None
+        if self._index is not None:
+            self._index = {}
+        return detached
+
+    def _attach(self, head, tail, length):
+        """Links a detached chain of this list's node type onto the end of the list."""
+        if not length:
+            return
+        if self._index is not None:
+            self._index_chain(head)
+        if self._tail is None:
+            self._head = head
+        else:
+            self._tail._next_node = head
+        self._tail = tail
+        self._length += length
+
+    def splice(self, other):
+        """Moves every node of another linked list onto the end of this one in O(1), leaving the other list empty.
+
+        Parameters
+        ----------
+        other : LinkedList
+            A linked list using the same kind of node as this one.
+
+        Raises
+        ------
+        ValueError :
+            If asked to splice a list into itself.
+        TypeError :
+            If the other list is not a linked list with the same kind of node.
+        """
+        if other is self:
+            raise ValueError("Cannot splice a {} into itself.".format(self.__class__.__name__))
+        if not isinstance(other, LinkedList) or other._node_class is not self._node_class:
+            raise TypeError("Can only splice a {} with another list of {}".format(
+                self.__class__.__name__, self._node_class.__name__))
+        self._attach(*other._detach())
+
+    def split_at(self, index):
+        """Cuts the list in two in place, keeping the values before the index and returning the rest as a new list.
+
+        The nodes from the index onwards are moved to the new list rather than copied, which shares this list's
+        node pool, if it has one.
+
+        Parameters
+        ----------
+        index : int
+            The position of the first value to move into the new list.  Negative indices count from the end.
 
-    def sorted(self, method='bubble_sort'):
+        Returns
+        -------
+        LinkedList :
+            A list of the same type holding the values from the index onwards.
+
+        Raises
+        ------
+        IndexError :
+            If the given index is not an integer or is outside the range [-len(self) to len(self)]
+        """
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+        normalized = index + self._length if index < 0 else index
+        if normalized > self._length or normalized < 0:
+            raise IndexError("Valid split points are in the range {}:{}, inclusive. "
+                             "You requested {}".format(-self._length, self._length, index))
+
+        if not normalized:
+            head, tail, length = self._detach()
+        elif normalized == self._length:
+            head, tail, length = None, None, 0
+        else:
+            last_kept = self._get(normalized - 1)
+            head, tail, length = last_kept._next_node, self._tail, self._length - normalized
+            last_kept._next_node = None
+            self._tail = last_kept
+            self._length = normalized
+        rest = self._from_chain(head, tail, length)
+        rest._pool = self._pool
+        rest._make_node = self._make_node
+        if self._index is not None:
+            self._rebuild_index()
+            rest._rebuild_index()
+        return rest
+
+    def rotate(self, steps=1):
+        """Rotates the list `steps` places to the right in place, by relinking the nodes at the new ends.
+
+        Like `collections.deque.rotate`, rotating one step to the right moves the last value to the front, and a
+        negative number of steps rotates to the left.
+        """
+        if self._length < 2:
+            return
+        steps %= self._length
+        if not steps:
+            return
+        new_tail = self._get(self._length - steps - 1)
+        new_head = new_tail._next_node
+        self._tail._next_node = self._head
+        new_tail._next_node = None
+        self._head, self._tail = new_head, new_tail
+        self._finger_node = None
+        self._index_reordered()
+
+    def get_many(self, indices):
+        """Returns the values at several positions using a single forward traversal.
+
+        Parameters
+        ----------
+        indices : Iterable[int]
+            The positions to read.  Negative indices count from the end of the list.
+
+        Returns
+        -------
+        list :
+            The values at the requested positions, in the order the positions were given.
+
+        Raises
+        ------
+        IndexError :
+            If any of the indices is not an integer or is out of range.
+        """
+        indices = [self._normalize_index(index) for index in indices]
+        values = {}
+        node = self._head
+        current = 0
+        for position in sorted(set(indices)):
+            while current < position:
+                node = node._next_node
+                current += 1
+            values[position] = node.value
+        return [values[index] for index in indices]
+
+    def pop_many(self, indices):
+        """Removes the values at several positions using a single forward traversal and returns them.
+
+        Parameters
+        ----------
+        indices : Iterable[int]
+            The positions to remove, all relative to the list as it is before any removal.  Negative indices count
+            from the end of the list.
+
+        Returns
+        -------
+        list :
+            The removed values, in the order the positions were given.
+
+        Raises
+        ------
+        IndexError :
+            If any of the indices is not an integer or is out of range.
+        ValueError :
+            If the same position is requested more than once.
+        """
+        indices = [self._normalize_index(index) for index in indices]
+        positions = sorted(set(indices))
+        if len(positions) != len(indices):
+            raise ValueError("Each position may only be popped once.")
+
+        values = {}
+        previous = None
+        node = self._head
+        current = 0
+        for position in positions:
+            while current < position:
+                previous, node = node, node._next_node
+                current += 1
+            values[position] = node.value
+            next_node = node._next_node
+            self._unlink(previous, node)
+            self._release(node)
+            node = next_node
+            current += 1
+        return [values[index] for index in indices]
+
+    def _check_sorted(self, other, assume_sorted):
+        """Returns the other operand of a set operation, raising a ValueError unless it and this list are sorted.
+
+        With `assume_sorted` the caller vouches for the ordering and the checks are skipped.  Otherwise a one-shot
+        iterator is read into a list first, so that it can be checked before anything is modified.
+        """
+        if other is self or iter(other) is other:
+            other = list(other)
+        if not assume_sorted:
+            for name, values in (('This list', self), ('The other operand', other)):
+                previous = _MISSING
+                for value in values:
+                    if previous is not _MISSING and value < previous:
+                        raise ValueError("{} is not sorted.  Sort it first, or pass assume_sorted=True if its order "
+                                         "is known to be correct.".format(name))
+                    previous = value
+        return other
+
+    def _set_merge(self, other, keep_left, keep_both, keep_right, in_place):
+        """Walks this list and a sorted iterable together, building a sorted chain of distinct values.
+
+        Each distinct value is kept according to whether it appears only in this list, in both, or only in the
+        other.  In place, kept values from this list reuse their nodes and every other node of this list is
+        released, otherwise every kept value gets a new node.
+
+        Returns
+        -------
+        Optional[LinkedListNode] :
+            The head of the new chain.
+        """
+        make_node = self._make_node
+        release = self._pool.release if in_place and self._pool is not None else None
+        head = tail = None
+        left = self._head
+        values = iter(other)
+        right = next(values, _MISSING)
+        while left is not None or right is not _MISSING:
+            if right is _MISSING or (left is not None and left.value < right):
+                value, in_left, in_right, keep = left.value, True, False, keep_left
+            elif left is None or right < left.value:
+                value, in_left, in_right, keep = right, False, True, keep_right
+            else:
+                value, in_left, in_right, keep = left.value, True, True, keep_both
+
+            node = None
+            if keep:
+                if in_left and in_place:
+                    node, left = left, left._next_node
+                else:
+                    node = make_node(value)
+            # Skip the rest of the run of this value on each side it appears on.
+            if in_left:
+                while left is not None and not value < left.value:
+                    following = left._next_node
+                    if release is not None:
+                        release(left)
+                    left = following
+            if in_right:
+                while right is not _MISSING and not value < right:
+                    right = next(values, _MISSING)
+
+            if node is not None:
+                if tail is None:
+                    head = node
+                else:
+                    tail._next_node = node
+                tail = node
+        if tail is not None:
+            tail._next_node = None
+        return head
+
+    def _adopt(self, head):
+        """Takes over a chain rebuilt from scratch, resyncing the cached tail, length, back links and value index."""
+        self._head = head
+        self._reset_tail()
+        if self._index is not None:
+            self._rebuild_index()
+
+    def _set_operation(self, other, assume_sorted, keep_left, keep_both, keep_right):
+        other = self._check_sorted(other, assume_sorted)
+        result = self._from_chain(None, None, 0)
+        result._pool = self._pool
+        result._make_node = self._make_node
+        result._adopt(self._set_merge(other, keep_left, keep_both, keep_right, in_place=False))
+        return result
+
+    def _set_update(self, other, assume_sorted, keep_left, keep_both, keep_right):
+        other = self._check_sorted(other, assume_sorted)
+        self._adopt(self._set_merge(other, keep_left, keep_both, keep_right, in_place=True))
+
+    def union(self, other, assume_sorted=False):
+        """Returns a new sorted list of the distinct values in this sorted list, the other sorted iterable, or both.
+
+        The set operations walk both operands together, so they take O(n + m) time.  They compare values with `<`
+        only, and treat two values as equal when neither is less than the other.
+
+        Parameters
+        ----------
+        other : Iterable
+            A sorted iterable of values.
+        assume_sorted : bool
+            If True, skip checking that both operands are sorted.  The result is meaningless if they aren't.
+
+        Raises
+        ------
+        ValueError :
+            If either operand is found not to be sorted.
+        """
+        return self._set_operation(other, assume_sorted, True, True, True)
+
+    def intersection(self, other, assume_sorted=False):
+        """Returns a new sorted list of the distinct values in both this sorted list and the other sorted iterable.
+
+        See `union` for the parameters.
+        """
+        return self._set_operation(other, assume_sorted, False, True, False)
+
+    def difference(self, other, assume_sorted=False):
+        """Returns a new sorted list of the distinct values in this sorted list but not the other sorted iterable.
+
+        See `union` for the parameters.
+        """
+        return self._set_operation(other, assume_sorted, True, False, False)
+
+    def symmetric_difference(self, other, assume_sorted=False):
+        """Returns a new sorted list of the distinct values in exactly one of this sorted list and the other.
+
+        See `union` for the parameters.
+        """
+        return self._set_operation(other, assume_sorted, True, False, True)
+
+    def union_update(self, other, assume_sorted=False):
+        """Like `union`, but updates this list in place, keeping its own nodes and only creating nodes for values
+        taken from the other."""
+        self._set_update(other, assume_sorted, True, True, True)
+
+    def intersection_update(self, other, assume_sorted=False):
+        """Like `intersection`, but updates this list in place by unlinking nodes, without creating any."""
+        self._set_update(other, assume_sorted, False, True, False)
+
+    def difference_update(self, other, assume_sorted=False):
+        """Like `difference`, but updates this list in place by unlinking nodes, without creating any."""
+        self._set_update(other, assume_sorted, True, False, False)
+
+    def symmetric_difference_update(self, other, assume_sorted=False):
+        """Like `symmetric_difference`, but updates this list in place, keeping its own nodes and only creating
+        nodes for values taken from the other."""
+        self._set_update(other, assume_sorted, True, False, True)
+
+    def dedupe(self):
+        """Removes every node whose value equals the one before it, in place.
+
+        On a sorted list this leaves each distinct value exactly once.
+        """
+        node = self._head
+        if node is None:
+            return
+        release = self._pool.release if self._pool is not None else None
+        while node._next_node is not None:
+            following = node._next_node
+            if following.value == node.value:
+                node._next_node = following._next_node
+                if release is not None:
+                    release(following)
+            else:
+                node = following
+        self._adopt(self._head)
+
+    def sorted(self, method='bubble_sort', key=None, reverse=False):
+        """Sorts the nodes of the list in place.
+
+        Parameters
+        ----------
+        method : str
+            One of 'bubble_sort', 'insertion_sort', 'merge_sort', 'natural' or 'auto'.  The 'natural' method merges
+            the ascending and descending runs already present in the list, so sorted input is handled in O(n).
+            The 'auto' method picks a strategy from the size and contents of the list: insertion sort for tiny
+            lists, a counting sort for large lists of plain ints with many repeats, and otherwise python's builtin
+            sort, after which the sorted values are written back over the existing nodes in one pass rather than
+            the nodes being relinked.
+        key : Optional[Callable]
+            A function of one argument used to extract a comparison key from each value.  It is called exactly
+            once per node.
+        reverse : bool
+            If True, the list is sorted in descending order.  As with the builtin `sorted`, equal values keep
+            their original relative order.
+
+        Raises
+        ------
+        NotImplementedError :
+            If the given method is not one of the supported sorting methods.
+        """
         if method == 'bubble_sort':
-            self._bubble_sort()
+            sort = self._bubble_sort
         elif method == 'insertion_sort':
-            self._insertion_sort()
+            sort = self._insertion_sort
         elif method == 'merge_sort':
-            self._merge_sort()
+            sort = self._merge_sort
+        elif method == 'natural':
+            sort = self._natural_sort
+        elif method == 'auto':
+            self._auto_sort(key, reverse)
+            return
         else:
             raise NotImplementedError()
 
+        if key is not None:
+            # Take every key before touching a node, so a failing key leaves the list as it was.
+            keys = [key(value) for value in self]
+            node = self._head
+            for k in keys:
+                node.value = _KeyedValue(k, node.value)
+                node = node._next_node
+
+        try:
+            if reverse:
+                # Reversing around a stable sort gives a stable descending sort.
+                self.reverse()
+            sort()
+        finally:
+            # Even if a comparison failed partway, recount so the head, tail and length agree, and unwrap the values.
+            self._reset_tail()
+            self._index_reordered()
+            if reverse:
+                self.reverse()
+            if key is not None:
+                node = self._head
+                while node:
+                    node.value = node.value.value
+                    node = node._next_node
+
+    def _auto_sort(self, key, reverse):
+        if self._length <= _AUTO_INSERTION_SORT_MAX:
+            self.sorted('insertion_sort', key, reverse)
+            return
+        values = list(self)
+        if key is None and len(values) >= _AUTO_COUNTING_SORT_MIN:
+            counted = _counting_sorted(values, reverse)
+            if counted is not None:
+                self._rewrite_values(counted)
+                return
+        values.sort(key=key, reverse=reverse)
+        self._rewrite_values(values)
+
+    def _rewrite_values(self, values):
+        """Writes values over the existing nodes, in order, leaving the links alone."""
+        node = self._head
+        for value in values:
+            node.value = value
+            node = node._next_node
+        # The nodes stay where they were but now hold different values.
+        self._index_reordered()
+
     def _bubble_sort(self):
-        if len(self) <= 1:
+        if self._length <= 1:
             return
 
         swaps_this_iteration = True
@@ -314,183 +1283,1053 @@ class LinkedList:
             swaps_this_iteration = False
 
             previous = self.head
-            current = previous.next_node
+            current = previous._next_node
 
             if previous > current: #
-                self.head = current
-                previous.next_node = current.next_node
-                current.next_node = previous
+                self._head = current
+                previous._next_node = current._next_node
+                current._next_node = previous
                 previous, current = current, previous
                 swaps_this_iteration = True
 
-            while current.next_node:
+            while current._next_node:
 
-                if current > current.next_node:
-                    previous.next_node = current.next_node
-                    current.next_node = current.next_node.next_node
-                    previous.next_node.next_node = current
-                    previous = previous.next_node
+                if current > current._next_node:
+                    previous._next_node = current._next_node
+                    current._next_node = current._next_node._next_node
+                    previous._next_node._next_node = current
+                    previous = previous._next_node
                     swaps_this_iteration = True
                 else:
                     previous = current
-                    current = current.next_node
+                    current = current._next_node
 
     def _insertion_sort(self):
-        length = len(self)
+        length = self._length
 
         if length <= 1:
             return
 
         previous = self.head
-        current = previous.next_node
+        current = previous._next_node
 
         while current:
 
             if current >= previous:  #
-                previous, current = current, current.next_node
+                previous, current = current, current._next_node
 
             elif current < self.head:
-                previous.next_node = current.next_node
-                current.next_node = self.head
-                self.head = current
-                current = previous.next_node
+                previous._next_node = current._next_node
+                current._next_node = self.head
+                self._head = current
+                current = previous._next_node
 
             else:
-                previous.next_node = current.next_node
                 comparison_node = self.head
 
-                while current > comparison_node.next_node:
-                    comparison_node = comparison_node.next_node
+                while current >= comparison_node._next_node:
+                    comparison_node = comparison_node._next_node
 
-                current.next_node = comparison_node.next_node
-                comparison_node.next_node = current
-                current = previous.next_node
+                # Unlink only once the comparisons are done, so a failing one can't lose the node.
+                previous._next_node = current._next_node
+                current._next_node = comparison_node._next_node
+                comparison_node._next_node = current
+                current = previous._next_node
 
     def _merge_sort(self):
-        self.head = _merge_sort_recursive(self.head, len(self))
+        """A stable, bottom-up merge sort which relinks the existing nodes.
 
-    def _merge_sort_iterative(self):
-        length = len(self)
+        Runs of `width` nodes are merged pairwise in a single pass, and `width` doubles each pass, so the sort
+        takes O(n log n) comparisons, O(1) extra space and no recursion.
+        """
+        length = self._length
 
         if length <= 1:
             return
 
-        sub_list_length = 1
-        while sub_list_length < length:
-            left = self.head
-            right = self.head
-            for _ in range(sub_list_length):
-                right = right.next_node
+        # Each pass relinks the nodes after the anchor.
+        anchor = _ChainAnchor()
+        anchor._next_node = self._head
+        width = 1
+        while width < length:
+            tail = anchor
+            current = anchor._next_node
+            try:
+                while current:
+                    left = current
+                    right = _cut(left, width)
+                    current = _cut(right, width)
+                    tail = _merge(tail, left, right)
+            except BaseException:
+                # A comparison failed.  Put the rest of the pass back on the end, so that no node is lost.
+                self._head = _join([anchor._next_node, current])
+                raise
+            width *= 2
+
+        self._head = anchor._next_node
+        self._tail = tail
+
+    def _natural_sort(self):
+        """A stable natural merge sort which relinks the existing nodes.
+
+        The list is first cut into its maximal non-decreasing runs and strictly decreasing runs, the latter being
+        reversed in place as they are found.  Adjacent runs are then merged pairwise until one remains, so a list
+        made of r runs sorts in O(n log r), and an already sorted list in O(n).
+        """
+        if self._length <= 1:
+            return
 
-            if left <= right:
-                previous = left
-                left = left.next_node
-            else:
-                self.head = right
-                previous = right
-                right = right.next_node
-                previous.next_node = left
-
-            while left:
-                if left <= right:
-                    previous = left
-                    left = left.next_node
+        runs = []
+        node = self._head
+        anchor = _ChainAnchor()
+        try:
+            while node is not None:
+                # Find where the run ends before relinking any of it, so a failing comparison can't lose a node.
+                end = node
+                next_node = end._next_node
+                if next_node is not None and next_node.value < end.value:
+                    while True:
+                        end, next_node = next_node, next_node._next_node
+                        if next_node is None or not next_node.value < end.value:
+                            break
+                    # Strictly decreasing, so reversing the run can't reorder equal values.
+                    previous, current = None, node
+                    while current is not next_node:
+                        current._next_node, previous, current = previous, current, current._next_node
+                    runs.append(previous)
                 else:
-                    previous.next_node = right
-                    right = right.next_node
-                    previous = previous.next_node
-                    previous.next_node = left
-
-
+                    while next_node is not None and not next_node.value < end.value:
+                        end, next_node = next_node, next_node._next_node
+                    end._next_node = None
+                    runs.append(node)
+                node = next_node
+
+            while len(runs) > 1:
+                for i in range(0, len(runs) - 1, 2):
+                    left, right = runs[i], runs[i + 1]
+                    runs[i] = runs[i + 1] = anchor._next_node = None
+                    _merge(anchor, left, right)
+                    runs[i] = anchor._next_node
+                    anchor._next_node = None
+                runs = [run for run in runs if run is not None]
+        except BaseException:
+            # A comparison failed.  Join the runs and whatever was being worked on back into one chain.
+            runs.extend([anchor._next_node, node])
+            self._head = _join(runs)
+            raise
+
+        self._head = runs[0]
 
     def __len__(self):
-        count = 0
-        node = self.head
-        while node:
-            count += 1
-            node = node.next_node
-        return count
+        return self._length
 
     def __iter__(self):
         node = self.head
         while node:
             yield node.value
-            node = node.next_node
+            node = node._next_node
 
     def __contains__(self, value):
+        if self._index is not None:
+            try:
+                return value in self._index
+            except TypeError:
+                pass
         for v in self:
             if v == value:
                 return True
         return False
 
+    def map(self, function):
+        """Returns a view which applies the function to each value of this list as it is iterated over."""
+        return MapView(self, function)
+
+    def filter(self, predicate):
+        """Returns a view over the values of this list for which the predicate is true."""
+        return FilterView(self, predicate)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__class__(self.get_many(range(*index.indices(self._length))))
+        return self._get(self._normalize_index(index)).value
+
+    def __setitem__(self, index, value):
+        if not isinstance(index, slice):
+            node = self._get(self._normalize_index(index))
+            if self._index is not None:
+                hash(value)
+                self._index_discard(node)
+                node.value = value
+                self._index_add(node, first=node is self._head, last=node is self._tail)
+            else:
+                node.value = value
+            return
+
+        positions = range(*index.indices(self._length))
+        values = list(value)
+        if self._index is not None:
+            # Check the new values up front, so an unhashable one can't leave the index half updated.
+            for v in values:
+                hash(v)
+        if index.step is None or index.step == 1:
+            # A contiguous slice can change size, so drop the old nodes and splice in a fresh chain.
+            self.pop_many(positions)
+            head, tail, length = _build_chain(values, self._make_node)
+            if not length:
+                return
+            start = positions.start
+            if start:
+                previous = self._head
+                for _ in range(start - 1):
+                    previous = previous._next_node
+                tail._next_node = previous._next_node
+                previous._next_node = head
+            else:
+                tail._next_node = self._head
+                self._head = head
+            # Relinking in the middle leaves the cached tail and length to be recomputed.
+            self._reset_tail()
+            if self._index is not None:
+                self._rebuild_index()
+        else:
+            if len(values) != len(positions):
+                raise ValueError("attempt to assign sequence of size {} to extended slice of size {}".format(
+                    len(values), len(positions)))
+            assignments = dict(zip(positions, values))
+            node = self._head
+            current = 0
+            for position in sorted(assignments):
+                while current < position:
+                    node = node._next_node
+                    current += 1
+                node.value = assignments[position]
+            if self._index is not None:
+                self._rebuild_index()
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            self.pop_many(range(*index.indices(self._length)))
+        else:
+            self.pop_many([index])
+
     def __add__(self, other):
         if isinstance(other, Iterable):
-            return LinkedList([value for value in self] + [value for value in other])
+            return self.__class__(chain(self, other))
         raise ValueError("Can only concatenate a LinkedList with another Iterable container-type.")
 
     def __radd__(self, other):
         return self.__add__(other)
 
     def __iadd__(self, other):
-        return self.__add__(other)
+        if isinstance(other, Iterable):
+            self.extend(other)
+            return self
+        raise ValueError("Can only concatenate a LinkedList with another Iterable container-type.")
 
     def __mul__(self, value):
         if isinstance(value, int):
-            return LinkedList([value for value in self]*value)
+            return self.__class__(chain.from_iterable(repeat(self, value)))
         raise ValueError("Multiplication with a LinkedList is only supported for integers")
 
     def __rmul__(self, value):
         return self.__mul__(value)
 
     def __imul__(self, value):
-        return self.__mul__(value)
+        if not isinstance(value, int):
+            raise ValueError("Multiplication with a LinkedList is only supported for integers")
+        if value <= 0:
+            node, _, _ = self._detach()
+            if self._pool is not None:
+                while node:
+                    following = node._next_node
+                    self._pool.release(node)
+                    node = following
+        else:
+            # The existing nodes stay put and only the copies are new.  extend builds its chain before attaching
+            # it, so repeating the list itself is safe.
+            self.extend(chain.from_iterable(repeat(self, value - 1)))
+        return self
+
+    def __reduce__(self):
+        # Pickle the values as one flat list rather than as a chain of nested node records, which would recurse
+        # once per node.  Any node pool is not carried over.
+        if self._index is not None:
+            return self.__class__, (list(self), None, None, True)
+        return self.__class__, (list(self),)
 
     def __repr__(self):
         current_node = self.head
-        out = 'LinkedList('
+        out = self.__class__.__name__ + '('
         while current_node:
             out += str(current_node.value) + ', '
-            current_node = current_node.next_node
+            current_node = current_node._next_node
         out += ')'
         return out
 
 
-def _merge_sort_recursive(node, length):
-    if length in [0, 1]:
+class DoublyLinkedListNode(LinkedListNode):
+    """A node for use in doubly linked lists.
+
+    In addition to the forward pointer of a LinkedListNode, this node holds a reference to the node before it.
+
+    Attributes
+    ----------
+    value : Any
+        The data this node holds.
+    """
+    __slots__ = ('_prev_node',)
+
+    def __init__(self, value):
+        """The constructor for the DoublyLinkedListNode.
+
+        Parameters
+        ----------
+        value : Any
+           The data this node will hold after initialization.
+        """
+        super().__init__(value)
+        self._prev_node = None
+
+    @property
+    def next_node(self):
+        """A reference to the next node in the linked list, if one exists."""
+        return self._next_node
+
+    @next_node.setter
+    def next_node(self, new_node):
+        if isinstance(new_node, DoublyLinkedListNode) or new_node is None:
+            self._next_node = new_node
+        else:
+            raise TypeError("The {0}.next_node must also be an instance of {0}".format(DoublyLinkedListNode))
+
+    @property
+    def prev_node(self):
+        """A reference to the previous node in the linked list, if one exists."""
+        return self._prev_node
+
+    @prev_node.setter
+    def prev_node(self, new_node):
+        """Sets the value of the this node's previous node pointer.
+
+        Parameters
+        ----------
+        new_node : Optional[DoublyLinkedListNode]
+            The new node to point this node back at.
+
+        Raises
+        ------
+        TypeError :
+            If the new_node is not a DoublyLinkedListNode or None.
+        """
+        if isinstance(new_node, DoublyLinkedListNode) or new_node is None:
+            self._prev_node = new_node
+        else:
+            raise TypeError("The {0}.prev_node must also be an instance of {0}".format(DoublyLinkedListNode))
+
+    def _reset(self):
+        super()._reset()
+        self._prev_node = None
+
+    def __repr__(self):
+        """Returns the 'official' string representation of this node."""
+        prev_node = "DoublyLinkedListNode({})".format(self.prev_node.value) if self.prev_node else None
+        next_node = "DoublyLinkedListNode({})".format(self.next_node.value) if self.next_node else None
+        return "DoublyLinkedListNode(value={}, prev_node={}, next_node={})".format(self.value, prev_node, next_node)
+
+
+class DoublyLinkedList(LinkedList):
+    """A doubly linked list.
+
+    Both ends of the list are reachable in O(1), so this doubles as a deque: `append`, `appendleft`, `pop` and
+    `popleft` are all constant time, and positional access walks in from whichever end is closer.
+
+    Note that, like `collections.deque`, `pop()` with no index removes from the right end of the list.
+    """
+    _node_class = DoublyLinkedListNode
+
+    def __init__(self, values=(), pool=None, pool_size=None, indexed=False):
+        """The constructor for this DoublyLinkedList
+
+        Parameters
+        ----------
+        values : Optional[Sequence]
+            A list, tuple, or set of values to initialize this DoublyLinkedList with.
+        pool : Optional[NodePool]
+            A pool of spare DoublyLinkedListNodes, possibly shared with other lists.
+        pool_size : Optional[int]
+            If given, a private NodePool holding at most this many spare nodes is created for this list.
+        indexed : bool
+            If True, the list keeps a value index for O(1) membership tests and counts.
+        """
+        super().__init__(values, pool, pool_size, indexed)
+        self._link_previous(None, self._head)
+
+    def _link_previous(self, previous, node):
+        """Walks forward from node, pointing each node back at the one before it."""
+        while node:
+            node._prev_node = previous
+            previous, node = node, node._next_node
+
+    def _reset_tail(self):
+        # The forward links are the source of truth after a head assignment or a sort, so rebuild the back links too.
+        super()._reset_tail()
+        self._link_previous(None, self._head)
+
+    def _get(self, index):
+        """This is a 'private' method for getting the DoublyLinkedListNode at a particular index."""
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+        if index >= self._length or index < 0:
+            raise IndexError("Valid indices are in the range 0:{}, inclusive. "
+                             "You requested {}".format(self._length - 1, index))
+
+        # Walk from whichever of the head, the tail and the finger is closest.
+        from_tail = self._length - 1 - index
+        if self._finger_node is not None and abs(index - self._finger_index) < min(index, from_tail):
+            node = self._finger_node
+            if index >= self._finger_index:
+                for i in range(index - self._finger_index):
+                    node = node._next_node
+            else:
+                for i in range(self._finger_index - index):
+                    node = node._prev_node
+        elif index <= from_tail:
+            node = self._head
+            for i in range(index):
+                node = node._next_node
+        else:
+            node = self._tail
+            for i in range(from_tail):
+                node = node._prev_node
+
+        self._finger_index = index
+        self._finger_node = node
+        return node
+
+    def insert(self, index, value):
+        """Inserts a value at the given index into the linked list.
+
+        Parameters
+        ----------
+        index : int
+            The index to construct the new node at.
+        value : Any
+            The value to construct the new node with.
+
+        Raises
+        ------
+        IndexError :
+            If the given index is not an integer or is outside the range of the linked list indices [0 to len(self)]
+        """
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+
+        if index == self._length:
+            new_node = self._make_node(value)
+            if self._index is not None:
+                self._index_add(new_node, first=not index, last=True)
+            if self._tail is None:
+                self._head = new_node
+            else:
+                self._tail._next_node = new_node
+                new_node._prev_node = self._tail
+            self._tail = new_node
+        elif not index:
+            new_node = self._make_node(value)
+            if self._index is not None:
+                self._index_add(new_node, first=True)
+            new_node._next_node = self._head
+            self._head._prev_node = new_node
+            self._head = new_node
+            self._finger_index += 1
+        else:
+            # Link the new node in front of whatever currently sits at the index.
+            following = self._get(index)
+            new_node = self._make_node(value)
+            if self._index is not None:
+                self._index_add(new_node)
+            new_node._prev_node = following._prev_node
+            new_node._next_node = following
+            following._prev_node._next_node = new_node
+            following._prev_node = new_node
+            # The finger is on the node which was just pushed up a place.
+            self._finger_index += 1
+        self._length += 1
+
+    def _unlink(self, previous, node):
+        super()._unlink(previous, node)
+        if node._next_node is not None:
+            node._next_node._prev_node = previous
+        node._prev_node = node._next_node = None
+
+    def appendleft(self, value):
+        """Prepends a value to the front of the list
+
+        Parameters
+        ----------
+        value : Any
+            Value to prepend
+        """
+        self.insert(0, value)
+
+    def pop(self, index=None):
+        """Removes a node at the given index and returns its value.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node to be removed.  Defaults to the last node in the list.
+
+        Raises
+        ------
+        IndexError :
+            If the given index is not an integer or is outside the range of the linked list indices [0 to len(self)]
+        """
+        if index is None:
+            index = self._length - 1
+        node = self._get(index)
+
+        if node._prev_node:
+            node._prev_node._next_node = node._next_node
+        else:
+            self._head = node._next_node
+        if node._next_node:
+            node._next_node._prev_node = node._prev_node
+        else:
+            self._tail = node._prev_node
+
+        # The finger is on the popped node, so step it back to the one before.
+        self._finger_node = node._prev_node
+        self._finger_index = index - 1
+        node._prev_node = node._next_node = None
+        self._length -= 1
+        value = node.value
+        self._release(node)
+        return value
+
+    def popleft(self):
+        """Removes the first node in the list and returns its value."""
+        return self.pop(0)
+
+    def reverse(self):
+        """Reverses the order of the nodes in place."""
+        node = self._head
+        while node:
+            node._next_node, node._prev_node = node._prev_node, node._next_node
+            # The old next node is now the previous one.
+            node = node._prev_node
+        self._head, self._tail = self._tail, self._head
+        self._finger_node = None
+        self._index_reordered()
+
+    def _attach(self, head, tail, length):
+        if length:
+            head._prev_node = self._tail
+        super()._attach(head, tail, length)
+
+    def split_at(self, index):
+        rest = super().split_at(index)
+        if rest._head is not None:
+            rest._head._prev_node = None
+        return rest
+
+    def rotate(self, steps=1):
+        old_head, old_tail = self._head, self._tail
+        super().rotate(steps)
+        if self._head is not old_head:
+            old_head._prev_node = old_tail
+            self._head._prev_node = None
+
+    def extend(self, other):
+        """Appends the given iterable to the current DoublyLinkedList in place."""
+        old_tail = self._tail
+        super().extend(other)
+        if old_tail is None:
+            self._link_previous(None, self._head)
+        else:
+            self._link_previous(old_tail, old_tail._next_node)
+
+    def __reversed__(self):
+        node = self._tail
+        while node:
+            yield node.value
+            node = node._prev_node
+
+
+class LazyLinkedList(LinkedList):
+    """A singly linked list whose nodes are created from a source iterator only as they're needed.
+
+    Iteration, membership tests, `index` and non-negative positional access pull just enough values from the
+    source to answer the request.  Anything that needs the whole list (`len`, negative indices, slices, `append`,
+    `reverse`, `sorted`, ...) materializes the rest of the source first.
+    """
+    def __init__(self, values=()):
+        """The constructor for this LazyLinkedList
+
+        Parameters
+        ----------
+        values : Iterable
+            The source of values for this list.  It is not consumed until the values are needed.
+        """
+        super().__init__()
+        if isinstance(values, Iterable):
+            self._source = iter(values)
+        else:
+            raise TypeError("{} object is not iterable".format(values))
+
+    def _pull(self):
+        """Creates a node for the next source value and links it at the tail, returning it if there was one."""
+        if self._source is None:
+            return None
+        try:
+            value = next(self._source)
+        except StopIteration:
+            self._source = None
+            return None
+        node = self._make_node(value)
+        if self._tail is None:
+            self._head = node
+        else:
+            self._tail._next_node = node
+        self._tail = node
+        self._length += 1
         return node
 
-    left_head = node
-    for _ in range(length//2 + length % 2 - 1):
-        node = node.next_node
+    def _materialize(self, length=None):
+        """Pulls from the source until at least `length` nodes exist, or until it runs dry if length is None."""
+        while self._source is not None and (length is None or self._length < length):
+            self._pull()
+
+    def _materialize_index(self, index):
+        if isinstance(index, int) and index >= 0:
+            self._materialize(index + 1)
+        else:
+            self._materialize()
+
+    @property
+    def head(self):
+        """A reference to the first node in this linked list, if one exists."""
+        self._materialize(1)
+        return self._head
 
-    right_head = node.next_node
-    node.next_node = None
+    @head.setter
+    def head(self, new_node):
+        self._materialize()
+        LinkedList.head.fset(self, new_node)
 
-    left = _merge_sort_recursive(left_head, length - length//2)
-    right = _merge_sort_recursive(right_head, length//2)
+    @property
+    def tail(self):
+        """A reference to the last node in this linked list, if one exists."""
+        self._materialize()
+        return self._tail
 
-    return _sorted_merge(left, right)
+    @property
+    def materialized(self):
+        """The number of nodes created so far."""
+        return self._length
 
+    def _get(self, index):
+        self._materialize_index(index)
+        return super()._get(index)
 
-def _sorted_merge(left, right):
+    def _normalize_index(self, index):
+        self._materialize_index(index)
+        return super()._normalize_index(index)
 
-    if not left:
-        return right
-    if not right:
-        return left
+    def insert(self, index, value):
+        # Inserting at the materialized length links the node ahead of everything still in the source.
+        if isinstance(index, int):
+            self._materialize(index)
+        super().insert(index, value)
 
-    if left <= right:
-        result = left
-        result.next_node = _sorted_merge(left.next_node, right)
-    else:
-        result = right
-        result.next_node = _sorted_merge(left, right.next_node)
+    def append(self, value):
+        self._materialize()
+        super().append(value)
 
-    return result
+    def pop(self, index=None):
+        self._materialize_index(0 if index is None else index)
+        return super().pop(index)
 
+    def reverse(self):
+        self._materialize()
+        super().reverse()
 
+    def extend(self, other):
+        self._materialize()
+        super().extend(other)
 
+    def _detach(self):
+        self._materialize()
+        return super()._detach()
 
+    def _check_sorted(self, other, assume_sorted):
+        self._materialize()
+        return super()._check_sorted(other, assume_sorted)
 
+    def dedupe(self):
+        self._materialize()
+        super().dedupe()
 
+    def splice(self, other):
+        self._materialize()
+        super().splice(other)
+
+    def split_at(self, index):
+        self._materialize()
+        return super().split_at(index)
+
+    def rotate(self, steps=1):
+        self._materialize()
+        super().rotate(steps)
+
+    def __imul__(self, value):
+        self._materialize()
+        return super().__imul__(value)
+
+    def sorted(self, method='bubble_sort', key=None, reverse=False):
+        self._materialize()
+        super().sorted(method, key, reverse)
+
+    def to_array(self, typecode='d'):
+        self._materialize()
+        return super().to_array(typecode)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            self._materialize()
+        return super().__getitem__(index)
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            self._materialize()
+        super().__setitem__(index, value)
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            self._materialize()
+        super().__delitem__(index)
+
+    def __len__(self):
+        self._materialize()
+        return self._length
+
+    def __bool__(self):
+        return self._head is not None or self._pull() is not None
+
+    def __iter__(self):
+        previous = None
+        while True:
+            node = self._head if previous is None else previous._next_node
+            if node is None:
+                if self._pull() is None:
+                    return
+                continue
+            yield node.value
+            previous = node
 
+    def __repr__(self):
+        self._materialize()
+        return super().__repr__()
+
+
+class MapView:
+    """A lazy view which applies a function to each value of an underlying iterable as it is iterated over.
+
+    No values are copied or stored, so the view reflects later changes to the underlying list.
+    """
+    def __init__(self, source, function):
+        self._source = source
+        self._function = function
+
+    def map(self, function):
+        """Returns a view which applies the function to each value of this view."""
+        return MapView(self, function)
+
+    def filter(self, predicate):
+        """Returns a view over the values of this view for which the predicate is true."""
+        return FilterView(self, predicate)
+
+    def __iter__(self):
+        function = self._function
+        for value in self._source:
+            yield function(value)
+
+    def __len__(self):
+        return len(self._source)
+
+    def __getitem__(self, index):
+        return self._function(self._source[index])
+
+    def __repr__(self):
+        return "MapView({!r}, {!r})".format(self._source, self._function)
+
+
+class FilterView:
+    """A lazy view over the values of an underlying iterable for which a predicate is true.
+
+    No values are copied or stored, so the view reflects later changes to the underlying list.
+    """
+    def __init__(self, source, predicate):
+        self._source = source
+        self._predicate = predicate
+
+    def map(self, function):
+        """Returns a view which applies the function to each value of this view."""
+        return MapView(self, function)
+
+    def filter(self, predicate):
+        """Returns a view over the values of this view for which the predicate is true."""
+        return FilterView(self, predicate)
+
+    def __iter__(self):
+        predicate = self._predicate
+        for value in self._source:
+            if predicate(value):
+                yield value
+
+    def __repr__(self):
+        return "FilterView({!r}, {!r})".format(self._source, self._predicate)
+
+
+def merge_sorted(*lists, key=None, lazy=False):
+    """Merges any number of sorted linked lists into one sorted linked list in O(N log K).
+
+    The lists are merged through a heap holding the current node of each list.  Ties go to the list given first,
+    and each list's own order is kept, so the merge is stable.  Each list must already be sorted by the same key.
+    If the key function or a comparison raises, the lists are put back as they were before the error propagates.
+
+    Parameters
+    ----------
+    lists : LinkedList
+        The sorted lists to merge.  By default their nodes are relinked into the result and the lists are left
+        empty.  They must all use the same kind of node.
+    key : Optional[Callable]
+        A function of one argument used to extract a comparison key from each value.  It is called exactly once per
+        node.
+    lazy : bool
+        If True, leave the lists alone and return an iterator over the merged values instead.  Any sorted
+        iterables may then be merged.
+
+    Returns
+    -------
+    LinkedList :
+        A list of the same type as the first list holding every node of every list, or an iterator over the merged
+        values if `lazy` is True.
+
+    Raises
+    ------
+    TypeError :
+        If the lists aren't all linked lists using the same kind of node.
+    ValueError :
+        If the same list is given more than once.
+    """
+    if lazy:
+        return heapq.merge(*lists, key=key)
+    if not lists:
+        return LinkedList()
+    for ll in lists:
+        if not isinstance(ll, LinkedList) or ll._node_class is not lists[0]._node_class:
+            raise TypeError("Can only merge linked lists which all use the same kind of node.")
+    if len({id(ll) for ll in lists}) != len(lists):
+        raise ValueError("Cannot merge a list with itself.")
+
+    # The head keys are taken, and compared by heapify, before any list is emptied, so a failing key leaves the
+    # lists untouched.
+    heap = []
+    for position, ll in enumerate(lists):
+        head = ll.head
+        if head is not None:
+            heap.append(_HeapEntry(head.value if key is None else key(head.value), position, head))
+    heapq.heapify(heap)
+    chains = [ll._detach() for ll in lists]
+
+    head = tail = None
+    # Links overwritten while joining nodes from different lists, so that the lists can be put back on failure.
+    relinked = []
+    try:
+        while len(heap) > 1:
+            entry = heap[0]
+            node = entry.node
+            following = node._next_node
+            if following is None:
+                heapq.heappop(heap)
+            else:
+                # Reuse the entry for the list's next node.
+                entry.key = following.value if key is None else key(following.value)
+                entry.node = following
+                heapq.heapreplace(heap, entry)
+            if tail is None:
+                head = node
+            elif tail._next_node is not node:
+                relinked.append((tail, tail._next_node))
+                tail._next_node = node
+            tail = node
+    except BaseException:
+        for node, following in reversed(relinked):
+            node._next_node = following
+        for ll, detached in zip(lists, chains):
+            ll._attach(*detached)
+        raise
+    if heap:
+        # Only one list is left, so the rest of it can be linked on in one go.
+        node = heap[0].node
+        if tail is None:
+            head = node
+        else:
+            tail._next_node = node
+
+    merged = lists[0]._from_chain(None, None, 0)
+    merged._adopt(head)
+    return merged
+
+
+class _HeapEntry:
+    """The current node of one list in a k-way merge, ordered by key and then by the list's position."""
+    __slots__ = ('key', 'position', 'node')
+
+    def __init__(self, key, position, node):
+        self.key = key
+        self.position = position
+        self.node = node
+
+    def __lt__(self, other):
+        # Only `<` is used on the keys, like every other sort here, since `==` may disagree with the ordering.
+        if self.key < other.key:
+            return True
+        return not other.key < self.key and self.position < other.position
+
+
+class _ChainAnchor:
+    """A stand-in for the node before a chain's head, so that a merge can link its first node like any other."""
+    __slots__ = ('_next_node',)
+
+    def __init__(self):
+        self._next_node = None
+
+
+class _KeyedValue:
+    """Pairs a value with its precomputed sort key, and orders by the key alone."""
+    __slots__ = ('key', 'value')
+
+    def __init__(self, key, value):
+        self.key = key
+        self.value = value
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __gt__(self, other):
+        return self.key > other.key
+
+    def __ge__(self, other):
+        return self.key >= other.key
+
+
+def _build_chain(values, make_node=LinkedListNode):
+    """Builds a detached chain of nodes from an iterable in a single pass.
+
+    Only the forward links are set; callers building doubly linked chains fix up the back links themselves.
+
+    Returns
+    -------
+    Tuple[Optional[LinkedListNode], Optional[LinkedListNode], int] :
+        The head and tail of the new chain and the number of nodes in it.
+    """
+    head = tail = None
+    length = 0
+    for v in values:
+        node = make_node(v)
+        if tail is None:
+            head = node
+        else:
+            tail._next_node = node
+        tail = node
+        length += 1
+    return head, tail, length
+
+
+def _counting_sorted(values, reverse=False):
+    """Sorts a list of plain ints with many repeats by counting each distinct value.
+
+    Returns
+    -------
+    Optional[Iterator[int]] :
+        The values in sorted order, or None if they aren't all ints or have too few repeats for counting to pay off.
+    """
+    # Equal ints are interchangeable, which makes rebuilding from counts stable.  Other equal values, like 1 and
+    # 1.0, are not.
+    if set(map(type, values)) != {int}:
+        return None
+    # The distinct values in a prefix are a lower bound on those in the whole list, so counting the first quarter
+    # rules most unsuitable lists out at a quarter of the cost.
+    prefix = len(values) // 4
+    counts = Counter(islice(values, prefix))
+    if len(counts) * _AUTO_COUNTING_SORT_RATIO > len(values):
+        return None
+    counts.update(islice(values, prefix, None))
+    if len(counts) * _AUTO_COUNTING_SORT_RATIO > len(values):
+        return None
+    return chain.from_iterable(repeat(value, counts[value]) for value in sorted(counts, reverse=reverse))
+
+
+def _cut(node, length):
+    """Detaches the chain starting at node after `length` nodes and returns the remainder, if any."""
+    if node is None:
+        return None
+    for _ in range(length - 1):
+        node = node._next_node
+        if node is None:
+            return None
+    rest = node._next_node
+    node._next_node = None
+    return rest
+
+
+def _merge(tail, left, right):
+    """Links the merge of two sorted, detached chains on after tail, preferring the left chain on ties.
+
+    If a comparison raises, the nodes not yet merged are linked on after the merged ones before the error
+    propagates, so that no node is lost.
+
+    Returns
+    -------
+    LinkedListNode :
+        The tail of the merged chain.
+    """
+    try:
+        while left is not None and right is not None:
+            if right.value < left.value:
+                tail._next_node = right
+                tail, right = right, right._next_node
+            else:
+                tail._next_node = left
+                tail, left = left, left._next_node
+    except BaseException:
+        # The last merged node still links into the chain it came from, so cut it before joining.
+        tail._next_node = None
+        _join([tail, left, right])
+        raise
+
+    tail._next_node = left if left is not None else right
+    while tail._next_node is not None:
+        tail = tail._next_node
+    return tail
+
+
+def _join(heads):
+    """Links detached chains end to end, skipping empty ones, and returns the head of the result."""
+    head = tail = None
+    for node in heads:
+        if node is None:
+            continue
+        if tail is None:
+            head = node
+        else:
+            tail._next_node = node
+        tail = node
+        while tail._next_node is not None:
+            tail = tail._next_node
+    return head
@@ -0,0 +1,171 @@
+"""An immutable, structurally shared linked list."""
+from typing import Iterable
+
+from .linked_list import LinkedListNode, LinkedList, _build_chain
+
+
+class PersistentLinkedListNode(LinkedListNode):
+    """A node for use in persistent linked lists.
+
+    Persistent lists share their nodes between versions, so once a node is part of a list its link can't change.
+
+    Attributes
+    ----------
+    value : Any
+        The data this node holds.
+    """
+    __slots__ = ()
+
+    @property
+    def next_node(self):
+        """A reference to the next node in the list, if one exists.  Unlike a LinkedListNode this is read only."""
+        return self._next_node
+
+    def __repr__(self):
+        """Returns the 'official' string representation of this node."""
+        if self.next_node:
+            return "PersistentLinkedListNode(value={}, next_node=PersistentLinkedListNode({}))".format(
+                self.value, self.next_node.value)
+        else:
+            return "PersistentLinkedListNode(value={}, next_node=None)".format(self.value)
+
+
+class PersistentLinkedList:
+    """An immutable singly linked list (a cons list) whose versions share structure.
+
+    Every operation returns a new list and leaves the original untouched.  Because nodes are never modified,
+    `prepend` and `tail` are O(1), `drop(k)` is O(k), and `concat` only copies the nodes of the left hand list, with
+    the result sharing every node of the right hand one.  Taking a snapshot is simply keeping a reference.
+    """
+    __slots__ = ('_head', '_length')
+
+    def __init__(self, values=()):
+        """The constructor for this PersistentLinkedList
+
+        Parameters
+        ----------
+        values : Optional[Sequence]
+            A list, tuple, or set of values to initialize this PersistentLinkedList with.
+        """
+        if isinstance(values, Iterable):
+            self._head, _, self._length = _build_chain(values, PersistentLinkedListNode)
+        else:
+            raise TypeError("{} object is not iterable".format(values))
+
+    @classmethod
+    def _from_node(cls, head, length):
+        """Wraps an existing chain of nodes, which may be shared with other lists, in a new list."""
+        new_list = cls.__new__(cls)
+        new_list._head = head
+        new_list._length = length
+        return new_list
+
+    @property
+    def head(self):
+        """A reference to the first node in this list, if one exists."""
+        return self._head
+
+    @property
+    def first(self):
+        """The first value in this list.
+
+        Raises
+        ------
+        IndexError :
+            If the list is empty.
+        """
+        if self._head is None:
+            raise IndexError("An empty PersistentLinkedList has no first value.")
+        return self._head.value
+
+    @property
+    def tail(self):
+        """A list of every value but the first, sharing all of this list's remaining nodes.
+
+        Raises
+        ------
+        IndexError :
+            If the list is empty.
+        """
+        if self._head is None:
+            raise IndexError("An empty PersistentLinkedList has no tail.")
+        return self._from_node(self._head._next_node, self._length - 1)
+
+    def prepend(self, value):
+        """Returns a new list with the value in front of this list's values, sharing all of this list's nodes."""
+        node = PersistentLinkedListNode(value)
+        node._next_node = self._head
+        return self._from_node(node, self._length + 1)
+
+    def drop(self, count):
+        """Returns a new list without the first `count` values, sharing the rest of this list's nodes.
+
+        Raises
+        ------
+        ValueError :
+            If count is negative.
+        """
+        if count < 0:
+            raise ValueError("Cannot drop a negative number of values.")
+        if count >= self._length:
+            return self._from_node(None, 0)
+        node = self._head
+        for _ in range(count):
+            node = node._next_node
+        return self._from_node(node, self._length - count)
+
+    def concat(self, other):
+        """Returns a new list with the values of this list followed by those of the other.
+
+        Only this list's nodes are copied.  If the other list is a PersistentLinkedList its nodes are shared,
+        otherwise its values are copied into new nodes.
+        """
+        if not isinstance(other, PersistentLinkedList):
+            other = PersistentLinkedList(other)
+        if self._head is None:
+            return other
+        head, tail, length = _build_chain(self, PersistentLinkedListNode)
+        tail._next_node = other._head
+        return self._from_node(head, length + other._length)
+
+    def to_linked_list(self, list_type=LinkedList):
+        """Copies the values of this list into a new, mutable linked list."""
+        return list_type(self)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        node = self._head
+        while node:
+            yield node.value
+            node = node._next_node
+
+    def __contains__(self, value):
+        for v in self:
+            if v == value:
+                return True
+        return False
+
+    def __getitem__(self, index):
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+        normalized = index + self._length if index < 0 else index
+        if normalized >= self._length or normalized < 0:
+            raise IndexError("Valid indices are in the range {}:{}, inclusive. "
+                             "You requested {}".format(-self._length, self._length - 1, index))
+        node = self._head
+        for _ in range(normalized):
+            node = node._next_node
+        return node.value
+
+    def __add__(self, other):
+        if isinstance(other, Iterable):
+            return self.concat(other)
+        raise ValueError("Can only concatenate a PersistentLinkedList with another Iterable container-type.")
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __repr__(self):
+        return 'PersistentLinkedList(' + ''.join(str(value) + ', ' for value in self) + ')'
@@ -0,0 +1,308 @@
+"""An indexable skip list, which keeps its values in sorted order."""
+from typing import Iterable
+import random
+
+from .linked_list import LinkedListNode
+
+
+class SkipListNode(LinkedListNode):
+    """A node for use in skip lists.
+
+    On top of the ordinary `next_node` pointer, which links every node of the skip list in order, a skip list node
+    holds a tower of express lane pointers.  `_forward[level]` is the next node at least as tall as `level + 1`, and
+    `_width[level]` is the number of bottom level links that pointer skips over.
+
+    Attributes
+    ----------
+    value : Any
+        The data this node holds.
+    """
+    __slots__ = ('_forward', '_width')
+
+    def __init__(self, value, level=1):
+        """The constructor for the SkipListNode.
+
+        Parameters
+        ----------
+        value : Any
+           The data this node will hold after initialization.
+        level : int
+           The number of lanes this node takes part in.
+        """
+        super().__init__(value)
+        self._forward = [None] * level
+        self._width = [1] * level
+
+    @property
+    def next_node(self):
+        """A reference to the next node in the skip list, if one exists.
+
+        The skip list keeps its nodes in sorted order, so unlike a LinkedListNode this pointer is read only.
+        """
+        return self._next_node
+
+    @property
+    def level(self):
+        """The number of lanes this node takes part in."""
+        return len(self._forward)
+
+    def __repr__(self):
+        """Returns the 'official' string representation of this node."""
+        if self.next_node:
+            return "SkipListNode(value={}, level={}, next_node=SkipListNode({}))".format(
+                self.value, self.level, self.next_node.value)
+        else:
+            return "SkipListNode(value={}, level={}, next_node=None)".format(self.value, self.level)
+
+
+class SkipList:
+    """A sorted sequence backed by an indexable skip list.
+
+    Adding, removing, membership tests, `index(value)`, `count(value)` and positional access all take O(log n)
+    expected time, while iteration walks the bottom lane in sorted order like an ordinary linked list.  Equal values
+    are kept in the order they were added.
+    """
+    max_level = 32
+
+    def __init__(self, values=()):
+        """The constructor for this SkipList
+
+        Parameters
+        ----------
+        values : Optional[Sequence]
+            A list, tuple, or set of values to initialize this SkipList with.  They need not be sorted.
+        """
+        # The head is a sentinel which sits before the first value in every lane.
+        self._head = SkipListNode(None, self.max_level)
+        self._level = 1
+        self._length = 0
+
+        if isinstance(values, Iterable):
+            self.extend(values)
+        else:
+            raise TypeError("{} object is not iterable".format(values))
+
+    @property
+    def head(self):
+        """A reference to the first node in this skip list, if one exists."""
+        return self._head._forward[0]
+
+    def _random_level(self):
+        level = 1
+        while level < self.max_level and random.random() < 0.5:
+            level += 1
+        return level
+
+    def _find_chain(self, value, after_equal):
+        """Finds, in every lane, the last node before the given value.
+
+        Parameters
+        ----------
+        value : Any
+            The value to search for.
+        after_equal : bool
+            If True, nodes equal to the value count as being before it.
+
+        Returns
+        -------
+        Tuple[List[SkipListNode], List[int]] :
+            The last node before the value in each lane, and the position of each of those nodes counting the head
+            sentinel as position 0.
+        """
+        chain = [self._head] * self._level
+        ranks = [0] * self._level
+        node = self._head
+        rank = 0
+        for level in reversed(range(self._level)):
+            next_node = node._forward[level]
+            if after_equal:
+                while next_node is not None and not value < next_node.value:
+                    rank += node._width[level]
+                    node, next_node = next_node, next_node._forward[level]
+            else:
+                while next_node is not None and next_node.value < value:
+                    rank += node._width[level]
+                    node, next_node = next_node, next_node._forward[level]
+            chain[level] = node
+            ranks[level] = rank
+        return chain, ranks
+
+    def _find_position_chain(self, index):
+        """Finds, in every lane, the last node before the given non-negative index."""
+        chain = [self._head] * self._level
+        node = self._head
+        rank = 0
+        for level in reversed(range(self._level)):
+            while node._forward[level] is not None and rank + node._width[level] <= index:
+                rank += node._width[level]
+                node = node._forward[level]
+            chain[level] = node
+        return chain
+
+    def _normalize_index(self, index):
+        """Converts a possibly negative index into the equivalent non-negative one, checking that it is in range."""
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+        normalized = index + self._length if index < 0 else index
+        if normalized >= self._length or normalized < 0:
+            raise IndexError("Valid indices are in the range {}:{}, inclusive. "
+                             "You requested {}".format(-self._length, self._length - 1, index))
+        return normalized
+
+    def _get(self, index):
+        """This is a 'private' method for getting the SkipListNode at a particular index."""
+        return self._find_position_chain(self._normalize_index(index))[0]._forward[0]
+
+    def add(self, value):
+        """Adds a value to the skip list, after any values equal to it.
+
+        Parameters
+        ----------
+        value : Any
+            The value to add.
+        """
+        level = self._random_level()
+        if level > self._level:
+            # Lanes the head hasn't used yet skip straight past the end of the list.
+            for new_level in range(self._level, level):
+                self._head._forward[new_level] = None
+                self._head._width[new_level] = self._length + 1
+            self._level = level
+
+        chain, ranks = self._find_chain(value, after_equal=True)
+        node = SkipListNode(value, level)
+        rank = ranks[0] + 1
+        for lane in range(level):
+            previous = chain[lane]
+            distance = rank - ranks[lane]
+            node._forward[lane] = previous._forward[lane]
+            node._width[lane] = previous._width[lane] - distance + 1
+            previous._forward[lane] = node
+            previous._width[lane] = distance
+        for lane in range(level, self._level):
+            chain[lane]._width[lane] += 1
+
+        node._next_node = node._forward[0]
+        chain[0]._next_node = node
+        self._length += 1
+
+    def extend(self, values):
+        """Adds every value from the given iterable to the skip list."""
+        if values is self:
+            values = list(values)
+        for value in values:
+            self.add(value)
+
+    def _unlink(self, chain, node):
+        """Removes the node from every lane, given the last node before it in each lane."""
+        for lane in range(self._level):
+            previous = chain[lane]
+            if previous._forward[lane] is node:
+                previous._forward[lane] = node._forward[lane]
+                previous._width[lane] += node._width[lane] - 1
+            else:
+                previous._width[lane] -= 1
+        chain[0]._next_node = chain[0]._forward[0]
+        self._length -= 1
+
+        while self._level > 1 and self._head._forward[self._level - 1] is None:
+            self._level -= 1
+
+    def remove(self, value):
+        """Removes the first node in the skip list whose value is equal to the given value.
+
+        Raises
+        ------
+        ValueError :
+            If the given value is not present in the SkipList
+        """
+        chain, _ = self._find_chain(value, after_equal=False)
+        node = chain[0]._forward[0]
+        if node is None or node.value != value:
+            raise ValueError('{} is not present in the SkipList'.format(value))
+        self._unlink(chain, node)
+
+    def pop(self, index=None):
+        """Removes the node at the given index and returns its value.
+
+        Parameters
+        ----------
+        index : int
+            The index of the node to be removed.  Defaults to the first, smallest, value.
+
+        Raises
+        ------
+        IndexError :
+            If the given index is not an integer or is outside the range of the skip list indices
+        """
+        if index is None:
+            index = 0
+        chain = self._find_position_chain(self._normalize_index(index))
+        node = chain[0]._forward[0]
+        self._unlink(chain, node)
+        return node.value
+
+    def count(self, value):
+        """Counts the number of nodes in the skip list whose value is equal to the given value."""
+        _, first = self._find_chain(value, after_equal=False)
+        _, last = self._find_chain(value, after_equal=True)
+        return last[0] - first[0]
+
+    def index(self, value):
+        """Returns the lowest index of a value in the skip list equal to the given value.
+
+        Raises
+        ------
+        ValueError :
+            If the given value is not present in the SkipList
+        """
+        chain, ranks = self._find_chain(value, after_equal=False)
+        node = chain[0]._forward[0]
+        if node is None or node.value != value:
+            raise ValueError('{} is not present in the SkipList'.format(value))
+        return ranks[0]
+
+    def print_list(self):
+        """Prints out the value of each node in the skip list."""
+        for value in self:
+            print(value)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        node = self._head._forward[0]
+        while node:
+            yield node.value
+            node = node._next_node
+
+    def __contains__(self, value):
+        chain, _ = self._find_chain(value, after_equal=False)
+        node = chain[0]._forward[0]
+        return node is not None and node.value == value
+
+    def __getitem__(self, index):
+        if not isinstance(index, slice):
+            return self._get(index).value
+
+        positions = range(*index.indices(self._length))
+        if not positions:
+            return []
+        ascending = positions if positions.step > 0 else positions[::-1]
+        node = self._get(ascending[0])
+        values = []
+        for _ in range(len(ascending) - 1):
+            values.append(node.value)
+            for _ in range(ascending.step):
+                node = node._next_node
+        values.append(node.value)
+        return values if positions.step > 0 else values[::-1]
+
+    def __delitem__(self, index):
+        self.pop(index)
+
+    def __reduce__(self):
+        return self.__class__, (list(self),)
+
+    def __repr__(self):
+        return 'SkipList(' + ''.join(str(value) + ', ' for value in self) + ')'
@@ -0,0 +1,412 @@
+"""A linked list of machine numbers, stored as parallel arrays of values and integer links."""
+from typing import Iterable
+from array import array
+
+# Marks the absence of a slot, like None does for node references.
+_NO_SLOT = -1
+# Links are stored as 32 bit integers until the list outgrows them.
+_MAX_SHORT_LINK = 2 ** 31 - 1
+
+
+def _link_array(values, size):
+    """Returns an array of slot links wide enough for a list of the given capacity."""
+    return array('i' if size <= _MAX_SHORT_LINK else 'q', values)
+
+
+class TypedLinkedList:
+    """A singly linked list of numbers, stored as a struct of arrays instead of a chain of node objects.
+
+    Values live unboxed in an `array.array` of the given typecode, and each slot's `next` link is the integer slot
+    number of the following value in a parallel array of links.  A value costs its item size plus four bytes for
+    its link, rather than a node object and a boxed number, which for floats is about a sixth of the memory of a
+    LinkedList.  Slots freed by pops are threaded into a free list and reused by later insertions.
+
+    While the list is in physical order (slot i holds position i, as it is after construction, appends, `sorted`
+    or `compact`) positional access, iteration, `count`, `index` and `reverse` run directly on the value array.
+    """
+    def __init__(self, values=(), typecode='d'):
+        """The constructor for this TypedLinkedList
+
+        Parameters
+        ----------
+        values : Optional[Sequence]
+            A list, tuple, array or other iterable of numbers to initialize this TypedLinkedList with.
+        typecode : str
+            The `array.array` typecode the values are stored as, such as 'd' for floats or 'q' for 64 bit integers.
+
+        Raises
+        ------
+        ValueError :
+            If the typecode is not a valid array typecode.
+        """
+        self._values = array(typecode)
+        self._next = _link_array((), 0)
+        self._head = self._tail = _NO_SLOT
+        self._free = _NO_SLOT
+        self._length = 0
+        # True while slots 0 to n - 1 hold the values in list order with no free slots in between.
+        self._sequential = True
+
+        if isinstance(values, Iterable):
+            self.extend(values)
+        else:
+            raise TypeError("{} object is not iterable".format(values))
+
+    @property
+    def typecode(self):
+        """The `array.array` typecode the values are stored as."""
+        return self._values.typecode
+
+    @property
+    def capacity(self):
+        """The number of slots allocated, including free ones waiting to be reused."""
+        return len(self._values)
+
+    @property
+    def nbytes(self):
+        """The number of bytes taken up by the value and link arrays."""
+        return len(self._values) * self._values.itemsize + len(self._next) * self._next.itemsize
+
+    def _reset_storage(self, values):
+        """Replaces the storage with the given array of values, linked in physical order."""
+        size = len(values)
+        self._values = values
+        self._next = _link_array(range(1, size + 1), size)
+        if size:
+            self._next[-1] = _NO_SLOT
+        self._head = 0 if size else _NO_SLOT
+        self._tail = size - 1 if size else _NO_SLOT
+        self._free = _NO_SLOT
+        self._length = size
+        self._sequential = True
+
+    def _allocate(self, value):
+        """Stores a value in a free slot, or a new one if there are none, and returns the slot."""
+        slot = self._free
+        if slot != _NO_SLOT:
+            self._values[slot] = value
+            self._free = self._next[slot]
+            self._next[slot] = _NO_SLOT
+            return slot
+
+        slot = len(self._values)
+        self._values.append(value)
+        if slot == _MAX_SHORT_LINK and self._next.typecode == 'i':
+            self._next = array('q', self._next)
+        self._next.append(_NO_SLOT)
+        return slot
+
+    def _release(self, slot):
+        """Adds a slot which is no longer in the list to the free list."""
+        self._next[slot] = self._free
+        self._free = slot
+
+    def _slot(self, index):
+        """This is a 'private' method for getting the slot holding a particular non-negative index."""
+        if self._sequential:
+            return index
+        if index == self._length - 1:
+            return self._tail
+        links = self._next
+        slot = self._head
+        for i in range(index):
+            slot = links[slot]
+        return slot
+
+    def _normalize_index(self, index):
+        """Converts a possibly negative index into the equivalent non-negative one, checking that it is in range."""
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+        normalized = index + self._length if index < 0 else index
+        if normalized >= self._length or normalized < 0:
+            raise IndexError("Valid indices are in the range {}:{}, inclusive. "
+                             "You requested {}".format(-self._length, self._length - 1, index))
+        return normalized
+
+    def insert(self, index, value):
+        """Inserts a value at the given index into the linked list.
+
+        Parameters
+        ----------
+        index : int
+            The index to insert the new value at.
+        value : Any
+            The value to insert.  It must fit the list's typecode.
+
+        Raises
+        ------
+        IndexError :
+            If the given index is not an integer or is outside the range of the linked list indices [0 to len(self)]
+        """
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+        if index == self._length:
+            self.append(value)
+            return
+        if index > self._length or index < 0:
+            raise IndexError("Valid indices are in the range 0:{}, inclusive. "
+                             "You requested {}".format(self._length, index))
+
+        if index:
+            previous = self._slot(index - 1)
+            slot = self._allocate(value)
+            self._next[slot] = self._next[previous]
+            self._next[previous] = slot
+        else:
+            slot = self._allocate(value)
+            self._next[slot] = self._head
+            self._head = slot
+        self._length += 1
+        self._sequential = False
+
+    def append(self, value):
+        """Appends a value to the end of the list
+
+        Parameters
+        ----------
+        value : Any
+            Value to append.  It must fit the list's typecode.
+        """
+        # With no free slots the new slot is the next physical one, so an ordered list stays ordered.
+        slot = self._allocate(value)
+        if self._tail == _NO_SLOT:
+            self._head = slot
+        else:
+            self._next[self._tail] = slot
+        self._tail = slot
+        self._length += 1
+
+    def pop(self, index=None):
+        """Removes the value at the given index and returns it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the value to be removed.  Defaults to the first value in the list.
+
+        Raises
+        ------
+        IndexError :
+            If the given index is not an integer or is outside the range of the linked list indices
+        """
+        index = self._normalize_index(0 if index is None else index)
+
+        if self._sequential and index == self._length - 1:
+            # Popping the last physical slot just shrinks the arrays.
+            value = self._values.pop()
+            self._next.pop()
+            self._length -= 1
+            self._tail = self._length - 1 if self._length else _NO_SLOT
+            if self._length:
+                self._next[self._tail] = _NO_SLOT
+            else:
+                self._head = _NO_SLOT
+            return value
+
+        if index:
+            previous = self._slot(index - 1)
+            slot = self._next[previous]
+            self._next[previous] = self._next[slot]
+            if slot == self._tail:
+                self._tail = previous
+        else:
+            slot = self._head
+            self._head = self._next[slot]
+            if slot == self._tail:
+                self._tail = _NO_SLOT
+        value = self._values[slot]
+        self._release(slot)
+        self._length -= 1
+        self._sequential = False
+        if not self._length:
+            # Nothing is left to keep in place, so drop the free slots too.
+            self._reset_storage(array(self.typecode))
+        return value
+
+    def print_list(self):
+        """Prints out each value in the linked list."""
+        for value in self:
+            print(value)
+
+    def reverse(self):
+        """Reverses the order of the values in place."""
+        if self._sequential:
+            self._values.reverse()
+            return
+        links = self._next
+        previous = _NO_SLOT
+        slot = self._head
+        while slot != _NO_SLOT:
+            following = links[slot]
+            links[slot] = previous
+            previous = slot
+            slot = following
+        self._head, self._tail = self._tail, self._head
+
+    def compact(self):
+        """Moves the values into physical list order and drops any free slots.
+
+        Afterwards positional access is O(1) and scans run over the value array directly, until the next insertion
+        or removal away from the end of the list.
+        """
+        if not self._sequential:
+            self._reset_storage(array(self.typecode, self))
+
+    def count(self, value):
+        """Counts the number of values in the list equal to the given value.
+
+        Parameters
+        ----------
+        value : Any
+            The value to check for in the list.
+
+        Returns
+        -------
+        int :
+            The number of values equal to the given value.
+        """
+        if self._sequential:
+            return self._values.count(value)
+        count = 0
+        for v in self:
+            if v == value:
+                count += 1
+        return count
+
+    def index(self, value):
+        """Returns the lowest index of a value in the linked list equal to the given value.
+
+        Parameters
+        ---------
+        value : Any
+            The value we want to find the index of.
+
+        Returns
+        -------
+        int :
+            The lowest zero-based index of the given value in the TypedLinkedList, if present.
+
+        Raises
+        ------
+        ValueError :
+            If the given value is not present in the TypedLinkedList
+        """
+        if self._sequential:
+            try:
+                return self._values.index(value)
+            except ValueError:
+                pass
+        else:
+            for idx, v in enumerate(self):
+                if v == value:
+                    return idx
+        raise ValueError('{} is not present in the TypedLinkedList'.format(value))
+
+    def extend(self, other):
+        """Appends the given iterable to the current TypedLinkedList in place.
+
+        The values are converted to an array in one step, so a value which doesn't fit the typecode leaves the
+        list unchanged.
+        """
+        new_values = array(self.typecode, other)
+        if not self._sequential or self._free != _NO_SLOT:
+            for value in new_values:
+                self.append(value)
+            return
+
+        start = len(self._values)
+        end = start + len(new_values)
+        if start == end:
+            return
+        self._values.extend(new_values)
+        if end > _MAX_SHORT_LINK and self._next.typecode == 'i':
+            self._next = array('q', self._next)
+        self._next.extend(range(start + 1, end + 1))
+        self._next[-1] = _NO_SLOT
+        if self._tail == _NO_SLOT:
+            self._head = start
+        else:
+            self._next[self._tail] = start
+        self._tail = end - 1
+        self._length = end
+
+    def sorted(self, method='merge_sort', key=None, reverse=False):
+        """Sorts the values in place.
+
+        The values are unboxed numbers rather than nodes, so this runs python's stable sort over them and writes
+        the result back in physical order, which also compacts the list.  The `method` names accepted by
+        `LinkedList.sorted` are accepted here for compatibility and all produce the same stable ordering.
+        """
+        if method not in ('bubble_sort', 'insertion_sort', 'merge_sort', 'natural', 'auto'):
+            raise NotImplementedError()
+        self._reset_storage(array(self.typecode, sorted(self, key=key, reverse=reverse)))
+
+    def to_array(self):
+        """Copies the values, in list order, into a new `array.array` of this list's typecode."""
+        if self._sequential:
+            return self._values[:]
+        return array(self.typecode, self)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        if self._sequential:
+            return iter(self._values)
+        return self._iter_links()
+
+    def _iter_links(self):
+        values, links = self._values, self._next
+        slot = self._head
+        while slot != _NO_SLOT:
+            yield values[slot]
+            slot = links[slot]
+
+    def __contains__(self, value):
+        if self._sequential:
+            return value in self._values
+        for v in self:
+            if v == value:
+                return True
+        return False
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self.__class__(self.to_array()[index], self.typecode)
+        return self._values[self._slot(self._normalize_index(index))]
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            # Slices can change the length, so rebuild in physical order.
+            values = self.to_array()
+            values[index] = array(self.typecode, value)
+            self._reset_storage(values)
+        else:
+            self._values[self._slot(self._normalize_index(index))] = value
+
+    def __delitem__(self, index):
+        if isinstance(index, slice):
+            values = self.to_array()
+            del values[index]
+            self._reset_storage(values)
+        else:
+            self.pop(index)
+
+    def __add__(self, other):
+        if isinstance(other, Iterable):
+            result = self.__class__(self.to_array(), self.typecode)
+            result.extend(other)
+            return result
+        raise ValueError("Can only concatenate a TypedLinkedList with another Iterable container-type.")
+
+    def __iadd__(self, other):
+        if isinstance(other, Iterable):
+            self.extend(other)
+            return self
+        raise ValueError("Can only concatenate a TypedLinkedList with another Iterable container-type.")
+
+    def __reduce__(self):
+        return self.__class__, (self.to_array(), self.typecode)
+
+    def __repr__(self):
+        return 'TypedLinkedList(' + ''.join(str(value) + ', ' for value in self) + ')'
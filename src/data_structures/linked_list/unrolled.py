@@ -0,0 +1,347 @@
+"""An unrolled linked list, which stores several values per node."""
+from typing import Iterable
+
+from .linked_list import LinkedListNode
+
+
+class UnrolledLinkedListNode(LinkedListNode):
+    """A node for use in unrolled linked lists.
+
+    The node's value is a python list holding a contiguous chunk of the values in the linked list.
+
+    Attributes
+    ----------
+    value : list
+        The chunk of data this node holds.
+    """
+    __slots__ = ()
+
+    def __init__(self, values=()):
+        """The constructor for the UnrolledLinkedListNode.
+
+        Parameters
+        ----------
+        values : Iterable
+           The values this node's chunk will hold after initialization.
+        """
+        super().__init__(list(values))
+
+    def __repr__(self):
+        """Returns the 'official' string representation of this node."""
+        if self.next_node:
+            return "UnrolledLinkedListNode(value={}, next_node=UnrolledLinkedListNode({}))".format(
+                self.value, self.next_node.value)
+        else:
+            return "UnrolledLinkedListNode(value={}, next_node=None)".format(self.value)
+
+
+class UnrolledLinkedList:
+    """A singly linked list whose nodes each hold a chunk of up to `chunk_size` values.
+
+    Packing several values into each node cuts the per-value memory overhead and the number of pointer hops
+    needed to reach a position by roughly a factor of `chunk_size`.  Chunks are split when an insert overfills
+    them and merged with (or refilled from) their neighbour when a pop leaves them less than half full.
+    """
+    def __init__(self, values=(), chunk_size=16):
+        """The constructor for this UnrolledLinkedList
+
+        Parameters
+        ----------
+        values : Optional[Sequence]
+            A list, tuple, or set of values to initialize this UnrolledLinkedList with.
+        chunk_size : int
+            The maximum number of values stored in a single node.
+
+        Raises
+        ------
+        ValueError :
+            If the chunk size is not a positive integer.
+        """
+        if not isinstance(chunk_size, int) or chunk_size < 1:
+            raise ValueError("The chunk size must be a positive integer, not {}".format(chunk_size))
+
+        self._chunk_size = chunk_size
+        self._head = None
+        self._tail = None
+        self._length = 0
+
+        if isinstance(values, Iterable):
+            self.extend(values)
+        else:
+            raise TypeError("{} object is not iterable".format(values))
+
+    @property
+    def head(self):
+        """A reference to the first node in this linked list, if one exists."""
+        return self._head
+
+    @property
+    def tail(self):
+        """A reference to the last node in this linked list, if one exists."""
+        return self._tail
+
+    @property
+    def chunk_size(self):
+        """The maximum number of values stored in a single node."""
+        return self._chunk_size
+
+    def _locate(self, index):
+        """This is a 'private' method for finding the node holding a particular index.
+
+        Returns
+        -------
+        Tuple[UnrolledLinkedListNode, int] :
+            The node holding the index and the offset of the index within that node's chunk.
+        """
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+        if index >= self._length or index < 0:
+            raise IndexError("Valid indices are in the range 0:{}, inclusive. "
+                             "You requested {}".format(self._length - 1, index))
+
+        tail_start = self._length - len(self._tail.value)
+        if index >= tail_start:
+            # The tail is cached, so the last chunk never needs a walk.
+            return self._tail, index - tail_start
+
+        node = self._head
+        while index >= len(node.value):
+            index -= len(node.value)
+            node = node._next_node
+        return node, index
+
+    def _previous(self, target):
+        """Returns the node immediately preceding the target node."""
+        node = self._head
+        while node._next_node is not target:
+            node = node._next_node
+        return node
+
+    def insert(self, index, value):
+        """Inserts a value at the given index into the linked list.
+
+        Parameters
+        ----------
+        index : int
+            The index to insert the new value at.
+        value : Any
+            The value to insert.
+
+        Raises
+        ------
+        IndexError :
+            If the given index is not an integer or is outside the range of the linked list indices [0 to len(self)]
+        """
+        if not isinstance(index, int):
+            raise IndexError("{} is not a valid index".format(index))
+
+        if index == self._length:
+            self.append(value)
+            return
+
+        node, offset = self._locate(index)
+        node.value.insert(offset, value)
+        self._length += 1
+        if len(node.value) > self._chunk_size:
+            self._split(node)
+
+    def _split(self, node):
+        """Moves the back half of an overfull node's chunk into a new node linked directly after it."""
+        half = len(node.value) // 2
+        new_node = UnrolledLinkedListNode(node.value[half:])
+        del node.value[half:]
+        new_node._next_node = node._next_node
+        node._next_node = new_node
+        if node is self._tail:
+            self._tail = new_node
+
+    def append(self, value):
+        """Appends a value to the end of the list
+
+        Parameters
+        ----------
+        value : Any
+            Value to append
+        """
+        if self._tail is None:
+            self._head = self._tail = UnrolledLinkedListNode()
+        elif len(self._tail.value) >= self._chunk_size:
+            new_node = UnrolledLinkedListNode()
+            self._tail._next_node = new_node
+            self._tail = new_node
+        self._tail.value.append(value)
+        self._length += 1
+
+    def pop(self, index=None):
+        """Removes the value at the given index and returns it.
+
+        Parameters
+        ----------
+        index : int
+            The index of the value to be removed.  Defaults to the first value in the list.
+
+        Raises
+        ------
+        IndexError :
+            If the given index is not an integer or is outside the range of the linked list indices [0 to len(self)]
+        """
+        if index is None:
+            index = 0
+
+        node, offset = self._locate(index)
+        value = node.value.pop(offset)
+        self._length -= 1
+
+        following = node._next_node
+        if following and (not node.value or len(node.value) < self._chunk_size // 2):
+            if len(node.value) + len(following.value) <= self._chunk_size:
+                # Absorb the following node entirely.
+                node.value.extend(following.value)
+                node._next_node = following._next_node
+                if following is self._tail:
+                    self._tail = node
+            else:
+                # Borrow just enough from the following node to get back to half full.
+                borrow = self._chunk_size // 2 - len(node.value)
+                node.value.extend(following.value[:borrow])
+                del following.value[:borrow]
+        elif not node.value:
+            # Only the last node can run dry, since every other node refills from its neighbour.
+            if node is self._head:
+                self._head = self._tail = None
+            else:
+                self._tail = self._previous(node)
+                self._tail._next_node = None
+
+        return value
+
+    def print_list(self):
+        """Prints out each value in the linked list."""
+        for value in self:
+            print(value)
+
+    def reverse(self):
+        """Reverses the order of the values in place."""
+        previous_node = None
+        current_node = self._head
+        while current_node:
+            current_node.value.reverse()
+            temp = current_node._next_node
+            current_node._next_node = previous_node
+            previous_node = current_node
+            current_node = temp
+        self._head, self._tail = self._tail, self._head
+
+    def count(self, value):
+        """Counts the number of values in the list equal to the given value.
+
+        Parameters
+        ----------
+        value : Any
+            The value to check for in the list.
+
+        Returns
+        -------
+        int :
+            The number of values equal to the given value.
+        """
+        count = 0
+        node = self._head
+        while node:
+            count += node.value.count(value)
+            node = node._next_node
+        return count
+
+    def index(self, value):
+        """Returns the lowest index of a value in the linked list equal to the given value.
+
+        Parameters
+        ---------
+        value : Any
+            The value we want to find the index of.
+
+        Returns
+        -------
+        int :
+            The lowest zero-based index of the given value in the UnrolledLinkedList, if present.
+
+        Raises
+        ------
+        ValueError :
+            If the given value is not present in the UnrolledLinkedList
+        """
+        offset = 0
+        node = self._head
+        while node:
+            if value in node.value:
+                return offset + node.value.index(value)
+            offset += len(node.value)
+            node = node._next_node
+        raise ValueError('{} is not present in the UnrolledLinkedList'.format(value))
+
+    def extend(self, other):
+        """Appends the given iterable to the current UnrolledLinkedList in place."""
+        if other is self:
+            other = list(other)
+        for value in other:
+            self.append(value)
+
+    def sorted(self, method='merge_sort', key=None, reverse=False):
+        """Sorts the values in place.
+
+        The values of an unrolled list already sit in contiguous chunks, so rather than relinking nodes this
+        gathers them, runs python's stable sort, and repacks them into full chunks.  The `method` names accepted
+        by `LinkedList.sorted` are accepted here for compatibility and all produce the same stable ordering, as
+        do the `key` and `reverse` parameters.
+        """
+        if method not in ('bubble_sort', 'insertion_sort', 'merge_sort', 'natural', 'auto'):
+            raise NotImplementedError()
+        values = sorted(self, key=key, reverse=reverse)
+        self._head = self._tail = None
+        self._length = 0
+        self.extend(values)
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        node = self._head
+        while node:
+            yield from node.value
+            node = node._next_node
+
+    def __contains__(self, value):
+        node = self._head
+        while node:
+            if value in node.value:
+                return True
+            node = node._next_node
+        return False
+
+    def __add__(self, other):
+        if isinstance(other, Iterable):
+            return self.__class__([value for value in self] + [value for value in other], self._chunk_size)
+        raise ValueError("Can only concatenate an UnrolledLinkedList with another Iterable container-type.")
+
+    def __radd__(self, other):
+        return self.__add__(other)
+
+    def __iadd__(self, other):
+        return self.__add__(other)
+
+    def __mul__(self, value):
+        if isinstance(value, int):
+            return self.__class__([v for v in self] * value, self._chunk_size)
+        raise ValueError("Multiplication with an UnrolledLinkedList is only supported for integers")
+
+    def __rmul__(self, value):
+        return self.__mul__(value)
+
+    def __imul__(self, value):
+        return self.__mul__(value)
+
+    def __reduce__(self):
+        return self.__class__, (list(self), self._chunk_size)
+
+    def __repr__(self):
+        return 'UnrolledLinkedList(' + ''.join(str(value) + ', ' for value in self) + ')'
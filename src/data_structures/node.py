@@ -2,6 +2,8 @@
 
 
 class BaseNode:
+    __slots__ = ('value',)
+
     def __init__(self, value):
         self.value = value
 
@@ -32,6 +34,7 @@ class BaseNode:
 
 
 class EmptyNode:
+    __slots__ = ()
 
     def __bool__(self):
         return False
@@ -0,0 +1,4 @@
+from data_structures.node import BaseNode, EmptyNode
+from .bst import BSTNode, EmptyBSTNode, BST
+from .avl import AVLTree
+from .red_black import RedBlackNode, EmptyRedBlackNode, RedBlackTree
@@ -1,10 +1,12 @@
-from typing import Iterable, Union
+from typing import Iterable, Optional, Union
 from collections import deque
+from itertools import islice
 
 from data_structures import BaseNode, EmptyNode
 
 
 class EmptyBSTNode(EmptyNode):
+    __slots__ = ('height',)
 
     def __init__(self):
         super().__init__()
@@ -24,7 +26,15 @@ class BSTNode(BaseNode):
     ----------
     value : Any
         The data this node holds.
+
+    Notes
+    -----
+    The `left` and `right` setters check the type of the new child and that its value is comparable with this one.
+    Tree algorithms that already guarantee both (insertion, removal, rotations) assign `_left` and `_right`
+    directly instead.
     """
+    __slots__ = ('_left', '_right', 'height')
+
     def __init__(self, value):
         """The constructor for the BSTNode.
 
@@ -82,24 +92,88 @@ class BSTNode(BaseNode):
         return out[:-2] + ')'
 
 
+def _is_sorted(values):
+    """Returns True if the values in the list are in ascending order, allowing repeats."""
+    return not any(b < a for a, b in zip(values, islice(values, 1, None)))
+
+
+def _update_height(node):
+    """Recomputes a node's height from the heights of its children."""
+    node.height = max(node._left.height, node._right.height) + 1
+
+
 class BST:
-    """A naive binary search tree."""
+    """A naive binary search tree.
+
+    Insertion, search and removal walk the tree in a loop rather than recursing, recording the nodes they pass
+    through in `_visited`, so even a degenerate tree built from sorted input is limited only by memory.  After an
+    insertion or removal the recorded path is handed to `_after_insert` or `_after_remove`, which update the heights
+    along it and which self-balancing subclasses override to rebalance.
+    """
     def __init__(self, values=()):
         """BST constructor.
 
         Parameters
         ----------
         values : Iterable
-            A list of values to initialize the BST with.  Values will be inserted in the order provided.
+            A list of values to initialize the BST with.  Values will be inserted in the order provided, unless
+            they are already in ascending order, in which case the tree is built balanced as by `from_sorted`.
         """
         self.root = self._make_node(None)
+        # The path from the root to the most recently inserted or removed node, root first.
+        self._visited = []
 
         if isinstance(values, Iterable) and not isinstance(values, str):
-            for v in values:
-                self.insert(v)
+            values = list(values)
+            if _is_sorted(values):
+                self.root = self._build_balanced(values)
+            else:
+                for v in values:
+                    self.insert(v)
         else:
             raise TypeError("{} object is not iterable".format(values))
 
+    @classmethod
+    def from_sorted(cls, values):
+        """Builds a balanced tree from values in ascending order in O(n).
+
+        Each subtree is rooted at the middle of its values, so the tree is as short as possible, and no comparisons
+        or rotations are needed beyond checking the order.
+
+        Parameters
+        ----------
+        values : Iterable
+            The values to build the tree from, in ascending order.  Repeated values are allowed.
+
+        Raises
+        ------
+        ValueError :
+            If the values are not in ascending order.
+        """
+        values = list(values)
+        if not _is_sorted(values):
+            raise ValueError("The values must be in ascending order.")
+        tree = cls()
+        tree.root = tree._build_balanced(values)
+        return tree
+
+    def _build_balanced(self, values):
+        """Returns the root of a balanced subtree holding the sorted list of values."""
+        make_node = self._make_node
+
+        def build(lo, hi):
+            mid = (lo + hi) // 2
+            node = make_node(values[mid])
+            if lo < mid:
+                node._left = build(lo, mid)
+            if mid + 1 < hi:
+                node._right = build(mid + 1, hi)
+            # Splitting at the middle makes a subtree of n values bit_length(n) tall.
+            node.height = (hi - lo).bit_length()
+            return node
+
+        return build(0, len(values)) if values else make_node(None)
+
     @staticmethod
     def _make_node(value):
         if value is not None:
@@ -113,70 +187,110 @@ class BST:
             self.root = new_node
         else:
             self._insert(self.root, new_node)
+        self._after_insert(new_node)
 
     def _insert(self, current_node, new_node):
-        if new_node <= current_node:
-            if not current_node.left:
-                current_node.left = new_node
-            else:
-                self._insert(current_node.left, new_node)
-        else:
-            if not current_node.right:
-                current_node.right = new_node
+        """Links the new node in as a leaf below current_node, recording the path taken in `_visited`."""
+        visited = self._visited
+        while True:
+            visited.append(current_node)
+            if new_node <= current_node:
+                if not current_node._left:
+                    current_node._left = new_node
+                    return
+                current_node = current_node._left
             else:
-                self._insert(current_node.right, new_node)
-
-        current_node.height = max(current_node.left.height, current_node.right.height) + 1
+                if not current_node._right:
+                    current_node._right = new_node
+                    return
+                current_node = current_node._right
+
+    def _after_insert(self, node):
+        """Called once a new node has been linked in, with `_visited` holding its ancestors."""
+        self._update_heights()
+
+    def _after_remove(self, node, replacement):
+        """Called once a node has been unlinked, with `_visited` holding the ancestors of the replacement node which
+        took its place."""
+        self._update_heights()
+
+    def _update_heights(self):
+        """Recomputes the heights along `_visited`, deepest first, stopping once a height is unchanged."""
+        visited = self._visited
+        while visited:
+            node = visited.pop()
+            old_height = node.height
+            _update_height(node)
+            if node.height == old_height:
+                # Nothing changed beneath the remaining ancestors.
+                visited.clear()
 
     def remove(self, value):
-        if value == self.root.value:
-            if not self.root.left and not self.root.right:
-                self.root = None
-            elif not self.root.left:
-                self.root = self.root.right
-            elif not self.root.right:
-                self.root = self.root.left
-            else:
-                max_value = self._get_max(self.root.left).value
-                self.root.value = max_value
-                self._remove(max_value, self.root, self.root.left)
+        """Removes one occurrence of the given value from the tree.
 
-    def _remove(self, value, parent_node, current_node):
-        if not current_node:
+        Raises
+        ------
+        LookupError :
+            If the value is not in the tree.
+        """
+        visited = self._visited
+        node = self.root
+        while node and node.value != value:
+            visited.append(node)
+            node = node._left if value < node.value else node._right
+        if not node:
+            visited.clear()
             raise LookupError(f"Value {value} is not in the tree.")
 
-        elif current_node.value == value:
-            if not current_node.left and not current_node.right:
-                if current_node is parent_node.left:
-                    parent_node.left = self._make_node(None)
-                elif current_node is parent_node.right:
-                    parent_node.right = self._make_node(None)
-
-            # Case 2: Only right child
-            elif not current_node.left:
-                if current_node is parent_node.left:
-                    parent_node.left = current_node.right
-                elif current_node is parent_node.right:
-                    parent_node.right = current_node.right
-
-            # Case 3: Only left child
-            elif not current_node.right:
-                if current_node is parent_node.left:
-                    parent_node.left = current_node.left
-                elif current_node is parent_node.right:
-                    parent_node.right = current_node.left
-
-            # Case 4: Both children
-            else:
-                max_value = self._get_max(current_node.left).value
-                current_node.value = max_value
-                self._remove(max_value, current_node, current_node.left)
-
-        elif value <= current_node.value:
-            self._remove(value, current_node, current_node.left)
-
-        else:  # value > current_node.value
-            self._remove(value, current_node, current_node.right)
+        if node._left and node._right:
+            # Take over the largest value on the left, whose node has no right child, and remove that node instead.
+            visited.append(node)
+            predecessor = node._left
+            while predecessor._right:
+                visited.append(predecessor)
+                predecessor = predecessor._right
+            node.value = predecessor.value
+            node = predecessor
+
+        replacement = node._left if node._left else node._right
+        parent = visited[-1] if visited else None
+        if parent is None:
+            self.root = replacement
+        elif parent._left is node:
+            parent._left = replacement
+        else:
+            parent._right = replacement
+        self._after_remove(node, replacement)
+
+    def right_rotate(self, node, parent):
+        """Rotates node's left child up into node's place below parent, updating the heights of both."""
+        old_left = node._left
+        if parent is None:
+            self.root = old_left
+        elif parent._left is node:
+            parent._left = old_left
+        else:
+            parent._right = old_left
+        node._left = old_left._right
+        old_left._right = node
+        _update_height(node)
+        _update_height(old_left)
+        return old_left
+
+    def left_rotate(self, node, parent):
+        """Rotates node's right child up into node's place below parent, updating the heights of both."""
+        old_right = node._right
+        if parent is None:
+            self.root = old_right
+        elif parent._left is node:
+            parent._left = old_right
+        else:
+            parent._right = old_right
+        node._right = old_right._left
+        old_right._left = node
+        _update_height(node)
+        _update_height(old_right)
+        return old_right
 
     def find(self, value):
         """Returns True if the value is contained in the tree and False otherwise."""
@@ -186,13 +300,12 @@ class BST:
         """Support for `value in tree`."""
         return self._find(self.root, value)
 
-    def _find(self, node, value):
-        if value == node.value:
-            return True
-        if value < node.value and node.left:
-            return self._find(node.left, value)
-        if value > node.value and node.right:
-            return self._find(node.right, value)
+    @staticmethod
+    def _find(node, value):
+        while node:
+            if value == node.value:
+                return True
+            node = node._left if value < node.value else node._right
         return False
 
     def get_height(self):
@@ -200,22 +313,40 @@ class BST:
         return self.root.height
 
     def minimum(self):
-        min_node = self._get_min(self.root)
-        return min_node.value
+        """Returns the smallest value in the tree.
 
-    def _get_min(self, node):
-        if not node.left:
-            return node
-        return self._get_min(node.left)
+        Raises
+        ------
+        ValueError :
+            If the tree is empty.
+        """
+        if not self.root:
+            raise ValueError("An empty tree has no minimum.")
+        return self._get_min(self.root).value
+
+    @staticmethod
+    def _get_min(node):
+        while node._left:
+            node = node._left
+        return node
 
     def maximum(self):
-        max_node = self._get_max(self.root)
-        return max_node.value
+        """Returns the largest value in the tree.
 
-    def _get_max(self, node):
-        if not node.right:
-            return node
-        return self._get_max(node.right)
+        Raises
+        ------
+        ValueError :
+            If the tree is empty.
+        """
+        if not self.root:
+            raise ValueError("An empty tree has no maximum.")
+        return self._get_max(self.root).value
+
+    @staticmethod
+    def _get_max(node):
+        while node._right:
+            node = node._right
+        return node
 
     def to_list(self, order='in_order'):
         orders = {'pre_order': ['append', 'left', 'right'],
@@ -224,17 +355,31 @@ class BST:
         if order == 'level_order':
             return self._to_list_level_order()
         elif order in orders:
-            return self._to_list(self.root, [], orders[order])
+            return self._to_list(self.root, orders[order])
         else:
             raise ValueError('You specified the invalid ordering {}'.format(order))
 
-    def _to_list(self, node, current_list, order):
-        functions = {'append': lambda n, l, o: l + [n.value],
-                     'left': lambda n, l, o: self._to_list(n.left, l, o) if n.left else l,
-                     'right': lambda n, l, o: self._to_list(n.right, l, o) if n.right else l}
-        for operation in order:
-            current_list = functions[operation](node, current_list, order)
-        return current_list
+    @staticmethod
+    def _to_list(node, order):
+        # An explicit stack of pending steps replaces the recursion.  A node paired with True is due to be appended,
+        # while one paired with False still needs its steps expanded.
+        out = []
+        stack = [(node, False)]
+        while stack:
+            node, ready = stack.pop()
+            if not node:
+                continue
+            if ready:
+                out.append(node.value)
+                continue
+            for operation in reversed(order):
+                if operation == 'append':
+                    stack.append((node, True))
+                elif operation == 'left':
+                    stack.append((node._left, False))
+                else:
+                    stack.append((node._right, False))
+        return out
 
     def _to_list_level_order(self):
         queue = deque([self.root])
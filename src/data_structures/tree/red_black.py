@@ -1,5 +1,5 @@
 from enum import Enum
-from .bst import BST, EmptyBSTNode, BSTNode
+from .bst import BST, EmptyBSTNode, BSTNode, _update_height
 
 
 class Color(Enum):
@@ -8,6 +8,7 @@ class Color(Enum):
 
 
 class EmptyRedBlackNode(EmptyBSTNode):
+    __slots__ = ('color',)
 
     def __init__(self):
         super().__init__()
@@ -18,6 +19,7 @@ class EmptyRedBlackNode(EmptyBSTNode):
 
 
 class RedBlackNode(BSTNode):
+    __slots__ = ('_color',)
 
     def __init__(self, value):
         super().__init__(value)
@@ -54,19 +56,21 @@ class RedBlackNode(BSTNode):
     def __repr__(self):
         out = "RedBlackNode(value={}, color={}, ".format(self.value, self.color.name)
         for child in ['left', 'right']:
-            if getattr(self, child):
-                node = getattr(self, child)
-                out += "{}=RedBlackNode({}, {}), ".format(child, child.value, child.color.name)
+            node = getattr(self, child)
+            if node:
+                out += "{}=RedBlackNode({}, {}), ".format(child, node.value, node.color.name)
             else:
-                out += "{}=EmptyRedBlackNode({}), ".format
+                out += "{}=EmptyRedBlackNode(), ".format(child)
         return out[:-2] + ')'
 
 
 class RedBlackTree(BST):
+    """A binary search tree which keeps itself balanced by coloring its nodes red or black.
 
-    def __init__(self, values):
-        self._visited = []
-        super().__init__(values)
+    No red node has a red child and every path from a node down to its empty leaves passes through the same number
+    of black nodes, so the tree is never more than twice as tall as a perfectly balanced one.  The fix-ups after an
+    insertion or removal climb the path left in `_visited` rather than following parent links.
+    """
 
     @staticmethod
     def _make_node(value):
@@ -74,77 +78,118 @@ class RedBlackTree(BST):
             return RedBlackNode(value)
         return EmptyRedBlackNode()
 
-    def insert(self, value):
-        super().insert(value)
-        if self.root.color is Color.Red:
-            self.root.color = Color.Black
-        else:
-            self.rebalance(value)
-
-    def _insert(self, current_node, new_node):
-        self._visited.append(current_node)
-        super()._insert(current_node, new_node)
-
-    def remove(self, value):
-        super().remove(value)
-        self.rebalance(value)
-
-    def _remove(self, value, parent_node, current_node):
-        self._visited.append(parent_node)
-        super()._remove(value, parent_node, current_node)
-
-    def rebalance(self, value):
-        parent = self._visited.pop()
-        current_node = parent.left if value <= parent.value else parent.right
-
-        while self._visited:
-            if parent.color is Color.Black:  # We're done
-                self._visited = []
-                break
-
-            grandparent = self._visited[-1]
-            uncle = grandparent.right if parent <= grandparent else grandparent.left
+    def _build_balanced(self, values):
+        root = super()._build_balanced(values)
+        if not root:
+            return root
+        # In a tree split at the middle, every node missing a child is on the deepest level or the one above it.
+        # Coloring all but the deepest level black therefore gives every path the same number of black nodes, and
+        # the red nodes left on the deepest level have only empty children.
+        level = [root]
+        for _ in range(root.height - 1):
+            for node in level:
+                node._color = Color.Black
+            level = [child for node in level for child in (node._left, node._right) if child]
+        root._color = Color.Black
+        return root
+
+    def _after_insert(self, node):
+        visited = self._visited
+        while visited and visited[-1].color is Color.Red:
+            # A red parent is never the root, so the grandparent is on the path too.
+            parent = visited.pop()
+            grandparent = visited.pop()
+            great_grandparent = visited[-1] if visited else None
+            uncle = grandparent._right if parent is grandparent._left else grandparent._left
 
             if uncle.color is Color.Red:  # Re-color case
                 parent.color = Color.Black
                 uncle.color = Color.Black
                 grandparent.color = Color.Red
+                _update_height(parent)
+                _update_height(grandparent)
+                node = grandparent
 
             else:  # Rotations
+                if parent is grandparent._left:
+                    if node is parent._right:
+                        parent = self.left_rotate(parent, grandparent)
+                    self.right_rotate(grandparent, great_grandparent)
+                else:
+                    if node is parent._left:
+                        parent = self.right_rotate(parent, grandparent)
+                    self.left_rotate(grandparent, great_grandparent)
+                parent.color = Color.Black
+                grandparent.color = Color.Red
+                break
 
-                if current_node is parent.left and parent is grandparent.left:
-                    
-
-
-
-
-
-
-
-
-    def right_rotate(self, node, parent):
-        if parent is None:
-            self.root = node.left
-        elif parent.left is node:
-            parent.left = node.left
-        else:
-            parent.right = node.left
-        old_left = node.left
-        node.left = old_left.right
-        old_left.right = node
-
-    def left_rotate(self, node, parent):
-        if parent is None:
-            self.root = node.right
-        elif parent.left is node:
-            parent.left = node.right
-        else:
-            parent.right = node.right
-        old_right = node.right
-        node.right = old_right.left
-        old_right.left = node
-
-
-
-
+        self.root.color = Color.Black
+        self._update_heights()
 
+    def _after_remove(self, node, replacement):
+        if node.color is Color.Black:
+            if replacement.color is Color.Red:
+                replacement.color = Color.Black
+            else:
+                self._fix_double_black(replacement)
+        self._update_heights()
+
+    def _fix_double_black(self, node):
+        """Restores the black heights after a black node was removed from above `node`, which is one black short.
+
+        `_visited` holds the ancestors of `node` throughout and is left holding those whose heights may be stale.
+        A node rotated onto it keeps the old height of its subtree until then, so that `_update_heights` can still
+        tell when the heights above have stopped changing.
+        """
+        visited = self._visited
+        while visited and node.color is Color.Black:
+            parent = visited.pop()
+            grandparent = visited[-1] if visited else None
+            if node is parent._left:
+                sibling = parent._right
+                if sibling.color is Color.Red:
+                    sibling.color = Color.Black
+                    parent.color = Color.Red
+                    height = parent.height
+                    grandparent = self.left_rotate(parent, grandparent)
+                    grandparent.height = height
+                    visited.append(grandparent)
+                    sibling = parent._right
+                if sibling._left.color is Color.Black and sibling._right.color is Color.Black:
+                    sibling.color = Color.Red
+                    _update_height(parent)
+                    node = parent
+                    continue
+                if sibling._right.color is Color.Black:
+                    sibling._left.color = Color.Black
+                    sibling.color = Color.Red
+                    sibling = self.right_rotate(sibling, parent)
+                sibling.color = parent.color
+                parent.color = Color.Black
+                sibling._right.color = Color.Black
+                self.left_rotate(parent, grandparent)
+            else:
+                sibling = parent._left
+                if sibling.color is Color.Red:
+                    sibling.color = Color.Black
+                    parent.color = Color.Red
+                    height = parent.height
+                    grandparent = self.right_rotate(parent, grandparent)
+                    grandparent.height = height
+                    visited.append(grandparent)
+                    sibling = parent._left
+                if sibling._left.color is Color.Black and sibling._right.color is Color.Black:
+                    sibling.color = Color.Red
+                    _update_height(parent)
+                    node = parent
+                    continue
+                if sibling._left.color is Color.Black:
+                    sibling._right.color = Color.Black
+                    sibling.color = Color.Red
+                    sibling = self.left_rotate(sibling, parent)
+                sibling.color = parent.color
+                parent.color = Color.Black
+                sibling._left.color = Color.Black
+                self.right_rotate(parent, grandparent)
+            return
+        node.color = Color.Black
@@ -1,9 +1,20 @@
+import array
+import asyncio
+import io
+import pickle
+import queue
 import string
+import threading
+from itertools import chain
 import random
 
 import pytest
 
-from data_structures.linked_list import LinkedListNode, LinkedList, BaseNode
+from data_structures.linked_list import LinkedListNode, LinkedList, BaseNode, DoublyLinkedListNode, DoublyLinkedList
+from data_structures.linked_list import UnrolledLinkedList, LazyLinkedList, MapView, FilterView, SkipList, NodePool
+from data_structures.linked_list import ConcurrentLinkedQueue, AsyncLinkedQueue, QueueClosed
+from data_structures.linked_list import PersistentLinkedList, LRUCache, LFUCache, TypedLinkedList, merge_sorted
+from data_structures.linked_list.linked_list import _SNAPSHOT_HEADER, _SNAPSHOT_LENGTH
 
 _non_nodes = [5, BaseNode(None), 13.5, int, pytest, 'banana']
 _orderable_lists = [list(range(10)), [c for c in string.ascii_letters], [], [1, 3, 1.1, -50, 0, 3.1415639]]
@@ -29,6 +40,11 @@ def test_node_construction():
     assert node.next_node is None
 
 
+def test_node_slots():
+    for node in [LinkedListNode(5), DoublyLinkedListNode(5)]:
+        assert not hasattr(node, '__dict__')
+
+
 def test_node_next_pass():
     node = LinkedListNode('base')
 
@@ -145,6 +161,25 @@ def test_reverse(constructor_arg):
     assert list(ll) == list(reversed(list(constructor_arg)))
 
 
+class _Keyed:
+    """A value which orders by key alone, so that sort stability is observable."""
+    def __init__(self, key, tag):
+        self.key = key
+        self.tag = tag
+
+    def __lt__(self, other):
+        return self.key < other.key
+
+    def __le__(self, other):
+        return self.key <= other.key
+
+    def __gt__(self, other):
+        return self.key > other.key
+
+    def __ge__(self, other):
+        return self.key >= other.key
+
+
 def test_bubble_sort():
     test_list = [random.randint(0, 100) for _ in range(100)]
     ll = LinkedList(test_list)
@@ -189,3 +224,1645 @@ def test_merge_sort():
     ll.sorted(method='merge_sort')
     assert list(ll) == []
 
+
+@pytest.mark.parametrize('length', [2, 3, 7, 64, 100, 5000])
+def test_merge_sort_large_and_stable(length):
+    test_list = [_Keyed(random.randint(0, 10), tag) for tag in range(length)]
+    ll = LinkedList(test_list)
+    ll.sorted(method='merge_sort')
+    assert [(v.key, v.tag) for v in ll] == [(v.key, v.tag) for v in sorted(test_list, key=lambda v: v.key)]
+    assert ll.tail.value is list(ll)[-1]
+
+
+
+def test_length_and_tail_tracking(constructor_arg):
+    ll = LinkedList(constructor_arg)
+    assert len(ll) == len(constructor_arg)
+    if constructor_arg:
+        assert ll.tail.value == list(constructor_arg)[-1]
+    else:
+        assert ll.tail is None
+
+    ll.append('end')
+    ll.insert(0, 'start')
+    assert len(ll) == len(constructor_arg) + 2
+    assert ll.tail.value == 'end'
+
+    ll.pop(len(ll) - 1)
+    assert ll.tail.value == (list(constructor_arg)[-1] if constructor_arg else 'start')
+    ll.reverse()
+    assert ll.tail.value == 'start'
+
+    ll.extend(ll)
+    assert len(ll) == 2 * (len(constructor_arg) + 1)
+    assert ll.tail.value == 'start'
+
+    while ll:
+        ll.pop()
+    assert len(ll) == 0
+    assert ll.tail is None
+
+
+def test_extend_empty():
+    ll = LinkedList()
+    ll.extend(range(3))
+    assert list(ll) == [0, 1, 2]
+    assert ll.tail.value == 2
+
+    ll.extend([])
+    assert list(ll) == [0, 1, 2]
+
+
+def test_sorted_updates_tail():
+    ll = LinkedList([3, 1, 2])
+    for method in ['bubble_sort', 'insertion_sort', 'merge_sort']:
+        ll.sorted(method=method)
+        assert ll.tail.value == 3
+        ll.append(0)
+        assert list(ll)[-1] == 0
+        ll.pop(len(ll) - 1)
+
+
+def _check_back_links(dll):
+    previous = None
+    node = dll.head
+    while node:
+        assert node.prev_node is previous
+        previous, node = node, node.next_node
+    assert dll.tail is previous
+
+
+def test_doubly_node_prev_fail(not_a_node):
+    node = DoublyLinkedListNode('base')
+
+    with pytest.raises(TypeError):
+        node.prev_node = not_a_node
+    with pytest.raises(TypeError):
+        node.next_node = LinkedListNode('singly')
+
+
+def test_doubly_linked_list_constructor(constructor_arg):
+    dll = DoublyLinkedList(constructor_arg)
+    assert list(dll) == list(constructor_arg)
+    assert list(reversed(dll)) == list(reversed(list(constructor_arg)))
+    _check_back_links(dll)
+
+
+def test_doubly_linked_list_get(constructor_arg):
+    dll = DoublyLinkedList(constructor_arg)
+    for index, item in enumerate(constructor_arg):
+        assert dll._get(index).value == item
+    with pytest.raises(IndexError):
+        dll._get(len(constructor_arg))
+
+
+def test_doubly_linked_list_deque_operations(constructor_arg):
+    dll = DoublyLinkedList(constructor_arg)
+    expected = list(constructor_arg)
+
+    dll.appendleft('left')
+    dll.append('right')
+    expected = ['left'] + expected + ['right']
+    assert list(dll) == expected
+    _check_back_links(dll)
+
+    assert dll.pop() == 'right'
+    assert dll.popleft() == 'left'
+    assert list(dll) == list(constructor_arg)
+    _check_back_links(dll)
+
+    while dll:
+        dll.pop()
+    _check_back_links(dll)
+    with pytest.raises(IndexError):
+        dll.pop()
+    with pytest.raises(IndexError):
+        dll.popleft()
+
+
+def test_doubly_linked_list_insert_pop(constructor_arg):
+    expected = list(constructor_arg)
+    dll = DoublyLinkedList(constructor_arg)
+    idx = random.randint(0, len(expected))
+    dll.insert(idx, 'test')
+    expected.insert(idx, 'test')
+    assert list(dll) == expected
+    _check_back_links(dll)
+
+    idx = random.randint(0, len(expected) - 1)
+    assert dll.pop(idx) == expected.pop(idx)
+    assert list(dll) == expected
+    _check_back_links(dll)
+
+    with pytest.raises(IndexError):
+        dll.insert(len(expected) + 1, 'test')
+    with pytest.raises(IndexError):
+        dll.pop('Um, an index')
+
+
+def test_doubly_linked_list_reverse_extend(constructor_arg):
+    dll = DoublyLinkedList(constructor_arg)
+    dll.reverse()
+    assert list(dll) == list(reversed(list(constructor_arg)))
+    _check_back_links(dll)
+
+    dll.extend(dll)
+    assert list(dll) == 2 * list(reversed(list(constructor_arg)))
+    _check_back_links(dll)
+
+
+@pytest.mark.parametrize('method', ['bubble_sort', 'insertion_sort', 'merge_sort'])
+def test_doubly_linked_list_sorted(method):
+    test_list = [random.randint(0, 100) for _ in range(100)]
+    dll = DoublyLinkedList(test_list)
+    dll.sorted(method=method)
+    assert list(dll) == sorted(test_list)
+    _check_back_links(dll)
+
+
+def test_doubly_linked_list_dunders():
+    dll = DoublyLinkedList([1, 2])
+    assert isinstance(dll + [3], DoublyLinkedList)
+    assert list(dll * 2) == [1, 2, 1, 2]
+    assert 2 in dll
+    assert repr(dll) == 'DoublyLinkedList(1, 2, )'
+
+
+def _check_chunks(ull):
+    node = ull.head
+    total = 0
+    while node:
+        assert 0 < len(node.value) <= ull.chunk_size
+        total += len(node.value)
+        if node.next_node is None:
+            assert node is ull.tail
+        node = node.next_node
+    assert total == len(ull)
+
+
+def test_unrolled_linked_list_chunk_size():
+    with pytest.raises(ValueError):
+        UnrolledLinkedList(chunk_size=0)
+    with pytest.raises(TypeError):
+        UnrolledLinkedList(None)
+
+
+@pytest.mark.parametrize('chunk_size', [1, 2, 5, 16])
+def test_unrolled_linked_list_operations(constructor_arg, chunk_size):
+    expected = list(constructor_arg)
+    ull = UnrolledLinkedList(constructor_arg, chunk_size=chunk_size)
+    assert list(ull) == expected
+    _check_chunks(ull)
+
+    for i in range(50):
+        idx = random.randint(0, len(expected))
+        ull.insert(idx, i)
+        expected.insert(idx, i)
+        _check_chunks(ull)
+    assert list(ull) == expected
+
+    ull.reverse()
+    expected.reverse()
+    assert list(ull) == expected
+    _check_chunks(ull)
+
+    while expected:
+        idx = random.randint(0, len(expected) - 1)
+        assert ull.pop(idx) == expected.pop(idx)
+        _check_chunks(ull)
+    assert ull.head is None and ull.tail is None
+
+    with pytest.raises(IndexError):
+        ull.pop()
+    with pytest.raises(IndexError):
+        ull.insert(1, 'test')
+    with pytest.raises(IndexError):
+        ull.insert('Um, an index', 'test')
+
+
+def test_unrolled_linked_list_search():
+    test_list = [random.randint(0, 20) for _ in range(100)]
+    ull = UnrolledLinkedList(test_list, chunk_size=7)
+    for value in range(25):
+        assert ull.count(value) == test_list.count(value)
+        assert (value in ull) == (value in test_list)
+        if value in test_list:
+            assert ull.index(value) == test_list.index(value)
+        else:
+            with pytest.raises(ValueError):
+                ull.index(value)
+
+
+def test_unrolled_linked_list_sorted():
+    test_list = [random.randint(0, 100) for _ in range(100)]
+    ull = UnrolledLinkedList(test_list, chunk_size=7)
+    ull.sorted()
+    assert list(ull) == sorted(test_list)
+    _check_chunks(ull)
+
+    ull = UnrolledLinkedList(test_list, chunk_size=7)
+    ull.sorted(method='auto', reverse=True)
+    assert list(ull) == sorted(test_list, reverse=True)
+    _check_chunks(ull)
+
+    with pytest.raises(NotImplementedError):
+        ull.sorted(method='bogo_sort')
+
+
+def _nearly_sorted(length):
+    values = sorted(random.randint(0, 50) for _ in range(length))
+    for _ in range(length // 10):
+        values.insert(random.randint(0, len(values)), random.randint(0, 50))
+    return values
+
+
+@pytest.mark.parametrize('values', [[], [1], list(range(100)), list(range(100, 0, -1)), [5] * 20,
+                                    _nearly_sorted(200), [random.randint(0, 100) for _ in range(200)]],
+                         ids=['empty', 'single', 'sorted', 'descending', 'constant', 'nearly_sorted', 'random'])
+def test_natural_sort(values):
+    ll = LinkedList(values)
+    ll.sorted(method='natural')
+    assert list(ll) == sorted(values)
+    if values:
+        assert ll.tail.value == max(values)
+
+
+def test_natural_sort_stable():
+    test_list = [_Keyed(k, tag) for tag, k in enumerate([3, 3, 2, 2, 1, 1, 4, 0, 0, 5, 5])]
+    ll = LinkedList(test_list)
+    ll.sorted(method='natural')
+    assert [(v.key, v.tag) for v in ll] == [(v.key, v.tag) for v in sorted(test_list, key=lambda v: v.key)]
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+@pytest.mark.parametrize('method', ['bubble_sort', 'insertion_sort', 'merge_sort', 'natural'])
+@pytest.mark.parametrize('values', [[5, 'a', 3, 2, 1], [3, 1, 'a', 2], [4, 3, 2, 1, 'a', 0, 9, 8]])
+def test_sorted_failure_keeps_nodes(list_type, method, values):
+    ll = list_type(values)
+    with pytest.raises(TypeError):
+        ll.sorted(method=method)
+    assert sorted(map(str, ll)) == sorted(map(str, values))
+    assert len(ll) == len(values)
+    assert ll.tail.value == list(ll)[-1]
+    ll.append(99)
+    assert list(ll)[-1] == 99 and len(ll) == len(values) + 1
+    if list_type is DoublyLinkedList:
+        _check_back_links(ll)
+
+
+@pytest.mark.parametrize('method', ['bubble_sort', 'insertion_sort', 'merge_sort', 'natural'])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_sorted_key_reverse(method, reverse):
+    test_list = [(random.randint(0, 10), tag) for tag in range(100)]
+    calls = []
+
+    def key(value):
+        calls.append(value)
+        return value[0]
+
+    ll = LinkedList(test_list)
+    ll.sorted(method=method, key=key, reverse=reverse)
+    assert list(ll) == sorted(test_list, key=lambda v: v[0], reverse=reverse)
+    assert len(calls) == len(test_list)
+
+    dll = DoublyLinkedList(test_list)
+    dll.sorted(method=method, key=lambda v: v[0], reverse=reverse)
+    assert list(dll) == sorted(test_list, key=lambda v: v[0], reverse=reverse)
+    _check_back_links(dll)
+
+    ull = UnrolledLinkedList(test_list, chunk_size=8)
+    ull.sorted(method=method, key=lambda v: v[0], reverse=reverse)
+    assert list(ull) == sorted(test_list, key=lambda v: v[0], reverse=reverse)
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+@pytest.mark.parametrize('method', ['bubble_sort', 'insertion_sort', 'merge_sort', 'natural'])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_sorted_key_failure(list_type, method, reverse):
+    values = [4, 2, 'x', 3, 1]
+    ll = list_type(values, indexed=True)
+
+    def failing_key(value):
+        if value == 'x':
+            raise ValueError("no key for x")
+        return value
+
+    with pytest.raises(ValueError):
+        ll.sorted(method=method, key=failing_key, reverse=reverse)
+    assert list(ll) == values
+
+    # A key which can't be compared fails during the sort itself, which must still unwrap every value.
+    with pytest.raises(TypeError):
+        ll.sorted(method=method, key=lambda v: v, reverse=reverse)
+    assert sorted(map(str, ll)) == sorted(map(str, values))
+    assert len(ll) == len(values) and ll.tail.value == list(ll)[-1]
+    assert ll.index('x') == list(ll).index('x')
+    _check_index(ll)
+    if list_type is DoublyLinkedList:
+        _check_back_links(ll)
+
+
+_slices = [slice(None), slice(2, 5), slice(-3, None), slice(None, None, 2), slice(None, None, -1),
+           slice(7, 1, -2), slice(1, 100), slice(5, 2)]
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+def test_getitem(list_type):
+    values = list(range(10))
+    ll = list_type(values)
+    for index in range(-10, 10):
+        assert ll[index] == values[index]
+    for s in _slices:
+        sliced = ll[s]
+        assert isinstance(sliced, list_type)
+        assert list(sliced) == values[s]
+
+    with pytest.raises(IndexError):
+        ll[10]
+    with pytest.raises(IndexError):
+        ll[-11]
+    with pytest.raises(IndexError):
+        ll['Um, an index']
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+@pytest.mark.parametrize('s', _slices, ids=repr)
+def test_setitem_delitem_slices(list_type, s):
+    values = list(range(10))
+    ll = list_type(values)
+    del ll[s]
+    del values[s]
+    assert list(ll) == values
+    assert len(ll) == len(values)
+
+    values = list(range(10))
+    ll = list_type(values)
+    replacement = ['x'] * len(values[s]) if s.step not in (None, 1) else ['x', 'y', 'z']
+    ll[s] = replacement
+    values[s] = replacement
+    assert list(ll) == values
+    assert len(ll) == len(values)
+    assert ll.tail.value == values[-1]
+    if list_type is DoublyLinkedList:
+        _check_back_links(ll)
+
+
+def test_setitem_delitem_index():
+    ll = LinkedList(range(5))
+    ll[0] = 'a'
+    ll[-1] = 'e'
+    assert list(ll) == ['a', 1, 2, 3, 'e']
+    del ll[-1]
+    del ll[1]
+    assert list(ll) == ['a', 2, 3]
+    assert ll.tail.value == 3
+
+    with pytest.raises(IndexError):
+        ll[3] = 'nope'
+    with pytest.raises(ValueError):
+        ll[::2] = [1, 2, 3]
+
+
+def test_get_many_pop_many():
+    values = list(range(20))
+    ll = LinkedList(values)
+    indices = [5, 0, -1, 5, 12]
+    assert ll.get_many(indices) == [values[i] for i in indices]
+    assert ll.get_many([]) == []
+
+    with pytest.raises(ValueError):
+        ll.pop_many([1, 1])
+    with pytest.raises(IndexError):
+        ll.pop_many([1, 20])
+    assert list(ll) == values
+
+    assert ll.pop_many([19, 0, 7]) == [19, 0, 7]
+    assert list(ll) == [v for v in values if v not in (19, 0, 7)]
+    assert ll.tail.value == 18
+    assert len(ll) == 17
+
+
+def _counting(values, pulled):
+    for value in values:
+        pulled.append(value)
+        yield value
+
+
+def test_from_iter():
+    ll = LinkedList.from_iter(v for v in range(5))
+    assert type(ll) is LinkedList
+    assert list(ll) == list(range(5))
+
+    lazy = LinkedList.from_iter((v for v in range(5)), lazy=True)
+    assert isinstance(lazy, LazyLinkedList)
+    assert list(lazy) == list(range(5))
+
+    with pytest.raises(TypeError):
+        LazyLinkedList(None)
+
+
+def test_lazy_linked_list_pulls_on_demand():
+    pulled = []
+    ll = LazyLinkedList(_counting(range(100), pulled))
+    assert pulled == []
+    assert ll
+    assert len(pulled) == 1
+
+    assert ll[3] == 3
+    assert len(pulled) == 4
+    assert 7 in ll
+    assert len(pulled) == 8
+    assert ll.index(5) == 5
+    assert ll.get_many([1, 9]) == [1, 9]
+    assert ll.materialized == 10
+
+    for i, value in enumerate(ll):
+        if i == 20:
+            break
+    assert ll.materialized == 21
+
+    assert ll.pop(0) == 0
+    ll.insert(0, 'front')
+    assert ll.materialized == 21
+
+    assert len(ll) == 100
+    assert list(ll) == ['front'] + list(range(1, 100))
+
+
+def test_lazy_linked_list_unbounded():
+    def naturals():
+        value = 0
+        while True:
+            yield value
+            value += 1
+
+    ll = LazyLinkedList(naturals())
+    assert ll[1000] == 1000
+    assert ll.materialized == 1001
+
+    odds = iter(ll.filter(lambda v: v % 2).map(lambda v: v * 10))
+    assert [next(odds) for _ in range(3)] == [10, 30, 50]
+    assert ll.materialized == 1001
+
+
+def test_lazy_linked_list_mutation(constructor_arg):
+    expected = list(constructor_arg)
+    ll = LazyLinkedList(iter(constructor_arg))
+    ll.append('end')
+    expected.append('end')
+    ll.reverse()
+    expected.reverse()
+    assert list(ll) == expected
+    assert ll.tail.value == expected[-1]
+    del ll[::2]
+    del expected[::2]
+    assert list(ll) == expected
+    assert len(ll) == len(expected)
+
+
+def test_lazy_linked_list_empty():
+    ll = LazyLinkedList(iter([]))
+    assert not ll
+    assert list(ll) == []
+    assert ll.tail is None
+    with pytest.raises(IndexError):
+        ll[0]
+
+
+def test_add_mul_stream():
+    ll = LinkedList([1, 2])
+    assert list(ll + (3, 4)) == [1, 2, 3, 4]
+    assert list(ll * 3) == [1, 2] * 3
+    assert list(ll * -1) == []
+
+
+def test_views():
+    ll = LinkedList(range(10))
+    mapped = ll.map(lambda v: v * 2)
+    assert isinstance(mapped, MapView)
+    assert list(mapped) == [v * 2 for v in range(10)]
+    assert len(mapped) == 10
+    assert mapped[3] == 6
+
+    filtered = ll.filter(lambda v: v % 3 == 0)
+    assert isinstance(filtered, FilterView)
+    assert list(filtered) == [0, 3, 6, 9]
+    assert list(filtered.map(str)) == ['0', '3', '6', '9']
+    assert list(mapped.filter(lambda v: v > 15)) == [16, 18]
+
+    # Views stream over the list rather than copying it.
+    ll.append(12)
+    assert list(filtered) == [0, 3, 6, 9, 12]
+    assert list(LinkedList(filtered)) == [0, 3, 6, 9, 12]
+
+
+def _check_skip_list(sl):
+    expected = list(sl)
+    assert expected == sorted(expected)
+    assert len(sl) == len(expected)
+    # Walk each express lane, checking that its span counts agree with the bottom lane.
+    positions = {}
+    node = sl.head
+    for position, value in enumerate(expected):
+        positions[id(node)] = position + 1
+        node = node.next_node
+    for lane in range(sl._level):
+        node, rank = sl._head, 0
+        while node._forward[lane] is not None:
+            rank += node._width[lane]
+            node = node._forward[lane]
+            assert positions[id(node)] == rank
+
+
+def test_skip_list_operations():
+    expected = []
+    sl = SkipList()
+    for _ in range(300):
+        value = random.randint(0, 100)
+        sl.add(value)
+        expected.append(value)
+    expected.sort()
+    assert list(sl) == expected
+    _check_skip_list(sl)
+
+    for value in range(-1, 102):
+        assert (value in sl) == (value in expected)
+        assert sl.count(value) == expected.count(value)
+        if value in expected:
+            assert sl.index(value) == expected.index(value)
+        else:
+            with pytest.raises(ValueError):
+                sl.index(value)
+            with pytest.raises(ValueError):
+                sl.remove(value)
+
+    for index in range(-len(expected), len(expected), 7):
+        assert sl[index] == expected[index]
+    for s in _slices:
+        assert sl[s] == expected[s]
+
+    while expected:
+        if random.random() < 0.5:
+            value = random.choice(expected)
+            sl.remove(value)
+            expected.remove(value)
+        else:
+            index = random.randint(-len(expected), len(expected) - 1)
+            assert sl.pop(index) == expected.pop(index)
+        if len(expected) % 25 == 0:
+            _check_skip_list(sl)
+    assert list(sl) == []
+    assert sl.head is None
+
+    with pytest.raises(IndexError):
+        sl.pop()
+    with pytest.raises(IndexError):
+        sl['Um, an index']
+
+
+def test_skip_list_stable():
+    values = [_Keyed(random.randint(0, 5), tag) for tag in range(50)]
+    sl = SkipList(values)
+    assert [(v.key, v.tag) for v in sl] == [(v.key, v.tag) for v in sorted(values, key=lambda v: v.key)]
+
+
+def test_skip_list_constructor(constructor_arg):
+    try:
+        expected = sorted(constructor_arg)
+    except TypeError:
+        with pytest.raises(TypeError):
+            SkipList(constructor_arg)
+    else:
+        assert list(SkipList(constructor_arg)) == expected
+    with pytest.raises(TypeError):
+        SkipList(None)
+
+
+def test_node_pool():
+    with pytest.raises(ValueError):
+        NodePool(-1)
+
+    pool = NodePool(2)
+    node = pool.acquire('a')
+    assert isinstance(node, LinkedListNode)
+    assert (pool.hits, pool.misses) == (0, 1)
+
+    node.next_node = LinkedListNode('b')
+    pool.release(node)
+    assert len(pool) == 1
+    assert pool.acquire('c') is node
+    assert node.value == 'c' and node.next_node is None
+    assert (pool.hits, pool.misses) == (1, 1)
+
+    for _ in range(3):
+        pool.release(LinkedListNode(None))
+    assert len(pool) == 2
+    assert pool.discards == 1
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+def test_linked_list_pool_churn(list_type):
+    ll = list_type(range(3), pool_size=4)
+    assert ll.pool.misses == 3
+    for i in range(100):
+        ll.insert(0, i)
+        ll.pop(len(ll) - 1)
+    assert ll.pool.misses == 4
+    assert ll.pool.hits == 99
+    assert len(ll) == 3
+    assert list(ll) == [99, 98, 97]
+
+    del ll[0:2]
+    assert len(ll.pool) == 3
+    ll.extend(['x', 'y'])
+    assert list(ll) == [97, 'x', 'y']
+    assert len(ll.pool) == 1
+    if list_type is DoublyLinkedList:
+        _check_back_links(ll)
+
+
+def test_linked_list_shared_pool():
+    pool = NodePool(10)
+    producer = LinkedList(range(5), pool=pool)
+    consumer = LinkedList(pool=pool)
+    while producer:
+        consumer.append(producer.pop())
+    assert list(consumer) == list(range(5))
+    assert pool.hits == 5
+
+    with pytest.raises(ValueError):
+        LinkedList(pool=pool, pool_size=3)
+    with pytest.raises(TypeError):
+        DoublyLinkedList(pool=pool)
+
+
+@pytest.mark.parametrize('buffer', [array.array('d', [1.5, -2.0, 3.25]), array.array('i', range(10)),
+                                    b'bytes', memoryview(array.array('q', [1, 2, 3])), array.array('d')],
+                         ids=repr)
+def test_from_array(buffer):
+    ll = LinkedList.from_array(buffer)
+    assert list(ll) == list(buffer)
+    assert len(ll) == len(buffer)
+
+    dll = DoublyLinkedList.from_array(buffer)
+    assert isinstance(dll, DoublyLinkedList)
+    _check_back_links(dll)
+
+    with pytest.raises(TypeError):
+        LinkedList.from_array([1, 2, 3])
+
+
+def test_from_array_multidimensional():
+    view = memoryview(array.array('i', range(6))).cast('B').cast('i', [2, 3])
+    assert list(LinkedList.from_array(view)) == list(range(6))
+
+
+@pytest.mark.parametrize('typecode', ['d', 'i', 'q'])
+def test_to_array(typecode):
+    ll = LinkedList(range(10))
+    out = ll.to_array(typecode)
+    assert out.typecode == typecode
+    assert list(out) == list(range(10))
+    assert list(LinkedList().to_array(typecode)) == []
+
+    with pytest.raises(TypeError):
+        LinkedList(['a']).to_array(typecode)
+
+
+def test_to_numpy():
+    numpy = pytest.importorskip('numpy')
+    ll = LinkedList.from_array(numpy.arange(12, dtype=numpy.int64).reshape(3, 4))
+    assert list(ll) == list(range(12))
+    out = ll.to_numpy(numpy.int64)
+    assert out.dtype == numpy.int64
+    assert out.tolist() == list(range(12))
+
+
+def test_lazy_to_array():
+    ll = LazyLinkedList(iter(range(5)))
+    assert list(ll.to_array('i')) == list(range(5))
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList, UnrolledLinkedList, SkipList])
+def test_pickle(list_type):
+    values = list(range(50000))
+    ll = list_type(values)
+    copy = pickle.loads(pickle.dumps(ll))
+    assert type(copy) is list_type
+    assert list(copy) == values
+
+
+def test_pickle_unrolled_chunk_size():
+    ull = pickle.loads(pickle.dumps(UnrolledLinkedList(range(10), chunk_size=3)))
+    assert ull.chunk_size == 3
+
+
+@pytest.mark.parametrize('values', [[], list(range(-5, 1000)), [0.5, -1e300, float('inf')], [2 ** 70, 1],
+                                    [True, 1], ['banana', 50, None, 1.5]], ids=repr)
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+def test_dump_load(values, list_type):
+    fp = io.BytesIO()
+    list_type(values).dump(fp)
+    fp.seek(0)
+    loaded = list_type.load(fp)
+    assert type(loaded) is list_type
+    assert list(loaded) == values
+    assert [type(v) for v in loaded] == [type(v) for v in values]
+
+
+def test_dump_compact():
+    fp = io.BytesIO()
+    LinkedList(range(1000)).dump(fp)
+    assert len(fp.getvalue()) < 1000 * 8 + 32
+
+
+def test_load_invalid():
+    with pytest.raises(ValueError):
+        LinkedList.load(io.BytesIO(b'not a snapshot at all'))
+    with pytest.raises(ValueError):
+        LinkedList.load(io.BytesIO(b'LL'))
+
+    fp = io.BytesIO()
+    LinkedList(range(10)).dump(fp)
+    with pytest.raises(ValueError):
+        LinkedList.load(io.BytesIO(fp.getvalue()[:-4]))
+
+    # An object snapshot cut off inside the length prefix of its pickle.
+    fp = io.BytesIO()
+    LinkedList(['a', 'b']).dump(fp)
+    for cut in range(_SNAPSHOT_HEADER.size, _SNAPSHOT_HEADER.size + _SNAPSHOT_LENGTH.size):
+        with pytest.raises(ValueError):
+            LinkedList.load(io.BytesIO(fp.getvalue()[:cut]))
+
+
+def test_concurrent_queue_fifo():
+    q = ConcurrentLinkedQueue([1, 2])
+    q.put(3)
+    q.put_many([4, 5, 6])
+    assert q.qsize() == 6
+    assert q.get() == 1
+    assert q.get_nowait() == 2
+    assert q.get_many(2) == [3, 4]
+    assert q.get_many() == [5, 6]
+    assert q.empty()
+
+    with pytest.raises(queue.Empty):
+        q.get_nowait()
+    with pytest.raises(queue.Empty):
+        q.get(timeout=0.01)
+    with pytest.raises(queue.Empty):
+        q.get_many(block=False)
+    with pytest.raises(TypeError):
+        ConcurrentLinkedQueue(None)
+
+
+def test_concurrent_queue_blocking_get():
+    q = ConcurrentLinkedQueue()
+    result = []
+    consumer = threading.Thread(target=lambda: result.append(q.get(timeout=5)))
+    consumer.start()
+    q.put('woken')
+    consumer.join()
+    assert result == ['woken']
+
+
+def test_concurrent_queue_producers_consumers():
+    q = ConcurrentLinkedQueue()
+    producers, consumers, per_producer = 4, 4, 2000
+    received = [[] for _ in range(consumers)]
+
+    def produce(offset):
+        for start in range(0, per_producer, 100):
+            if start % 200:
+                q.put_many(range(offset + start, offset + start + 100))
+            else:
+                for value in range(offset + start, offset + start + 100):
+                    q.put(value)
+
+    def consume(out):
+        while True:
+            batch = q.get_many(50, timeout=5)
+            out.extend(value for value in batch if value is not None)
+            sentinels = batch.count(None)
+            if sentinels:
+                # Hand back any sentinels meant for the other consumers.
+                q.put_many([None] * (sentinels - 1))
+                return
+
+    threads = [threading.Thread(target=produce, args=(i * per_producer,)) for i in range(producers)]
+    threads += [threading.Thread(target=consume, args=(out,)) for out in received]
+    for thread in threads:
+        thread.start()
+    for thread in threads[:producers]:
+        thread.join()
+    q.put_many([None] * consumers)
+    for thread in threads[producers:]:
+        thread.join(timeout=10)
+        assert not thread.is_alive()
+
+    values = sorted(v for out in received for v in out)
+    assert values == list(range(producers * per_producer))
+    for out in received:
+        # Each producer's values reach any one consumer in the order they were produced.
+        for producer in range(producers):
+            mine = [v for v in out if v // per_producer == producer]
+            assert mine == sorted(mine)
+
+
+def test_async_queue_nowait():
+    q = AsyncLinkedQueue(maxsize=2)
+    q.put_nowait(1)
+    q.put_nowait(2)
+    assert q.full()
+    with pytest.raises(asyncio.QueueFull):
+        q.put_nowait(3)
+    assert q.get_nowait() == 1
+    assert q.get_nowait() == 2
+    with pytest.raises(asyncio.QueueEmpty):
+        q.get_nowait()
+
+    q.close()
+    with pytest.raises(QueueClosed):
+        q.put_nowait(4)
+    with pytest.raises(QueueClosed):
+        q.get_nowait()
+
+
+def test_async_queue_producer_consumer():
+    async def main():
+        q = AsyncLinkedQueue(maxsize=10)
+        received = []
+
+        async def produce():
+            for i in range(100):
+                await q.put(i)
+            q.close()
+
+        async def consume():
+            async for value in q:
+                received.append(value)
+
+        await asyncio.gather(consume(), produce())
+        return received
+
+    assert asyncio.run(main()) == list(range(100))
+
+
+def test_async_queue_drain():
+    async def main():
+        q = AsyncLinkedQueue()
+        for i in range(10):
+            q.put_nowait(i)
+        first_node = q._head
+
+        batch = await q.drain(4)
+        assert isinstance(batch, LinkedList)
+        assert list(batch) == [0, 1, 2, 3]
+        assert batch.head is first_node
+        assert batch.tail.next_node is None
+        assert len(q) == 6
+
+        assert list(await q.drain()) == [4, 5, 6, 7, 8, 9]
+        assert q.empty()
+
+        waiting = asyncio.ensure_future(q.drain())
+        await asyncio.sleep(0)
+        q.put_nowait('late')
+        assert list(await waiting) == ['late']
+
+        with pytest.raises(ValueError):
+            await q.drain(0)
+
+        waiting = asyncio.ensure_future(q.get())
+        await asyncio.sleep(0)
+        q.close()
+        with pytest.raises(QueueClosed):
+            await waiting
+        with pytest.raises(QueueClosed):
+            await q.put('too late')
+
+    asyncio.run(main())
+
+
+def test_async_queue_cancelled_getter():
+    async def main():
+        q = AsyncLinkedQueue()
+        cancelled = asyncio.ensure_future(q.get())
+        other = asyncio.ensure_future(q.get())
+        await asyncio.sleep(0)
+        q.put_nowait('value')
+        cancelled.cancel()
+        assert await other == 'value'
+
+    asyncio.run(main())
+
+
+def test_persistent_linked_list(constructor_arg):
+    pl = PersistentLinkedList(constructor_arg)
+    assert list(pl) == list(constructor_arg)
+    assert len(pl) == len(constructor_arg)
+
+    longer = pl.prepend('new')
+    assert list(longer) == ['new'] + list(constructor_arg)
+    assert list(pl) == list(constructor_arg)
+    assert longer.head.next_node is pl.head
+    assert longer.tail.head is pl.head
+    assert longer.first == 'new'
+
+    dropped = longer.drop(2)
+    assert list(dropped) == list(constructor_arg)[1:]
+    assert len(dropped) == max(0, len(constructor_arg) - 1)
+
+    with pytest.raises(TypeError):
+        PersistentLinkedList(None)
+
+
+def test_persistent_linked_list_concat():
+    left = PersistentLinkedList([1, 2])
+    right = PersistentLinkedList([3, 4])
+    both = left + right
+    assert list(both) == [1, 2, 3, 4]
+    assert both.drop(2).head is right.head
+    assert list(left) == [1, 2]
+    assert list(left.concat(LinkedList([5]))) == [1, 2, 5]
+    assert PersistentLinkedList().concat(right) is right
+
+    assert both[-1] == 4
+    assert 3 in both
+    with pytest.raises(IndexError):
+        both[4]
+
+
+def test_persistent_linked_list_empty():
+    pl = PersistentLinkedList()
+    with pytest.raises(IndexError):
+        pl.first
+    with pytest.raises(IndexError):
+        pl.tail
+    with pytest.raises(ValueError):
+        pl.drop(-1)
+    assert list(pl.drop(3)) == []
+
+
+def test_persistent_linked_list_interop():
+    pl = PersistentLinkedList(LinkedList(range(5)))
+    ll = pl.to_linked_list()
+    assert isinstance(ll, LinkedList)
+    ll.append(5)
+    assert list(pl) == list(range(5))
+    assert isinstance(pl.to_linked_list(DoublyLinkedList), DoublyLinkedList)
+    assert list(pickle.loads(pickle.dumps(pl))) == list(range(5))
+
+    with pytest.raises(AttributeError):
+        pl.head.next_node = None
+
+
+def test_lru_cache():
+    cache = LRUCache(3)
+    for key in 'abc':
+        cache.put(key, key.upper())
+    assert cache.get('a') == 'A'
+    cache.put('d', 'D')
+    assert list(cache) == ['d', 'a', 'c']
+    assert 'b' not in cache
+    assert cache.get('b') is None
+    assert (cache.hits, cache.misses, cache.evictions) == (1, 1, 1)
+
+    # Peeking doesn't refresh an entry, so 'c' is still the next to go.
+    assert cache.peek('c') == 'C'
+    cache.put('a', 'AA')
+    cache.put('e', 'E')
+    assert list(cache) == ['e', 'a', 'd']
+    assert cache.pop('a') == 'AA'
+    assert cache.pop('a', 'missing') == 'missing'
+    with pytest.raises(KeyError):
+        cache.pop('a')
+    assert len(cache) == 2
+
+    cache.clear()
+    assert len(cache) == 0 and list(cache) == []
+
+    with pytest.raises(ValueError):
+        LRUCache(-1)
+    empty = LRUCache(0)
+    empty.put('a', 1)
+    assert len(empty) == 0
+
+
+def test_lfu_cache():
+    cache = LFUCache(3)
+    for key in 'abc':
+        cache.put(key, key.upper())
+    cache.get('a')
+    cache.get('a')
+    cache.get('b')
+    assert (cache.frequency('a'), cache.frequency('b'), cache.frequency('c')) == (3, 2, 1)
+    cache.put('d', 'D')
+    assert 'c' not in cache
+    assert list(cache) == ['a', 'b', 'd']
+
+    # Ties are broken by evicting the least recently used entry.
+    cache.get('d')
+    cache.put('e', 'E')
+    assert 'b' not in cache
+    assert cache.evictions == 2
+    assert cache.pop('a') == 'A'
+    assert cache.frequency('a') == 0
+    assert list(cache) == ['d', 'e']
+    cache.put('f', 'F')
+    cache.put('g', 'G')
+    assert list(cache) == ['d', 'g', 'f']
+
+
+@pytest.mark.parametrize('cache_type', [LRUCache, LFUCache])
+def test_cache_matches_reference(cache_type):
+    cache = cache_type(8)
+    reference = {}
+    for _ in range(2000):
+        key = random.randrange(20)
+        operation = random.random()
+        if operation < 0.5:
+            cache.put(key, -key)
+            reference[key] = -key
+        elif operation < 0.9:
+            value = cache.get(key)
+            assert value is None or value == reference[key]
+        else:
+            cache.pop(key, None)
+        assert len(cache) <= 8
+        assert len(list(cache)) == len(cache)
+        assert all(key in cache for key in cache)
+
+
+@pytest.mark.parametrize('cache_type', [LRUCache, LFUCache])
+def test_cache_memoize(cache_type):
+    calls = []
+    cache = cache_type(4)
+
+    @cache.memoize
+    def add(a, b=0):
+        calls.append((a, b))
+        return a + b
+
+    assert add(1, b=2) == 3
+    assert add(1, b=2) == 3
+    assert add(1, 2) == 3
+    assert calls == [(1, 2), (1, 2)]
+    assert add.cache is cache
+    assert add.__name__ == 'add'
+    assert (cache.hits, cache.misses) == (1, 2)
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList, LazyLinkedList])
+def test_splice(list_type):
+    ll = list_type([1, 2])
+    other = list_type([3, 4, 5])
+    other_head = other.head
+    ll.splice(other)
+    assert list(ll) == [1, 2, 3, 4, 5]
+    assert len(ll) == 5
+    assert ll._get(2) is other_head
+    assert list(other) == [] and len(other) == 0 and other.tail is None
+    ll.splice(list_type())
+    assert len(ll) == 5
+    other.splice(ll)
+    assert list(other) == [1, 2, 3, 4, 5] and other.tail.value == 5
+    if list_type is DoublyLinkedList:
+        _check_back_links(other)
+
+    with pytest.raises(ValueError):
+        other.splice(other)
+    with pytest.raises(TypeError):
+        other.splice([6])
+
+
+def test_splice_node_types():
+    with pytest.raises(TypeError):
+        LinkedList([1]).splice(DoublyLinkedList([2]))
+    ll = LinkedList([1])
+    ll.splice(LazyLinkedList(iter([2, 3])))
+    assert list(ll) == [1, 2, 3]
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList, LazyLinkedList])
+@pytest.mark.parametrize('index', [0, 1, 3, 5, -2, -5])
+def test_split_at(list_type, index):
+    values = [0, 1, 2, 3, 4]
+    ll = list_type(values)
+    rest = ll.split_at(index)
+    assert type(rest) is list_type
+    assert list(ll) == values[:index]
+    assert list(rest) == values[index:]
+    assert len(ll) + len(rest) == 5
+    assert ll.tail is (ll._get(len(ll) - 1) if len(ll) else None)
+    if list_type is DoublyLinkedList:
+        _check_back_links(ll)
+        _check_back_links(rest)
+
+
+def test_split_at_fail():
+    ll = LinkedList([1, 2])
+    for index in [3, -3, 'a']:
+        with pytest.raises(IndexError):
+            ll.split_at(index)
+    pooled = LinkedList([1, 2, 3], pool_size=4)
+    assert pooled.split_at(1).pool is pooled.pool
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList, LazyLinkedList])
+@pytest.mark.parametrize('steps', [0, 1, 2, 5, 7, -1, -3])
+def test_rotate(list_type, steps):
+    values = [0, 1, 2, 3, 4]
+    ll = list_type(values)
+    ll.rotate(steps)
+    expected = values[-(steps % 5):] + values[:-(steps % 5)] if steps % 5 else values
+    assert list(ll) == expected
+    assert ll.tail.value == expected[-1]
+    if list_type is DoublyLinkedList:
+        _check_back_links(ll)
+    empty = list_type()
+    empty.rotate(3)
+    assert list(empty) == []
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList, LazyLinkedList])
+def test_in_place_operators(list_type):
+    ll = list_type([1, 2])
+    original = ll
+    head = ll.head
+    ll += [3]
+    assert ll is original and ll.head is head
+    assert list(ll) == [1, 2, 3]
+    ll += ll
+    assert list(ll) == [1, 2, 3, 1, 2, 3]
+    ll *= 2
+    assert ll is original and ll.head is head
+    assert list(ll) == [1, 2, 3] * 4
+    assert len(ll) == 12
+    if list_type is DoublyLinkedList:
+        _check_back_links(ll)
+    ll *= 1
+    assert len(ll) == 12
+    ll *= 0
+    assert ll is original and list(ll) == [] and len(ll) == 0
+
+    with pytest.raises(ValueError):
+        ll *= 'a'
+    with pytest.raises(ValueError):
+        ll += 5
+
+
+def test_in_place_multiply_releases_to_pool():
+    ll = LinkedList([1, 2, 3], pool_size=8)
+    ll *= 0
+    assert len(ll.pool) == 3
+
+
+def _check_index(ll):
+    counts = {}
+    firsts = {}
+    node = ll.head
+    while node:
+        counts[node.value] = counts.get(node.value, 0) + 1
+        firsts.setdefault(node.value, node)
+        node = node.next_node
+    assert {value: entry[0] for value, entry in ll._index.items()} == counts
+    for value, (_, first) in ll._index.items():
+        assert first is None or first is firsts[value]
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+def test_indexed_queries(list_type):
+    ll = list_type([3, 1, 2, 1, 3, 1], indexed=True)
+    assert ll.indexed and not list_type([1]).indexed
+    assert 1 in ll and 4 not in ll
+    assert (ll.count(1), ll.count(3), ll.count(4)) == (3, 2, 0)
+    assert (ll.index(3), ll.index(1), ll.index(2)) == (0, 1, 2)
+    with pytest.raises(ValueError):
+        ll.index(4)
+
+    # Unhashable lookups fall back to scanning, and can't be stored.
+    assert [1] not in ll
+    assert ll.count([1]) == 0
+    with pytest.raises(TypeError):
+        ll.append([1])
+    with pytest.raises(TypeError):
+        ll.extend([4, [1]])
+    with pytest.raises(TypeError):
+        ll[0] = [1]
+    assert list(ll) == [3, 1, 2, 1, 3, 1]
+    _check_index(ll)
+
+    restored = pickle.loads(pickle.dumps(ll))
+    assert restored.indexed and restored.count(1) == 3
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+def test_indexed_nan(list_type):
+    nan = float('nan')
+    ll = list_type([nan, 2, 1, nan], indexed=True)
+    ll.reverse()
+    # Like list.index, the same NaN object is found by identity even though it isn't equal to itself.
+    assert ll.index(nan) == 0 and ll.count(nan) == 2 and nan in ll
+    ll.pop(0)
+    ll.reverse()
+    assert ll.index(nan) == 0
+    assert ll.index(1) == 2
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+def test_indexed_stays_in_sync(list_type):
+    random.seed(7)
+    ll = list_type(indexed=True)
+    reference = []
+    for _ in range(600):
+        operation = random.randrange(12)
+        value = random.randrange(6)
+        if operation < 3 or not reference:
+            index = random.randint(0, len(reference))
+            ll.insert(index, value)
+            reference.insert(index, value)
+        elif operation < 5:
+            index = random.randrange(len(reference))
+            assert ll.pop(index) == reference.pop(index)
+        elif operation == 5:
+            ll.reverse()
+            reference.reverse()
+        elif operation == 6:
+            ll.sorted(random.choice(['insertion_sort', 'merge_sort', 'natural']), reverse=random.random() < 0.5)
+            reference = list(ll)
+        elif operation == 7:
+            index = random.randrange(len(reference))
+            ll[index] = value
+            reference[index] = value
+        elif operation == 8:
+            ll.rotate(value)
+            reference = list(ll)
+        elif operation == 9:
+            ll.extend([value, value + 1])
+            reference.extend([value, value + 1])
+        elif operation == 10:
+            del ll[:random.randrange(3)]
+            reference = list(ll)
+        else:
+            rest = ll.split_at(len(reference) // 2)
+            _check_index(rest)
+            ll.splice(rest)
+        assert list(ll) == reference
+        assert value in ll if value in reference else value not in ll
+        assert ll.count(value) == reference.count(value)
+        if value in reference:
+            assert ll.index(value) == reference.index(value)
+        _check_index(ll)
+
+    ll *= 0
+    assert ll._index == {} and 0 not in ll
+
+
+_set_operations = [('union', '__or__'), ('intersection', '__and__'), ('difference', '__sub__'),
+                   ('symmetric_difference', '__xor__')]
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList, LazyLinkedList])
+@pytest.mark.parametrize('operation,set_operator', _set_operations)
+def test_sorted_set_operations(list_type, operation, set_operator):
+    random.seed(operation)
+    for _ in range(20):
+        left = sorted(random.choices(range(15), k=random.randrange(12)))
+        right = sorted(random.choices(range(15), k=random.randrange(12)))
+        expected = sorted(getattr(set(left), set_operator)(set(right)))
+
+        ll = list_type(left)
+        result = getattr(ll, operation)(right)
+        assert type(result) is list_type
+        assert list(result) == expected
+        assert list(ll) == left
+
+        getattr(ll, operation + '_update')(LinkedList(right))
+        assert list(ll) == expected
+        assert len(ll) == len(expected)
+        if expected:
+            assert ll.tail.value == expected[-1]
+        if list_type is DoublyLinkedList:
+            _check_back_links(ll)
+
+
+def test_sorted_set_operations_in_place_reuse_nodes():
+    ll = LinkedList([1, 2, 2, 3, 5], pool_size=8)
+    kept = ll._get(1)
+    ll.intersection_update([2, 3, 4])
+    assert list(ll) == [2, 3]
+    assert ll.head is kept
+    assert len(ll.pool) == 3
+
+    ll.union_update(iter([0, 3, 9]))
+    assert list(ll) == [0, 2, 3, 9]
+    assert ll._get(1) is kept
+
+    ll.union_update(ll)
+    assert list(ll) == [0, 2, 3, 9]
+    ll.difference_update(ll)
+    assert list(ll) == []
+
+
+def test_sorted_set_operations_validation():
+    ll = LinkedList([1, 3, 2])
+    with pytest.raises(ValueError):
+        ll.union([1, 2])
+    with pytest.raises(ValueError):
+        LinkedList([1, 2]).intersection([2, 1])
+    with pytest.raises(ValueError):
+        LinkedList([1, 2]).difference_update(iter([3, 1]))
+
+    # Skipping the check is the caller's promise, and isn't verified.
+    assert list(LinkedList([1, 2]).union([3, 4], assume_sorted=True)) == [1, 2, 3, 4]
+
+    indexed = LinkedList([1, 1, 2, 4], indexed=True)
+    indexed.symmetric_difference_update([2, 3])
+    assert list(indexed) == [1, 3, 4]
+    _check_index(indexed)
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList, LazyLinkedList])
+def test_dedupe(list_type):
+    ll = list_type([1, 1, 2, 3, 3, 3, 1, 4, 4])
+    ll.dedupe()
+    assert list(ll) == [1, 2, 3, 1, 4]
+    assert len(ll) == 5 and ll.tail.value == 4
+    if list_type is DoublyLinkedList:
+        _check_back_links(ll)
+    empty = list_type()
+    empty.dedupe()
+    assert list(empty) == []
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+def test_finger_positional_access(list_type):
+    ll = list_type(range(10))
+    assert [ll[i] for i in range(10)] == list(range(10))
+    node = ll._get(4)
+    assert (ll._finger_index, ll._finger_node) == (4, node)
+    # Reading further along walks on from the finger.
+    assert ll._get(6) is node.next_node.next_node
+    ll[7] = 'seven'
+    assert ll._finger_index == 7 and ll[7] == 'seven'
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+def test_finger_survives_mutations(list_type):
+    random.seed(11)
+    ll = list_type(range(30))
+    reference = list(range(30))
+    for step in range(800):
+        operation = random.randrange(10)
+        if operation < 3 and reference:
+            index = random.randrange(len(reference))
+            assert ll[index] == reference[index]
+        elif operation < 5:
+            index = random.randint(0, len(reference))
+            ll.insert(index, step)
+            reference.insert(index, step)
+        elif operation < 7 and reference:
+            index = random.randrange(len(reference))
+            assert ll.pop(index) == reference.pop(index)
+        elif operation == 7:
+            ll.reverse()
+            reference.reverse()
+        elif operation == 8 and reference:
+            ll.rotate(3)
+            split = len(reference) - 3 % len(reference)
+            reference = reference[split:] + reference[:split]
+        elif operation == 9:
+            del ll[::3]
+            del reference[::3]
+        if reference:
+            sample = random.randrange(len(reference))
+            assert ll[sample] == reference[sample]
+        assert list(ll) == reference
+
+
+def test_typed_linked_list_basics():
+    tl = TypedLinkedList([1, 2, 3], 'q')
+    assert tl.typecode == 'q'
+    assert list(tl) == [1, 2, 3] and len(tl) == 3
+    assert tl[0] == 1 and tl[-1] == 3
+    tl.insert(0, 0)
+    tl.insert(2, 9)
+    tl.append(4)
+    assert list(tl) == [0, 1, 9, 2, 3, 4]
+    assert tl.pop() == 0
+    assert tl.pop(1) == 9
+    assert tl.pop(-1) == 4
+    assert list(tl) == [1, 2, 3]
+    assert 2 in tl and 7 not in tl
+    assert tl.index(3) == 2 and tl.count(2) == 1
+
+    with pytest.raises(IndexError):
+        tl.insert(5, 1)
+    with pytest.raises(IndexError):
+        tl[3]
+    with pytest.raises(ValueError):
+        tl.index(7)
+    with pytest.raises(TypeError):
+        tl.append('a')
+    with pytest.raises(TypeError):
+        tl.extend([4, 'a'])
+    assert list(tl) == [1, 2, 3]
+    with pytest.raises(TypeError):
+        TypedLinkedList(None)
+    with pytest.raises(ValueError):
+        TypedLinkedList([], 'z')
+
+
+def test_typed_linked_list_reuses_free_slots():
+    tl = TypedLinkedList(range(6), 'i')
+    assert tl.capacity == 6
+    tl.pop(0)
+    tl.pop(2)
+    tl.insert(1, 10)
+    tl.insert(0, 11)
+    assert tl.capacity == 6
+    assert list(tl) == [11, 1, 10, 2, 4, 5]
+    tl.append(12)
+    assert tl.capacity == 7
+
+    tl.compact()
+    assert tl.capacity == len(tl) == 7
+    assert list(tl._values) == [11, 1, 10, 2, 4, 5, 12]
+    assert tl.nbytes == 7 * (tl._values.itemsize + tl._next.itemsize)
+
+    while tl:
+        tl.pop()
+    assert tl.capacity == 0 and list(tl) == []
+
+
+def test_typed_linked_list_matches_reference():
+    random.seed(21)
+    tl = TypedLinkedList(typecode='l')
+    reference = []
+    for step in range(1500):
+        operation = random.randrange(10)
+        if operation < 4 or not reference:
+            index = random.randint(0, len(reference))
+            tl.insert(index, step)
+            reference.insert(index, step)
+        elif operation < 7:
+            index = random.randrange(len(reference))
+            assert tl.pop(index) == reference.pop(index)
+        elif operation == 7:
+            tl.reverse()
+            reference.reverse()
+        elif operation == 8:
+            tl.extend([step, step + 1])
+            reference.extend([step, step + 1])
+        else:
+            tl.compact()
+        assert len(tl) == len(reference)
+        if reference:
+            index = random.randrange(len(reference))
+            assert tl[index] == reference[index]
+    assert list(tl) == reference
+
+
+def test_typed_linked_list_sorting_and_slices():
+    tl = TypedLinkedList([3.5, 1.0, 2.0, 1.0])
+    tl.insert(1, 0.5)
+    tl.sorted(reverse=True)
+    assert list(tl) == [3.5, 2.0, 1.0, 1.0, 0.5]
+    tl.sorted('insertion_sort', key=lambda v: abs(v - 2))
+    assert list(tl) == [2.0, 1.0, 1.0, 3.5, 0.5]
+    with pytest.raises(NotImplementedError):
+        tl.sorted('quick_sort')
+    auto = TypedLinkedList([3.5, 0.5, 2.0, 1.0])
+    auto.sorted('auto')
+    assert list(auto) == [0.5, 1.0, 2.0, 3.5]
+    auto.sorted('auto', key=lambda v: abs(v - 2))
+    assert list(auto) == [2.0, 1.0, 0.5, 3.5]
+
+    assert list(tl[1:3]) == [1.0, 1.0]
+    tl[0:2] = [7.0]
+    assert list(tl) == [7.0, 1.0, 3.5, 0.5]
+    del tl[::2]
+    assert list(tl) == [1.0, 0.5]
+    tl += [2.0]
+    assert list(tl + [3.0]) == [1.0, 0.5, 2.0, 3.0]
+    assert tl.to_array() == array.array('d', [1.0, 0.5, 2.0])
+
+    restored = pickle.loads(pickle.dumps(tl))
+    assert list(restored) == [1.0, 0.5, 2.0] and restored.typecode == 'd'
+    assert repr(restored) == 'TypedLinkedList(1.0, 0.5, 2.0, )'
+
+
+@pytest.mark.parametrize('size', [0, 1, 3, 50, 5000])
+@pytest.mark.parametrize('reverse', [False, True])
+def test_auto_sort(size, reverse):
+    random.seed(size)
+    # Few distinct ints at the largest size, which takes the counting path.
+    values = [random.randrange(20) for _ in range(size)]
+    ll = LinkedList(values)
+    nodes = [ll._get(i) for i in range(size)]
+    ll.sorted('auto', reverse=reverse)
+    assert list(ll) == sorted(values, reverse=reverse)
+    assert len(ll) == size
+    if size > 3:
+        # Large lists keep their nodes in place and rewrite the values.
+        assert [ll._get(i) for i in range(size)] == nodes
+
+
+@pytest.mark.parametrize('size', [3, 50, 5000])
+def test_auto_sort_is_stable(size):
+    random.seed(size)
+    # Equal but distinguishable values must keep their order, so these never take the counting path.
+    values = [random.choice([1, 1.0, True, 2, 2.0]) for _ in range(size)]
+    ll = DoublyLinkedList(values)
+    ll.sorted('auto')
+    assert [(v, type(v)) for v in ll] == [(v, type(v)) for v in sorted(values)]
+    _check_back_links(ll)
+
+    keyed = [_Keyed(random.randrange(5), i) for i in range(size)]
+    ll = LinkedList(keyed)
+    ll.sorted('auto', key=lambda k: -k.key, reverse=True)
+    assert list(ll) == sorted(keyed, key=lambda k: -k.key, reverse=True)
+
+
+def test_auto_sort_indexed():
+    ll = LinkedList([5, 3, 5, 1] * 1200, indexed=True)
+    ll.sorted('auto')
+    assert ll.index(5) == 2400 and ll.count(3) == 1200
+    _check_index(ll)
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+def test_merge_sorted(list_type):
+    random.seed(23)
+    runs = [sorted(random.choices(range(50), k=random.randrange(30))) for _ in range(40)]
+    lists = [list_type(run) for run in runs]
+    nodes = {id(lists[0]._get(i)) for i in range(len(runs[0]))}
+    merged = merge_sorted(*lists)
+    assert type(merged) is list_type
+    assert list(merged) == sorted(chain.from_iterable(runs))
+    assert len(merged) == sum(map(len, runs))
+    assert merged.tail.value == max(chain.from_iterable(runs))
+    # The nodes are moved rather than copied, leaving the inputs empty.
+    assert nodes <= {id(merged._get(i)) for i in range(len(merged))}
+    assert all(len(ll) == 0 and ll.head is None for ll in lists)
+    if list_type is DoublyLinkedList:
+        _check_back_links(merged)
+
+
+def test_merge_sorted_is_stable():
+    runs = [[_Keyed(k, (run, i)) for i, k in enumerate(sorted(random.choices(range(4), k=20)))] for run in range(5)]
+    expected = sorted(chain.from_iterable(runs), key=lambda k: k.key)
+    assert list(merge_sorted(*map(LinkedList, runs))) == expected
+
+    descending = [sorted(run, key=lambda k: -k.key) for run in runs]
+    merged = merge_sorted(*map(LinkedList, descending), key=lambda k: -k.key)
+    assert list(merged) == sorted(chain.from_iterable(descending), key=lambda k: -k.key)
+
+
+@pytest.mark.parametrize('list_type', [LinkedList, DoublyLinkedList])
+@pytest.mark.parametrize('fail_at', [0, 3, 8])
+def test_merge_sorted_failure_restores_inputs(list_type, fail_at):
+    runs = [[1, 4, 7], [2, 5, 8], [3, 6, 9]]
+    lists = [list_type(run, indexed=True) for run in runs]
+    calls = []
+
+    def key(value):
+        if len(calls) == fail_at:
+            raise RuntimeError("key failed")
+        calls.append(value)
+        return value
+
+    with pytest.raises(RuntimeError):
+        merge_sorted(*lists, key=key)
+    assert [list(ll) for ll in lists] == runs
+    for ll, run in zip(lists, runs):
+        assert len(ll) == 3 and ll.tail.value == run[-1]
+        assert ll.index(run[1]) == 1
+        if list_type is DoublyLinkedList:
+            _check_back_links(ll)
+
+    lists = [list_type([1, 'a']), list_type([2, 3])]
+    with pytest.raises(TypeError):
+        merge_sorted(*lists)
+    assert [list(ll) for ll in lists] == [[1, 'a'], [2, 3]]
+
+
+def test_merge_sorted_lazy_and_edge_cases():
+    left, right = LinkedList([1, 4]), LinkedList([2, 3])
+    merged = merge_sorted(left, right, [0, 5], lazy=True)
+    assert list(merged) == [0, 1, 2, 3, 4, 5]
+    assert list(left) == [1, 4]
+
+    assert list(merge_sorted()) == []
+    assert list(merge_sorted(LinkedList(), LinkedList([1]), LinkedList())) == [1]
+    assert list(merge_sorted(LazyLinkedList(iter([1, 3])), LinkedList([2]))) == [1, 2, 3]
+    with pytest.raises(TypeError):
+        merge_sorted(LinkedList([1]), DoublyLinkedList([2]))
+    with pytest.raises(TypeError):
+        merge_sorted(LinkedList([1]), [2])
+    repeated = LinkedList([1, 2])
+    with pytest.raises(ValueError):
+        merge_sorted(repeated, LinkedList([0]), repeated)
+    assert list(repeated) == [1, 2] and len(repeated) == 2
+    assert list(merge_sorted(*[LinkedList([i]) for i in range(5000)])) == list(range(5000))
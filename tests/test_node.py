@@ -44,3 +44,7 @@ def test_comparison(comparison_data, operation):
 
 def test_bool(base_data):
     assert bool(BaseNode(base_data))
+
+
+def test_slots():
+    assert not hasattr(BaseNode(5), '__dict__')
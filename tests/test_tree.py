@@ -2,7 +2,8 @@ import random
 
 import pytest
 
-from data_structures.tree import BSTNode, BST, EmptyNode, AVLTree
+from data_structures.tree import BSTNode, BST, EmptyNode, AVLTree, RedBlackTree
+from data_structures.tree.red_black import Color
 
 @pytest.fixture(params=[0, 10, 50, 100])
 def AVL(request):
@@ -26,6 +27,12 @@ def test_BSTNode():
     assert b.right.value == 2
 
 
+def test_BSTNode_slots():
+    b = BSTNode(3)
+    assert not hasattr(b, '__dict__')
+    assert not hasattr(b.left, '__dict__')
+
+
 def test_BST_construction():
     with pytest.raises(TypeError):
         BST(1)
@@ -92,3 +99,164 @@ def is_AVL(node):
 
 def test_AVLTree(AVL):
     assert is_AVL(AVL.root)
+
+
+def test_BST_sorted_input_is_not_recursive():
+    # Deeper than the default recursion limit of 1000, while keeping the O(n^2) degenerate inserts quick.
+    size = 1500
+    b = BST()
+    for v in range(size):
+        b.insert(v)
+    assert b.get_height() == size
+    assert size - 1 in b
+    assert size not in b
+    assert b.minimum() == 0
+    assert b.maximum() == size - 1
+    assert b.to_list() == list(range(size))
+
+    b.remove(size - 1)
+    b.remove(0)
+    assert b.to_list() == list(range(1, size - 1))
+    assert b.get_height() == size - 2
+
+
+def test_BST_remove():
+    values = [random.randint(0, 50) for i in range(50)]
+    b = BST(values)
+    for v in values[:25]:
+        b.remove(v)
+    assert b.to_list() == sorted(values[25:])
+    assert is_BST(b.root)
+
+    with pytest.raises(LookupError):
+        b.remove(51)
+
+    for v in values[25:]:
+        b.remove(v)
+    assert not b.root
+    assert b.to_list() == []
+
+
+def test_BST_orders():
+    b = BST([4, 2, 6, 1, 3, 5, 7])
+    assert b.to_list('pre_order') == [4, 2, 1, 3, 6, 5, 7]
+    assert b.to_list('in_order') == [1, 2, 3, 4, 5, 6, 7]
+    assert b.to_list('post_order') == [1, 3, 2, 5, 7, 6, 4]
+    assert b.to_list('level_order') == [4, 2, 6, 1, 3, 5, 7]
+
+    with pytest.raises(ValueError):
+        BST().minimum()
+
+
+def has_valid_heights(node):
+    if not node:
+        return True
+    return (node.height == max(node.left.height, node.right.height) + 1
+            and has_valid_heights(node.left) and has_valid_heights(node.right))
+
+
+def test_AVLTree_heights():
+    values = random.sample(range(1000), 300)
+    avl = AVLTree(values)
+    assert is_AVL(avl.root)
+    assert has_valid_heights(avl.root)
+
+    for v in values[:200]:
+        avl.remove(v)
+        assert has_valid_heights(avl.root)
+    assert is_AVL(avl.root)
+    assert avl.to_list() == sorted(values[200:])
+
+
+
+def black_height(node):
+    """Returns the number of black nodes on every path down from the node, or None if they differ or a red node
+    has a red child."""
+    if not node:
+        return 1
+    if node.color is Color.Red and Color.Red in (node.left.color, node.right.color):
+        return None
+    left, right = black_height(node.left), black_height(node.right)
+    if left is None or left != right:
+        return None
+    return left + (node.color is Color.Black)
+
+
+def is_red_black(tree):
+    return tree.root.color is Color.Black and black_height(tree.root) is not None and has_valid_heights(tree.root)
+
+
+@pytest.mark.parametrize('size', [0, 1, 10, 100, 500])
+def test_RedBlackTree(size):
+    values = [random.randint(0, size) for i in range(size)]
+    rb = RedBlackTree(values)
+    assert is_red_black(rb)
+    assert rb.to_list() == sorted(values)
+
+    remaining = list(values)
+    random.shuffle(values)
+    for v in values[:size * 2 // 3]:
+        rb.remove(v)
+        remaining.remove(v)
+        assert is_red_black(rb)
+    assert rb.to_list() == sorted(remaining)
+
+
+def test_RedBlackTree_sorted_input():
+    rb = RedBlackTree(range(5000))
+    assert is_red_black(rb)
+    assert rb.get_height() <= 2 * 13
+    assert 2500 in rb
+
+
+@pytest.mark.parametrize('tree_type', [BST, AVLTree, RedBlackTree])
+@pytest.mark.parametrize('size', [0, 1, 2, 3, 7, 8, 100, 1000])
+def test_from_sorted(tree_type, size):
+    values = sorted(random.randint(0, size) for i in range(size))
+    tree = tree_type.from_sorted(iter(values))
+    assert type(tree) is tree_type
+    assert tree.to_list() == values
+    assert tree.get_height() == size.bit_length()
+    assert has_valid_heights(tree.root)
+    if tree_type is RedBlackTree:
+        assert is_red_black(tree)
+    elif size:
+        # Repeated values can land either side of their equals, so only check the balance.
+        assert max(abs(n.left.height - n.right.height) for n in iter_nodes(tree.root)) <= 1
+
+    # The tree is fully usable afterwards.
+    for v in range(size + 1, size + 20):
+        tree.insert(v)
+    for v in values[::2]:
+        tree.remove(v)
+    assert tree.to_list() == values[1::2] + list(range(size + 1, size + 20))
+    if tree_type is RedBlackTree:
+        assert is_red_black(tree)
+
+
+def iter_nodes(node):
+    to_check = [node]
+    while to_check:
+        node = to_check.pop()
+        if node:
+            yield node
+            to_check.extend([node.left, node.right])
+
+
+def test_from_sorted_unsorted():
+    with pytest.raises(ValueError):
+        BST.from_sorted([1, 3, 2])
+
+
+@pytest.mark.parametrize('tree_type', [BST, AVLTree, RedBlackTree])
+def test_sorted_construction(tree_type):
+    tree = tree_type(range(5000))
+    assert tree.get_height() == 13
+    assert tree.to_list() == list(range(5000))
+    assert has_valid_heights(tree.root)
+
+
+def test_unsorted_construction_inserts_in_order():
+    b = BST([2, 1, 3, 4, 5, 6])
+    assert b.root.value == 2
+    assert b.get_height() == 5